@@ -0,0 +1,84 @@
+"""
+Benchmarks the latency of listing completions as random sentences of every text and hybrid terminal of an
+ALOC spec are typed, a keystroke at a time.
+
+Run from the root of the repository:
+
+    $ python -m benchmarks.completions ./src/aloc_spec.json
+"""
+
+import argparse
+import json
+import time
+from typing import List
+
+from src.parser.base_parser import BaseParser
+from src.parser.incremental_parser import IncrementalParser
+from src.parser.parser_registry import ParserRegistry
+from src.parser.sentence_generator import SentenceGenerator
+
+COLUMNS = ["keystrokes", "mean (ms)", "max (ms)"]
+
+
+def _time_keystrokes(parser: BaseParser, sentence: str) -> List[float]:
+    # Every entry of the update form keeps its own incremental parser while its text is typed.
+    incremental_parser = IncrementalParser(parser)
+    timings = []
+    for length in range(1, len(sentence) + 1):
+        start_time = time.perf_counter()
+        incremental_parser.complete(sentence[:length])
+        timings.append(time.perf_counter() - start_time)
+    return timings
+
+
+def benchmark(
+    spec_path: str, count: int, seed: int, max_depth: int, expansion_probability: float
+) -> None:
+    with open(spec_path) as json_file:
+        data = json.load(json_file)
+    with open(data["contract"]["grammar_path"]) as grammar_file:
+        grammar = grammar_file.read()
+    terminals = data["terminal_types"].get("text", []) + data["terminal_types"].get(
+        "hybrid", []
+    )
+    generator = SentenceGenerator(grammar, seed, max_depth, expansion_probability)
+    registry = ParserRegistry()
+    print(f"{'parse root':<24}" + "".join(f"{column:>14}" for column in COLUMNS))
+    for parse_root in dict.fromkeys(terminal["parse_root"] for terminal in terminals):
+        parser = BaseParser(parse_root, grammar, registry)
+        parser.get_lark_parser()
+        timings: List[float] = []
+        for sentence in generator.generate_many(parse_root, count):
+            timings += _time_keystrokes(parser, sentence)
+        if not timings:
+            print(f"{parse_root:<24} skipped, no sentences were generated")
+            continue
+        print(
+            f"{parse_root:<24}{len(timings):>14}"
+            + f"{sum(timings) / len(timings) * 1000:>14.3f}"
+            + f"{max(timings) * 1000:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(
+        description=" ".join(__doc__.strip().split("\n")[:2])
+    )
+    argument_parser.add_argument("spec_path")
+    argument_parser.add_argument(
+        "--count",
+        type=int,
+        default=100,
+        help="The number of sentences to type for each parse root.",
+    )
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--max-depth", type=int, default=16)
+    argument_parser.add_argument("--expansion-probability", type=float, default=0.5)
+    arguments = argument_parser.parse_args()
+    benchmark(
+        arguments.spec_path,
+        arguments.count,
+        arguments.seed,
+        arguments.max_depth,
+        arguments.expansion_probability,
+    )
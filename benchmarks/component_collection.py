@@ -0,0 +1,133 @@
+"""
+Benchmarks add/delete cycles on a large component collection, against the plain list that collections used
+to be backed by.
+
+Run from the root of the repository:
+
+    $ python -m benchmarks.component_collection ./test/end_to_end/relative_time_aloc_spec.json
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from src.model.aloc_spec import ALOCSpec
+from src.model.component_collection import ComponentCollection
+from src.model.components.component import Component
+
+COLUMNS = ["add/delete (/s)", "replace (/s)", "contains (/s)"]
+
+
+class _ListComponentCollection:
+    # The collection as it was before it was indexed, rebuilding its list on every delete and replace.
+
+    def __init__(self) -> None:
+        self.__components: List[Component] = []
+
+    def add_component(self, component: Component) -> None:
+        self.__components.append(component)
+
+    def delete_component(self, component_id: int) -> None:
+        self.__components = [
+            component
+            for component in self.__components
+            if component.get_internal_id() != component_id
+        ]
+
+    def replace_component(self, component_to_replace_with: Component, replace_id):
+        self.__components = [
+            (
+                component
+                if component.get_internal_id() != replace_id
+                else component_to_replace_with
+            )
+            for component in self.__components
+        ]
+
+    def contains_component(self, component_id: int) -> bool:
+        return any(
+            component.get_internal_id() == component_id
+            for component in self.__components
+        )
+
+
+def _time_operations(operation: Callable[[int], None], count: int) -> float:
+    start_time = time.perf_counter()
+    for i in range(count):
+        operation(i)
+    return count / max(time.perf_counter() - start_time, 1e-9)
+
+
+def benchmark(spec_path: str, component_count: int, cycles: int, seed: int) -> None:
+    spec = ALOCSpec(spec_path)
+    component_spec = next(
+        component_spec
+        for component_spec in spec.get_component_specs().values()
+        if component_spec.get_component_type() == "simple_component"
+    )
+    component_type = spec.get_component_types()["simple_component"]
+    components = []
+    for internal_id in range(component_count + cycles):
+        component = component_type(component_spec)
+        component.set_internal_id(internal_id)
+        components.append(component)
+    print(f"{'collection':<16}" + "".join(f"{column:>20}" for column in COLUMNS))
+    for name, create_collection in [
+        ("list", _ListComponentCollection),
+        ("indexed", lambda: ComponentCollection("benchmark")),
+    ]:
+        collection = create_collection()
+        for component in components[:component_count]:
+            collection.add_component(component)
+        rng = random.Random(seed)
+        live_ids = list(range(component_count))
+
+        # Every cycle deletes a random component and adds a new one to the end.
+        def add_delete_cycle(i: int) -> None:
+            position = rng.randrange(len(live_ids))
+            collection.delete_component(live_ids[position])
+            live_ids[position] = component_count + i
+            collection.add_component(components[component_count + i])
+
+        def replace(i: int) -> None:
+            position = rng.randrange(len(live_ids))
+            replacement = components[live_ids[position]]
+            collection.replace_component(replacement, live_ids[position])
+
+        def contains(i: int) -> None:
+            collection.contains_component(rng.choice(live_ids))
+
+        throughputs: Dict[str, float] = {
+            "add/delete (/s)": _time_operations(add_delete_cycle, cycles),
+            "replace (/s)": _time_operations(replace, cycles),
+            "contains (/s)": _time_operations(contains, cycles),
+        }
+        print(
+            f"{name:<16}"
+            + "".join(f"{throughputs[column]:>20.0f}" for column in COLUMNS)
+        )
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(
+        description=" ".join(__doc__.strip().split("\n")[:2])
+    )
+    argument_parser.add_argument("spec_path")
+    argument_parser.add_argument(
+        "--components",
+        type=int,
+        default=100000,
+        help="The number of components in the collection.",
+    )
+    argument_parser.add_argument(
+        "--cycles",
+        type=int,
+        default=1000,
+        help="The number of add/delete cycles, replacements and lookups to time.",
+    )
+    argument_parser.add_argument("--seed", type=int, default=0)
+    arguments = argument_parser.parse_args()
+    benchmark(
+        arguments.spec_path, arguments.components, arguments.cycles, arguments.seed
+    )
@@ -0,0 +1,137 @@
+"""
+Benchmarks the Earley and LALR parser engines, and the regular expression fast path, on every text and
+hybrid terminal of an ALOC spec.
+
+Run from the root of the repository:
+
+    $ python -m benchmarks.parser_engines ./src/aloc_spec.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+
+INPUT_LENGTHS = [10, 100, 1000, 10000]
+
+
+def _repeat_to_length(unit: str, length: int, prefix: str = "") -> str:
+    repeats = max(1, (length - len(prefix)) // len(unit) + 1)
+    return (prefix + unit * repeats)[:length]
+
+
+# Builds a valid input of roughly the requested length for the parse roots of the base grammar.
+INPUT_BUILDERS: Dict[str, Callable[[int], str]] = {
+    "subject": lambda length: _repeat_to_length("Buyer ", length).strip() or "B",
+    "object": lambda length: _repeat_to_length("1", length, "GBP "),
+    "numerical_expression": lambda length: _repeat_to_length(" PLUS 1", length, "1")
+    .rsplit(" ", 2)[0]
+    .strip(),
+    "date": lambda length: "on the "
+    + _repeat_to_length("1", max(1, (length - 16) // 2))
+    + " January "
+    + _repeat_to_length("2", max(1, (length - 16) // 2)),
+}
+
+
+def _time_parse(parser: BaseParser, text: str, repeats: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        parser.parse(text)
+    return (time.perf_counter() - start_time) / repeats
+
+
+def _predict(previous_timing: Tuple[int, float] | None, length: int) -> float:
+    # Parsing is at least linear, so scaling the last timing linearly is an optimistic estimate.
+    if previous_timing is None:
+        return 0.0
+    previous_length, timing = previous_timing
+    return timing * length / max(previous_length, 1)
+
+
+def benchmark(spec_path: str, lengths: List[int], repeats: int, budget: float) -> None:
+    with open(spec_path) as json_file:
+        data = json.load(json_file)
+    with open(data["contract"]["grammar_path"]) as grammar_file:
+        grammar = grammar_file.read()
+    terminals = data["terminal_types"].get("text", []) + data["terminal_types"].get(
+        "hybrid", []
+    )
+    registry = ParserRegistry()
+    columns = [engine.value for engine in ParserEngine] + ["regex"]
+    # Every column is wide enough for its header and a space before it.
+    widths = {column: max(14, len(f"{column} (ms)") + 2) for column in columns}
+    print(
+        f"{'terminal':<24}{'length':>8}"
+        + "".join(f"{column + ' (ms)':>{widths[column]}}" for column in columns)
+    )
+    for terminal in terminals:
+        parse_root = terminal["parse_root"]
+        if parse_root not in INPUT_BUILDERS:
+            print(f"{terminal['name']:<24} skipped, no input builder for {parse_root}")
+            continue
+        parsers = {
+            engine.value: BaseParser(
+                parse_root, grammar, registry, engine, regex_fast_path=False
+            )
+            for engine in ParserEngine
+        }
+        for parser in parsers.values():
+            parser.get_lark_parser()
+        regex_parser = BaseParser(parse_root, grammar, registry)
+        if regex_parser.get_regex() is not None:
+            parsers["regex"] = regex_parser
+        lalr_engine = parsers[ParserEngine.LALR.value].get_engine()
+        previous_timings: Dict[str, Tuple[int, float]] = dict()
+        for length in sorted(lengths):
+            text = INPUT_BUILDERS[parse_root](length)
+            timings = []
+            for column in columns:
+                if column not in parsers:
+                    timings.append(f"{'n/a':>{widths[column]}}")
+                    continue
+                if _predict(previous_timings.get(column), len(text)) > budget:
+                    timings.append(f"{'skipped':>{widths[column]}}")
+                    continue
+                try:
+                    timing = _time_parse(parsers[column], text, repeats)
+                except RecursionError:
+                    timings.append(f"{'recursion':>{widths[column]}}")
+                    previous_timings[column] = (1, float("inf"))
+                    continue
+                previous_timings[column] = (len(text), timing)
+                timings.append(f"{timing * 1000:>{widths[column]}.3f}")
+            print(f"{terminal['name']:<24}{len(text):>8}{''.join(timings)}")
+        if lalr_engine != ParserEngine.LALR:
+            print(f"{terminal['name']:<24} fell back to earley")
+    statistics = registry.get_statistics()
+    print(
+        f"Compiled {statistics['parsers']} parsers in {statistics['compile_time']:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(
+        description=" ".join(__doc__.strip().split("\n")[:2])
+    )
+    argument_parser.add_argument("spec_path")
+    argument_parser.add_argument(
+        "--lengths", type=int, nargs="+", default=INPUT_LENGTHS
+    )
+    argument_parser.add_argument("--repeats", type=int, default=3)
+    argument_parser.add_argument(
+        "--budget",
+        type=float,
+        default=1.0,
+        help="Inputs are skipped for an engine when a parse is expected to take longer than this many seconds.",
+    )
+    arguments = argument_parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100000))
+    benchmark(
+        arguments.spec_path, arguments.lengths, arguments.repeats, arguments.budget
+    )
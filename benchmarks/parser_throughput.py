@@ -0,0 +1,120 @@
+"""
+Benchmarks the throughput of the parser engines, the regular expression fast path and cached terminal
+validation on random sentences of every text and hybrid terminal of an ALOC spec.
+
+Run from the root of the repository:
+
+    $ python -m benchmarks.parser_throughput ./src/aloc_spec.json
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from src.model.terminal_types.text_terminal import TextTerminal
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+from src.parser.sentence_generator import SentenceGenerator
+
+
+def _time_validation(validate: Callable[[str], bool], corpus: List[str]) -> float:
+    start_time = time.perf_counter()
+    for text in corpus:
+        validate(text)
+    return len(corpus) / max(time.perf_counter() - start_time, 1e-9)
+
+
+def benchmark(
+    spec_path: str,
+    count: int,
+    seed: int,
+    max_depth: int,
+    expansion_probability: float,
+) -> None:
+    with open(spec_path) as json_file:
+        data = json.load(json_file)
+    with open(data["contract"]["grammar_path"]) as grammar_file:
+        grammar = grammar_file.read()
+    terminals = data["terminal_types"].get("text", []) + data["terminal_types"].get(
+        "hybrid", []
+    )
+    generator = SentenceGenerator(grammar, seed, max_depth, expansion_probability)
+    registry = ParserRegistry()
+    columns = [engine.value for engine in ParserEngine] + [
+        "regex",
+        "cold cache",
+        "warm cache",
+    ]
+    print(
+        f"{'parse root':<24}{'length':>8}"
+        + "".join(f"{column + ' (/s)':>16}" for column in columns)
+        + f"{'disagreements':>16}"
+    )
+    for parse_root in dict.fromkeys(terminal["parse_root"] for terminal in terminals):
+        corpus = generator.generate_many(
+            parse_root, count
+        ) + generator.generate_near_misses(parse_root, count)
+        validators: Dict[str, Callable[[str], bool]] = {
+            engine.value: BaseParser(
+                parse_root, grammar, registry, engine, regex_fast_path=False
+            ).parse
+            for engine in ParserEngine
+        }
+        regex_parser = BaseParser(parse_root, grammar, registry)
+        if regex_parser.get_regex() is not None:
+            validators["regex"] = regex_parser.parse
+        terminal = TextTerminal(
+            parse_root, corpus[0], regex_parser, "", validation_cache_size=len(corpus)
+        )
+        validators["cold cache"] = terminal.validate
+        for validate in validators.values():
+            validate(corpus[0])
+        throughputs = {
+            column: _time_validation(validate, corpus)
+            for column, validate in validators.items()
+        }
+        # The terminal's cache was filled by the cold cache run.
+        throughputs["warm cache"] = _time_validation(terminal.validate, corpus)
+        disagreements = sum(
+            len({validate(text) for validate in validators.values()}) > 1
+            for text in corpus
+        )
+        average_length = sum(len(text) for text in corpus) / len(corpus)
+        print(
+            f"{parse_root:<24}{average_length:>8.1f}"
+            + "".join(
+                (
+                    f"{throughputs[column]:>16.0f}"
+                    if column in throughputs
+                    else f"{'n/a':>16}"
+                )
+                for column in columns
+            )
+            + f"{disagreements:>16}"
+        )
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(
+        description=" ".join(__doc__.strip().split("\n")[:2])
+    )
+    argument_parser.add_argument("spec_path")
+    argument_parser.add_argument(
+        "--count",
+        type=int,
+        default=1000,
+        help="The number of valid sentences, and of near misses, to validate for each parse root.",
+    )
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--max-depth", type=int, default=16)
+    argument_parser.add_argument("--expansion-probability", type=float, default=0.5)
+    arguments = argument_parser.parse_args()
+    benchmark(
+        arguments.spec_path,
+        arguments.count,
+        arguments.seed,
+        arguments.max_depth,
+        arguments.expansion_probability,
+    )
@@ -1,22 +1,76 @@
+import argparse
+import os
+
 from src.controller.controller import Controller
 from src.model.aloc_spec import ALOCSpec
 from src.model.model import Model
-from src.view.view import View
+from src.parser.parser_disk_cache import ParserDiskCache
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY
+
+# Lark can only save LALR parsers, so parsers built with Earley never reach the disk cache. Every parse root of
+# the spec is LALR(1), and a root that stops being one falls back to Earley.
+PARSER_ENGINE = ParserEngine.LALR
+SPEC_PATH = "./src/aloc_spec.json"
+VALIDATORS_PATH = "./src/aloc_spec_validators.py"
+TUNING_PATH = "./src/aloc_spec_tuning.json"
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "aloc")
 
 
 class App:
-    def __init__(self) -> None:
-        spec_reader = ALOCSpec("./src/aloc_spec.json")
+    def __init__(self, headless: bool = False) -> None:
+        # The disk cache is shared by every parser of the process, so it is only set up here.
+        disk_cache = ParserDiskCache(CACHE_DIRECTORY)
+        disk_cache.prune()
+        PARSER_REGISTRY.set_disk_cache(disk_cache)
+        spec_reader = ALOCSpec(
+            SPEC_PATH,
+            parser_engine=PARSER_ENGINE,
+            validators_path=VALIDATORS_PATH,
+            tuning_path=TUNING_PATH,
+            snapshot_directory=CACHE_DIRECTORY,
+        )
         self.model = Model(
             spec_reader.get_contract_collections(), spec_reader.get_component_types()
         )
-        self.controller = Controller(self.model, spec_reader.get_component_specs())
-        self.view = View(self.controller)
+        self.controller = Controller(
+            self.model, spec_reader.get_component_specs(), spec_reader
+        )
+        self.view = None
+        if not headless:
+            # The view pulls in tkinter, so it is only imported when there is a window to show.
+            from src.view.view import View
+
+            self.view = View(self.controller)
 
     def main_loop(self) -> None:
+        assert self.view is not None, "A headless app has no window to run."
         self.view.mainloop()
 
 
 if __name__ == "__main__":
-    app = App()
-    app.main_loop()
+    argument_parser = argparse.ArgumentParser(description="Drafts contracts in ALOC.")
+    argument_parser.add_argument(
+        "--export-cola",
+        nargs=2,
+        metavar=("CONTRACT_PATH", "COLA_PATH"),
+        help="Exports a saved contract to CoLa without opening a window.",
+    )
+    argument_parser.add_argument(
+        "--write-validators",
+        action="store_true",
+        help=f"Generates the precompiled validators of the spec in {VALIDATORS_PATH}, checking its defaults.",
+    )
+    arguments = argument_parser.parse_args()
+    if arguments.write_validators:
+        ALOCSpec(
+            SPEC_PATH, parser_engine=PARSER_ENGINE, tuning_path=TUNING_PATH
+        ).write_validators(VALIDATORS_PATH)
+    elif arguments.export_cola:
+        contract_path, cola_path = arguments.export_cola
+        app = App(headless=True)
+        app.controller.load_contract(contract_path)
+        app.controller.export_to_cola(cola_path)
+    else:
+        app = App()
+        app.main_loop()
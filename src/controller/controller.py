@@ -1,16 +1,24 @@
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
 from src.model.component_specifications.component_spec import ComponentSpec
 from src.model.components.contract import Contract
 from src.model.model import Model
 
+if TYPE_CHECKING:
+    from src.model.aloc_spec import ALOCSpec
+
 
 class Controller:
     """
     Class for sending control messages between the view and model of ALOC.
     """
 
-    def __init__(self, model: Model, component_specs: Dict[str, ComponentSpec]):
+    def __init__(
+        self,
+        model: Model,
+        component_specs: Dict[str, ComponentSpec],
+        aloc_spec: "ALOCSpec | None" = None,
+    ):
         """
         Initializes a Controller object.
 
@@ -18,9 +26,12 @@ class Controller:
             model (Model): The model instance to be associated with the controller.
             component_specs (dict): A dictionary mapping component names to
                 component specifications.
+            aloc_spec (ALOCSpec, optional): The spec the component specifications were read from, if it
+                should be reloaded when it is edited.
         """
         self.__model = model
         self.__component_specs = component_specs
+        self.__aloc_spec = aloc_spec
 
     def get_contract_path(self) -> str:
         """
@@ -142,6 +153,37 @@ class Controller:
         """
         self.__model.extend_chain_component(component_id)
 
+    def delete_chain_component(self, component_id: int) -> None:
+        """
+        Deletes a chain component from its chain.
+
+        Args:
+            component_id (int): The id of the chain component to be deleted.
+        """
+        self.__model.delete_chain_component(component_id)
+
+    def reload_spec(self) -> Dict[int, List[str]] | None:
+        """
+        Reloads the ALOC spec if it or its grammar were edited, and rebinds the current contract to it.
+
+        Returns:
+            The problems of the components that no longer conform to the spec, keyed by their internal id,
+            or None if the spec wasn't edited.
+
+        Raises:
+            ValueError: If the edited spec can't be loaded, the contract then keeps the spec it had.
+        """
+        if self.__aloc_spec is None or not self.__aloc_spec.has_changed():
+            return None
+        try:
+            self.__aloc_spec.reload()
+        except AssertionError as e:
+            raise ValueError(f"Can't reload the ALOC spec: {e}") from e
+        self.__component_specs = self.__aloc_spec.get_component_specs()
+        return self.__model.rebind(
+            self.__aloc_spec.get_contract_collections(), self.__component_specs
+        )
+
     def reset_ids(self):
         """
         Notifies the model to reset the ids of all components in the contract.
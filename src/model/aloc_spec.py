@@ -1,5 +1,15 @@
+import hashlib
+import io
 import json
-from typing import Dict, List, Type
+import os
+import pickle
+import re
+import tempfile
+import time
+import warnings
+from typing import Callable, Dict, List, Tuple, Type
+
+from lark import Lark
 
 from src.model.component_collection import ComponentCollection
 from src.model.component_specifications.chain_component_spec import \
@@ -19,9 +29,17 @@ from src.model.components.else_conditional_component import \
 from src.model.components.simple_component import SimpleComponent
 from src.model.terminal_types.hybrid_terminal import HybridTerminal
 from src.model.terminal_types.multi_choice_terminal import MultiChoiceTerminal
-from src.model.terminal_types.terminal import TerminalTypeNames
+from src.model.terminal_types.terminal import Terminal, TerminalTypeNames
 from src.model.terminal_types.text_terminal import TextTerminal
+from src.model.terminal_types.validation_cache import ValidationCache
 from src.parser.base_parser import BaseParser
+from src.parser.batch_validator import BatchValidator
+from src.parser.cola_verifier import ColaVerifier
+from src.parser.parallel_parser_builder import ParallelParserBuilder
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY, ParserRegistry
+from src.parser.parser_tuner import ParserTuner
+from src.parser.validator_module import ValidatorModule
 
 
 class ALOCSpec:
@@ -30,11 +48,61 @@ class ALOCSpec:
 
     Args:
         path (str): The path of the ALOC Spec to read.
+        parser_engine (:obj:`ParserEngine`, optional): The engine used to build the parsers of text and hybrid terminals.
+        debug (bool, optional): Whether to cross-check fast validation paths against the full parsers.
+        validators_path (str, optional): The path of a module generated by :obj:`ValidatorModule` for this spec.
+            Its precompiled validators are used if it matches the spec, the grammar and the engine of every parse
+            root, so it must be generated with the same tuning file.
+        tuning_path (str, optional): The path of a tuning file written by :obj:`ParserTuner` for this spec.
+            If it matches the spec and grammar, its engines replace :obj:`parser_engine` for the parse roots it covers.
+        eager_validation (bool, optional): Whether to check the defaults of all terminals, compiling their parsers,
+            while the spec is read. Otherwise each text terminal's default is checked the first time it is used.
+        parallel_build (bool, optional): Whether to compile the parsers of all terminals in a pool of worker
+            processes while the spec is read, reporting progress. Otherwise each parser is compiled the first
+            time it is used.
+        snapshot_directory (str, optional): The directory to keep compiled snapshots of the spec in. If given,
+            the spec is loaded from its snapshot, which is written first if there is none for the current
+            contents of the spec and grammar.
+        verbose (bool, optional): Whether to print how long reading the spec took.
+        terminal_pool (:obj:`Dict[str, Terminal]`, optional): Terminals shared with other specs, keyed by
+            their definition. Terminals found in it are reused and new ones are added to it. Specs using a pool
+            aren't loaded from snapshots, which hold their own copies of terminals.
+
+    Note:
+        The spec can be read again with :obj:`reload` after it or its grammar were edited, which only rebuilds
+        what changed. Contracts drafted with the spec are then rebound with :obj:`Contract.rebind`.
+
+        Defaults are also checked when validators are generated for the spec by :obj:`write_validators`, and
+        eager validation is meant for CI.
+
+        A snapshot holds the whole object graph of the spec and the tables of its LALR parsers. It is keyed by
+        a hash of the spec, the grammar, the Lark version, the source of the classes it holds and the options the
+        parsers are built with.
     """
 
-    def __init__(self, path: str) -> None:
+    SNAPSHOT_EXT = "snapshot"
+    SNAPSHOT_SOURCE_PACKAGES = ["model", "parser"]
+    __source_hash: str | None = None
+
+    def __init__(
+        self,
+        path: str,
+        parser_engine: ParserEngine = ParserEngine.EARLEY,
+        debug: bool = False,
+        validators_path: str | None = None,
+        tuning_path: str | None = None,
+        eager_validation: bool = False,
+        parallel_build: bool = False,
+        snapshot_directory: str | None = None,
+        verbose: bool = False,
+        terminal_pool: Dict[str, Terminal] | None = None,
+    ) -> None:
+        start_time = time.perf_counter()
         with open(path) as json_file:
-            self.__data = json.load(json_file)
+            spec_text = json_file.read()
+        self.__path = path
+        self.__spec_text = spec_text
+        self.__data = json.loads(spec_text)
         self.__component_to_spec = {
             "chain_components": ChainComponentSpec,
             "simple_components": SimpleComponentSpec,
@@ -51,11 +119,428 @@ class ALOCSpec:
             terminal_type_name.value for terminal_type_name in TerminalTypeNames
         ]
         self.__terminal_types_to_objects = dict()
+        self.__parser_engine = parser_engine
+        self.__debug = debug
+        self.__parsers: List[BaseParser] = []
         self.__contract_collections = []
         with open(self.__data["contract"]["grammar_path"]) as grammar_file:
             self.__grammar = grammar_file.read()
+        self.__file_stamps = self._get_file_stamps()
+        self.__tuning_path = tuning_path
+        self.__tuned_engines: Dict[str, ParserEngine] = dict()
+        if tuning_path is not None:
+            self.__tuned_engines = ParserTuner.load(
+                tuning_path, ValidatorModule.fingerprint(spec_text, self.__grammar)
+            )
+        self.__eager_validation = eager_validation
+        self.__terminal_pool = terminal_pool
+        self.__has_precompiled_validators = False
+        if validators_path is not None:
+            self._install_validators(validators_path, spec_text)
         self.__component_specs = dict()
-        self._initialise_spec()
+        self.__snapshot_directory = snapshot_directory
+        self.__snapshot_path = None
+        if snapshot_directory is not None and terminal_pool is None:
+            self.__snapshot_path = self._get_snapshot_path(path, spec_text)
+        loaded_snapshot = self.__snapshot_path is not None and self._load_snapshot()
+        if not loaded_snapshot:
+            self._initialise_spec()
+        if parallel_build:
+            self.build_parsers(progress=self._print_build_progress)
+        if eager_validation:
+            self.check_defaults()
+        if self.__snapshot_path is not None and not loaded_snapshot:
+            self.save_snapshot()
+        if verbose:
+            source = "snapshot" if loaded_snapshot else "JSON"
+            print(
+                f"Read {path} from {source} in {(time.perf_counter() - start_time) * 1000:.1f}ms"
+            )
+
+    def _get_snapshot_path(self, path: str, spec_text: str) -> str:
+        key = hashlib.sha256(
+            "\0".join(
+                [
+                    ValidatorModule.fingerprint(spec_text, self.__grammar),
+                    self._get_source_hash(),
+                    self.__parser_engine.value,
+                    str(self.__debug),
+                    str(
+                        sorted(
+                            (root, engine.value)
+                            for root, engine in self.__tuned_engines.items()
+                        )
+                    ),
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        # Specs with the same file name in different directories share the snapshot directory.
+        absolute_path = os.path.abspath(path)
+        path_hash = hashlib.sha256(absolute_path.encode("utf-8")).hexdigest()
+        assert self.__snapshot_directory is not None
+        return os.path.join(
+            self.__snapshot_directory,
+            f"{os.path.basename(absolute_path)}.{path_hash[:8]}.{key[:16]}.{self.SNAPSHOT_EXT}",
+        )
+
+    @classmethod
+    def _get_source_hash(cls) -> str:
+        # Snapshots pickle the classes of the model and parser, so they are only loaded by the code that wrote them.
+        if ALOCSpec.__source_hash is None:
+            source_hash = hashlib.sha256()
+            source_directory = os.path.dirname(
+                os.path.dirname(os.path.abspath(__file__))
+            )
+            for package in cls.SNAPSHOT_SOURCE_PACKAGES:
+                for directory, directory_names, file_names in os.walk(
+                    os.path.join(source_directory, package)
+                ):
+                    directory_names.sort()
+                    for file_name in sorted(file_names):
+                        if not file_name.endswith(".py"):
+                            continue
+                        path = os.path.join(directory, file_name)
+                        source_hash.update(
+                            os.path.relpath(path, source_directory).encode("utf-8")
+                        )
+                        with open(path, "rb") as file:
+                            source_hash.update(file.read())
+            ALOCSpec.__source_hash = source_hash.hexdigest()
+        return ALOCSpec.__source_hash
+
+    def _load_snapshot(self) -> bool:
+        assert self.__snapshot_path is not None
+        if not os.path.exists(self.__snapshot_path):
+            return False
+        try:
+            with open(self.__snapshot_path, "rb") as file:
+                snapshot = pickle.load(file)
+            (
+                self.__data,
+                self.__terminal_types_to_objects,
+                self.__parsers,
+                self.__contract_collections,
+                self.__component_specs,
+            ) = snapshot["spec"]
+            grammar_hash = ParserRegistry.hash_grammar(self.__grammar)
+            for parse_root, pattern in snapshot["regexes"].items():
+                PARSER_REGISTRY.add_regex(
+                    grammar_hash, parse_root, re.compile(pattern) if pattern else None
+                )
+            for key, parser_data in snapshot["parsers"].items():
+                parse_root, engine, built_engine = key
+                PARSER_REGISTRY.add_parser(
+                    grammar_hash,
+                    parse_root,
+                    ParserEngine(engine),
+                    Lark.load(io.BytesIO(parser_data)),
+                    ParserEngine(built_engine),
+                )
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            # Snapshots that are truncated or corrupted can't be loaded, they are replaced.
+            self.__terminal_types_to_objects = dict()
+            self.__parsers = []
+            self.__contract_collections = []
+            self.__component_specs = dict()
+            return False
+        return True
+
+    def save_snapshot(self) -> None:
+        """
+        Writes the compiled snapshot of this spec, compiling the LALR parsers of its terminals.
+
+        Lark can only save LALR parsers, so parsers built with Earley are left to be compiled when they are
+        first used. Snapshots of earlier contents of the spec are removed.
+        """
+        if self.__snapshot_path is None:
+            return
+        regexes = dict()
+        parsers = dict()
+        for parser in self.__parsers:
+            regex = parser.get_regex()
+            regexes[parser.get_start_from()] = regex.pattern if regex else None
+            if (
+                parser.get_requested_engine().is_lalr()
+                and parser.get_engine().is_lalr()
+            ):
+                parser_file = io.BytesIO()
+                parser.get_lark_parser().save(parser_file)
+                parsers[
+                    (
+                        parser.get_start_from(),
+                        parser.get_requested_engine().value,
+                        parser.get_engine().value,
+                    )
+                ] = parser_file.getvalue()
+        snapshot = {
+            "spec": (
+                self.__data,
+                self.__terminal_types_to_objects,
+                self.__parsers,
+                self.__contract_collections,
+                self.__component_specs,
+            ),
+            "regexes": regexes,
+            "parsers": parsers,
+        }
+        directory, file_name = os.path.split(self.__snapshot_path)
+        os.makedirs(directory, exist_ok=True)
+        spec_prefix = file_name.rsplit(".", 2)[0]
+        for other_file_name in os.listdir(directory):
+            if (
+                other_file_name.startswith(f"{spec_prefix}.")
+                and other_file_name.endswith(f".{self.SNAPSHOT_EXT}")
+                and other_file_name != file_name
+            ):
+                try:
+                    os.remove(os.path.join(directory, other_file_name))
+                except OSError:
+                    pass
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.__snapshot_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def has_changed(self) -> bool:
+        """
+        Checks whether the spec or its grammar were modified since they were last read.
+
+        Returns:
+            bool: True if the modification time or size of either file changed, False otherwise.
+        """
+        return self._get_file_stamps() != self.__file_stamps
+
+    def _get_file_stamps(self) -> Tuple:
+        stamps = []
+        for path in (self.__path, self.__data["contract"]["grammar_path"]):
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def reload(self) -> Dict[str, List[str]]:
+        """
+        Reads the spec and its grammar again, rebuilding only what changed.
+
+        A terminal is rebuilt if its definition changed, or if the part of the grammar reachable from its parse
+        root did. A component spec is rebuilt if its definition changed, or if a terminal or component spec it
+        uses was rebuilt. Everything else is kept, including the compiled parsers of unchanged parse roots.
+
+        Returns:
+            :obj:`Dict[str, List[str]]`: The names of the ``terminals`` and ``component_specs`` that were
+            rebuilt, and the ``parse_roots`` whose parsers will be compiled again.
+
+        Raises:
+            ValueError: If the spec or grammar can't be read, or the spec is malformed.
+            AssertionError: If eager validation is on and the default of a rebuilt terminal isn't valid.
+
+        Note:
+            If reading fails the spec is left as it was. The dictionary of component specs is updated in place,
+            while the list of component collections is replaced.
+        """
+        self.__file_stamps = self._get_file_stamps()
+        try:
+            with open(self.__path) as json_file:
+                spec_text = json_file.read()
+            data = json.loads(spec_text)
+            with open(data["contract"]["grammar_path"]) as grammar_file:
+                grammar = grammar_file.read()
+        except (OSError, KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Can't reload {self.__path}: {error!r}") from error
+        changes: Dict[str, List[str]] = {
+            "terminals": [],
+            "component_specs": [],
+            "parse_roots": [],
+        }
+        if spec_text == self.__spec_text and grammar == self.__grammar:
+            return changes
+        old_data = json.loads(self.__spec_text)
+        old_grammar = self.__grammar
+        state = (
+            self.__data,
+            self.__spec_text,
+            self.__grammar,
+            self.__tuned_engines,
+            self.__terminal_types_to_objects,
+            self.__parsers,
+            self.__contract_collections,
+            dict(self.__component_specs),
+        )
+        try:
+            self.__data = data
+            self.__spec_text = spec_text
+            self.__grammar = grammar
+            if self.__tuning_path is not None:
+                self.__tuned_engines = ParserTuner.load(
+                    self.__tuning_path, ValidatorModule.fingerprint(spec_text, grammar)
+                )
+            changes["parse_roots"] = self._reuse_parsers(old_grammar)
+            changes["terminals"] = self._reload_terminals(
+                old_data, changes["parse_roots"]
+            )
+            changes["component_specs"] = self._reload_component_specs(
+                old_data, changes["terminals"]
+            )
+            self._reload_collections()
+            if self.__eager_validation:
+                self.check_defaults()
+        except (KeyError, TypeError, ValueError) as error:
+            self._restore_state(state)
+            raise ValueError(f"Can't reload {self.__path}: {error!r}") from error
+        except AssertionError:
+            self._restore_state(state)
+            raise
+        if self.__snapshot_path is not None:
+            self.__snapshot_path = self._get_snapshot_path(self.__path, spec_text)
+        return changes
+
+    def _restore_state(self, state: Tuple) -> None:
+        (
+            self.__data,
+            self.__spec_text,
+            self.__grammar,
+            self.__tuned_engines,
+            self.__terminal_types_to_objects,
+            self.__parsers,
+            self.__contract_collections,
+            component_specs,
+        ) = state
+        self.__component_specs.clear()
+        self.__component_specs.update(component_specs)
+
+    def _reuse_parsers(self, old_grammar: str) -> List[str]:
+        if old_grammar == self.__grammar:
+            return []
+        return [
+            parse_root
+            for parse_root in ValidatorModule.get_parse_roots(self.__data)
+            if not PARSER_REGISTRY.reuse_parsers(
+                old_grammar, self.__grammar, parse_root
+            )
+        ]
+
+    def _reload_terminals(
+        self, old_data: Dict, changed_parse_roots: List[str]
+    ) -> List[str]:
+        old_terminals = self.__terminal_types_to_objects
+        old_definitions = {
+            (terminal_type, terminal["name"]): terminal
+            for terminal_type in self.__terminal_types
+            for terminal in old_data["terminal_types"][terminal_type]
+        }
+        self.__terminal_types_to_objects = dict()
+        self.__parsers = []
+        rebuilt = []
+        for terminal_type in self.__terminal_types:
+            for terminal in self.__data["terminal_types"][terminal_type]:
+                name = terminal["name"]
+                old_terminal = old_terminals.get(name)
+                if (
+                    old_terminal is None
+                    or old_definitions.get((terminal_type, name)) != terminal
+                    or terminal.get("parse_root") in changed_parse_roots
+                ):
+                    self.__terminal_types_to_objects[name] = self._get_terminal(
+                        terminal, terminal_type
+                    )
+                    rebuilt.append(name)
+                    continue
+                if isinstance(old_terminal, (TextTerminal, HybridTerminal)):
+                    parser = old_terminal.get_parser()
+                    parse_root = parser.get_start_from()
+                    if parser.get_grammar() != self.__grammar or (
+                        parser.get_requested_engine()
+                        != self.get_parser_engine(parse_root)
+                    ):
+                        if self.__terminal_pool is not None:
+                            # Pooled terminals are shared with other specs, so they are never updated in place.
+                            new_terminal = self._get_terminal(terminal, terminal_type)
+                            self.__terminal_types_to_objects[name] = new_terminal
+                            if new_terminal is not old_terminal:
+                                rebuilt.append(name)
+                            continue
+                        parser = self._create_parser(parse_root)
+                        old_terminal.set_parser(parser)
+                    else:
+                        self.__parsers.append(parser)
+                self.__terminal_types_to_objects[name] = old_terminal
+        return rebuilt
+
+    def _reload_component_specs(
+        self, old_data: Dict, rebuilt_terminals: List[str]
+    ) -> List[str]:
+        component_specs: Dict[str, ComponentSpec] = dict()
+        rebuilt = []
+        for component_type, component_spec_class in self.__component_to_spec.items():
+            old_definitions = {
+                component["component_name"]: component
+                for component in old_data[component_type]
+            }
+            for component in self.__data[component_type]:
+                name = component["component_name"]
+                terminal_names = [
+                    attribute["type"] for attribute in component.get("attributes", [])
+                ]
+                component_spec_names = [
+                    component[key]
+                    for key in ("condition", "result")
+                    if key in component
+                ]
+                if (
+                    name in self.__component_specs
+                    and old_definitions.get(name) == component
+                    and all(
+                        terminal_name in self.__terminal_types_to_objects
+                        and terminal_name not in rebuilt_terminals
+                        for terminal_name in terminal_names
+                    )
+                    and not set(component_spec_names) & set(rebuilt)
+                ):
+                    component_specs[name] = self.__component_specs[name]
+                    continue
+                component_specs[name] = component_spec_class.from_json(
+                    component, component_specs, self.__terminal_types_to_objects
+                )
+                rebuilt.append(name)
+        self.__component_specs.clear()
+        self.__component_specs.update(component_specs)
+        return rebuilt
+
+    def _reload_collections(self) -> None:
+        old_collections = {
+            collection.get_name(): collection
+            for collection in self.__contract_collections
+        }
+        self.__contract_collections = [
+            (
+                old_collections[name]
+                if name in old_collections
+                else ComponentCollection(name)
+            )
+            for name in self.__data["contract"]["collections"]
+        ]
+
+    def _install_validators(self, validators_path: str, spec_text: str) -> None:
+        self.__has_precompiled_validators = ValidatorModule.install(
+            validators_path,
+            ValidatorModule.fingerprint(spec_text, self.__grammar),
+            ParserRegistry.hash_grammar(self.__grammar),
+            {
+                parse_root: self.get_parser_engine(parse_root)
+                for parse_root in ValidatorModule.get_parse_roots(self.__data)
+            },
+        )
+        if not self.__has_precompiled_validators and os.path.exists(validators_path):
+            warnings.warn(
+                f"Validators in {validators_path} do not match the spec, compiling parsers at runtime.",
+                stacklevel=3,
+            )
 
     def _initialise_spec(self):
         self._initialise_terminals()
@@ -74,19 +559,44 @@ class ALOCSpec:
         for terminal_type in self.__terminal_types:
             terminals = self.__data["terminal_types"][terminal_type]
             for terminal in terminals:
-                self.__terminal_types_to_objects[
-                    terminal["name"]
-                ] = self._initialise_terminal(terminal, terminal_type)
+                self.__terminal_types_to_objects[terminal["name"]] = self._get_terminal(
+                    terminal, terminal_type
+                )
+
+    def _get_terminal(self, terminal, terminal_type: str) -> Terminal:
+        if self.__terminal_pool is None:
+            return self._initialise_terminal(terminal, terminal_type)
+        # The key is taken before the terminal is built, as building it adds to the choices of its definition.
+        key = self._get_terminal_key(terminal, terminal_type)
+        shared_terminal = self.__terminal_pool.get(key)
+        if shared_terminal is None:
+            shared_terminal = self._initialise_terminal(terminal, terminal_type)
+            self.__terminal_pool[key] = shared_terminal
+        elif isinstance(shared_terminal, (TextTerminal, HybridTerminal)):
+            self.__parsers.append(shared_terminal.get_parser())
+        return shared_terminal
+
+    def _get_terminal_key(self, terminal, terminal_type: str) -> str:
+        key = [terminal_type, json.dumps(terminal, sort_keys=True)]
+        if "parse_root" in terminal:
+            key += [
+                PARSER_REGISTRY.get_slice_hash(self.__grammar, terminal["parse_root"]),
+                self.get_parser_engine(terminal["parse_root"]).value,
+                str(self.__debug),
+            ]
+        return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
 
     def _initialise_terminal(self, terminal, terminal_type: str):
         match (terminal_type):
             case TerminalTypeNames.TEXT.value:
-                parser = BaseParser(terminal["parse_root"], self.__grammar)
+                parser = self._create_parser(terminal["parse_root"])
                 return TextTerminal(
                     terminal["name"],
                     terminal["default"],
                     parser,
                     terminal["explanation"],
+                    self._get_validation_cache_size(terminal),
+                    lazy=True,
                 )
             case TerminalTypeNames.MULTI_CHOICE.value:
                 if "allow_empty" in terminal and terminal["allow_empty"]:
@@ -100,7 +610,7 @@ class ALOCSpec:
                     allow_empty,
                 )
             case TerminalTypeNames.HYBRID.value:
-                parser = BaseParser(terminal["parse_root"], self.__grammar)
+                parser = self._create_parser(terminal["parse_root"])
                 return HybridTerminal(
                     terminal["name"],
                     terminal["default_option"],
@@ -108,12 +618,156 @@ class ALOCSpec:
                     parser,
                     terminal["explanation"],
                     terminal["choices"],
+                    self._get_validation_cache_size(terminal),
                 )
             case _:
                 raise ValueError(
                     f"Unsupported terminal type specified in ALOC sepc: {terminal_type}"
                 )
 
+    @staticmethod
+    def _get_validation_cache_size(terminal) -> int:
+        if "validation_cache_size" in terminal:
+            return terminal["validation_cache_size"]
+        return ValidationCache.DEFAULT_SIZE
+
+    def _create_parser(self, parse_root: str) -> BaseParser:
+        parser = BaseParser(
+            parse_root,
+            self.__grammar,
+            engine=self.get_parser_engine(parse_root),
+            debug=self.__debug,
+        )
+        self.__parsers.append(parser)
+        return parser
+
+    def build_parsers(
+        self,
+        processes: int | None = None,
+        progress: Callable[[int, int, str], None] | None = None,
+    ) -> Dict[str, float]:
+        """
+        Compiles the parsers of all text and hybrid terminals of the spec at once in a pool of worker processes.
+
+        Args:
+            processes (int | None, optional): The number of worker processes, the number of CPUs if None.
+            progress (:obj:`Callable[[int, int, str], None]`, optional): Called with the number of parsers
+                built so far, the number to build and the parse root of the parser just built.
+
+        Returns:
+            :obj:`Dict[str, float]`: The statistics of the build (see :obj:`ParallelParserBuilder`).
+        """
+        return ParallelParserBuilder(processes).build(
+            self.__grammar,
+            [
+                (parser.get_start_from(), parser.get_requested_engine())
+                for parser in self.__parsers
+            ],
+            progress=progress,
+        )
+
+    @staticmethod
+    def _print_build_progress(built: int, total: int, parse_root: str) -> None:
+        print(f"Built parser {built}/{total} ({parse_root})")
+
+    def check_defaults(self) -> None:
+        """
+        Checks the defaults of all text and hybrid terminals of the spec, compiling their parsers.
+
+        Raises:
+            AssertionError: If the default of a terminal isn't valid.
+        """
+        for terminal in self.__terminal_types_to_objects.values():
+            if isinstance(terminal, (TextTerminal, HybridTerminal)):
+                terminal.check_default()
+
+    def write_validators(self, output_path: str) -> None:
+        """
+        Generates a module of precompiled validators for this spec, checking the defaults of all its terminals.
+
+        The module is generated for the engine and tuning file this spec was read with, so it can be loaded
+        with :obj:`validators_path` by a spec read with the same options.
+
+        Args:
+            output_path (str): The path to write the module to.
+
+        Raises:
+            AssertionError: If the default of a terminal isn't valid.
+        """
+        ValidatorModule.write(
+            self.__path,
+            output_path,
+            self.__parser_engine,
+            self.__tuning_path,
+            self.check_defaults,
+        )
+
+    def get_parser_engine(self, parse_root: str) -> ParserEngine:
+        """
+        Retrieves the engine the parsers of a parse root are built with.
+
+        Args:
+            parse_root (str): The rule of the grammar the parsers start from.
+
+        Returns:
+            :obj:`ParserEngine`: The engine chosen for :obj:`parse_root` by the tuning file, or the
+            engine requested for the spec if the tuning file doesn't cover it.
+        """
+        return self.__tuned_engines.get(parse_root, self.__parser_engine)
+
+    def create_cola_verifier(
+        self, batch_validator: BatchValidator | None = None
+    ) -> ColaVerifier:
+        """
+        Creates a verifier that checks exported CoLa against the grammar of this spec.
+
+        Args:
+            batch_validator (:obj:`BatchValidator`, optional): The validator to spread the parsing with.
+
+        Returns:
+            :obj:`ColaVerifier`: A verifier parsing every top level component from the grammar's component rule.
+        """
+        parser = BaseParser(
+            ColaVerifier.DEFAULT_START,
+            self.__grammar,
+            engine=self.__parser_engine,
+            debug=self.__debug,
+        )
+        return ColaVerifier(parser, batch_validator)
+
+    def has_precompiled_validators(self) -> bool:
+        """
+        Retrieves whether the validators of this spec were loaded from a generated module.
+
+        Returns:
+            bool: True if a matching validator module was installed, False otherwise.
+        """
+        return self.__has_precompiled_validators
+
+    def get_fallback_parse_roots(self) -> List[str]:
+        """
+        Retrieves the parse roots whose parsers could not be built with the requested engine.
+
+        Returns:
+            :obj:`List[str]`: The parse roots of text and hybrid terminals that fell back to the Earley engine.
+        """
+        return sorted(
+            {
+                parser.get_start_from()
+                for parser in self.__parsers
+                if parser.get_engine() != parser.get_requested_engine()
+            }
+        )
+
+    def get_terminals(self) -> Dict[str, Terminal]:
+        """
+        Retrieves the terminals defined in the ALOC file.
+
+        Returns:
+            :obj:`Dict[str, Terminal]`: A dictionary mapping terminal names to their Terminal objects.
+        """
+        return self.__terminal_types_to_objects
+
     def get_contract_collections(self) -> List[ComponentCollection]:
         """
         Retrieves the component collections defined in the ALOC file.
@@ -1,38 +1,72 @@
+from typing import Dict
+
+
 class ChainParent:
     """ChainParent class represents a component that has one or many chain components nested directly within it."""
 
     def __init__(self, allow_chain_deletion):
         self.__allow_chain_deletion = allow_chain_deletion
-        self.__children = []
+        # The first component of each child chain, in order, keyed by its slot so it can be replaced in O(1).
+        self.__children: Dict[int, object] = dict()
+        # Maps the object id of every child to its slot.
+        self.__child_slots: Dict[int, int] | None = dict()
 
-    def delete_chain_component(self, id: int):
+    def __getstate__(self):
+        # Object ids don't survive pickling, the slots of the children are found again on their first use.
+        state = self.__dict__.copy()
+        state["_ChainParent__child_slots"] = None
+        return state
+
+    def unlink_chain_component(self, component) -> bool:
         """
-        Deletes a chain component from one of the child chains.
+        Removes a chain component from one of the child chains in O(1).
 
         Args:
-             id (int): The id of the component to be deleted.
+            component (:obj:`ChainComponent`): The component to remove.
+
+        Returns:
+            bool: False if the component is the only one in its chain and the chain can't be deleted, True if
+            it was removed.
         """
-        for child in self.__children:
-            prev_component, to_delete = child.get_chain_component(id)
-            if to_delete and prev_component:
-                prev_component.set_next(to_delete.get_next())
-                return
-            if (
-                to_delete
-                and not to_delete.get_next()
-                and not self.__allow_chain_deletion
-            ):
-                return
-            if to_delete:
-                self.__children = [
-                    child for child in self.__children if child.get_internal_id() != id
-                ]
-                if to_delete.get_next():
-                    self.__children.append(to_delete.get_next())
-                return to_delete.get_next()
+        if component.get_previous() is None:
+            if not component.get_next() and not self.__allow_chain_deletion:
+                return False
+            self._replace_child(component, component.get_next())
+        component.unlink()
+        return True
 
     def add_child(self, child):
-        self.__children.append(child)
+        child_slots = self._get_child_slots()
+        slot = next(reversed(self.__children), -1) + 1
+        self.__children[slot] = child
+        child_slots[id(child)] = slot
+
+    def remove_child(self, child):
+        slot = self._get_child_slots().pop(id(child), None)
+        if slot is not None:
+            del self.__children[slot]
 
     def get_children(self):
-        return self.__children
+        self._get_child_slots()
+        return list(self.__children.values())
+
+    def _replace_child(self, child, new_child) -> None:
+        # The first component of a child chain was deleted, new_child is None if the chain is now empty.
+        if new_child is None:
+            self.remove_child(child)
+            return
+        child_slots = self._get_child_slots()
+        slot = child_slots.pop(id(child), None)
+        if slot is not None:
+            self.__children[slot] = new_child
+            child_slots[id(new_child)] = slot
+
+    def _get_child_slots(self) -> Dict[int, int]:
+        child_slots = self.__dict__.get("_ChainParent__child_slots")
+        if child_slots is None:
+            if isinstance(self.__children, list):
+                # Components saved before the children were slotted keep them in a list.
+                self.__children = dict(enumerate(self.__children))
+            child_slots = {id(child): slot for slot, child in self.__children.items()}
+            self.__child_slots = child_slots
+        return child_slots
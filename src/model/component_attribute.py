@@ -1,5 +1,6 @@
-from typing import Tuple
+from typing import Any, Tuple
 
+from src.model.terminal_types.hybrid_terminal import HybridTerminal
 from src.model.terminal_types.terminal import Terminal
 
 
@@ -18,6 +19,8 @@ class ComponentAttribute:
         self.__terminal: Terminal = terminal
         self.__value: str | Tuple = terminal.get_default()
         self.__prefix = prefix
+        self.__typed_value: Any = None
+        self.__typed_value_resolved = False
 
     def get_name(self) -> str:
         """
@@ -51,6 +54,46 @@ class ComponentAttribute:
             return f"{self.__prefix}{self.__value}"
         return (self.__value[0], f"{self.__prefix}{self.__value[1]}")
 
+    def get_raw_value(self) -> str | Tuple:
+        """
+        Retrieves the value of the attribute without its prefix.
+
+        Returns:
+            :obj:`str | Tuple`: The value of this attribute as entered for its terminal.
+        """
+        return self.__value
+
+    def get_typed_value(self) -> Any:
+        """
+        Retrieves the typed value of the attribute, such as an amount or the ordinal of a date.
+
+        The value is parsed the first time it is asked for, and again after it is changed.
+
+        Returns:
+            :obj:`Any`: The typed value of this attribute, or None if its value is invalid or has no typed value.
+        """
+        if not self.__typed_value_resolved:
+            self.__typed_value = self.__terminal.parse_value(self.__value)
+            self.__typed_value_resolved = True
+        return self.__typed_value
+
+    def is_valid(self) -> bool:
+        """
+        Checks whether the value of the attribute is valid for its terminal.
+
+        Returns:
+            bool: True if the terminal accepts the value, False otherwise.
+        """
+        value = self.__value
+        if isinstance(value, tuple) != isinstance(self.__terminal.get_default(), tuple):
+            return False
+        if isinstance(value, tuple):
+            option, text = value
+            if option != HybridTerminal.CUSTOM_OPTION:
+                return option in self.__terminal.get_choices()
+            value = text
+        return self.__terminal.validate(value)
+
     def create_blank(self) -> "ComponentAttribute":
         """
         Creates a blank copy of this attribute.
@@ -68,6 +111,14 @@ class ComponentAttribute:
             value (str): The value to set this attribute to.
         """
         self.__value = value
+        self.__typed_value = None
+        self.__typed_value_resolved = False
+
+    def __setstate__(self, state):
+        # Contracts saved before typed values were added don't store them.
+        state.setdefault("_ComponentAttribute__typed_value", None)
+        state.setdefault("_ComponentAttribute__typed_value_resolved", False)
+        self.__dict__.update(state)
 
     @classmethod
     def from_json(cls, json: dict, terminals) -> "ComponentAttribute":
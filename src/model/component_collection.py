@@ -1,14 +1,20 @@
-from typing import List
+from typing import Dict, List
 
-from src.model.chain_parent import ChainParent
-from src.model.components.chain_component import ChainComponent
 from src.model.components.component import Component
+from src.model.order_statistic_list import OrderStatisticList
 
 
 class ComponentCollection:
     """
     ComponentCollection class represents a collection of components.
 
+    The components are kept in order in an :obj:`OrderStatisticList`, along with a map from their internal ids.
+    Checking whether a component is in the collection takes O(1). Inserting, deleting and replacing a
+    component, and finding it by position, take O(log n).
+
+    Only the components held directly by the collection are indexed, the ones nested in them are looked up
+    through :obj:`Contract.get_component`.
+
     Args:
         name (str): The name of the collection.
 
@@ -16,15 +22,38 @@ class ComponentCollection:
 
     def __init__(self, name: str) -> None:
         self.__name: str = name
-        self.__components: List[Component] = []
+        self.__components: OrderStatisticList = OrderStatisticList()
+        self.__components_by_id: Dict[int, Component] = dict()
+
+    def __setstate__(self, state):
+        # Contracts saved before collections were indexed store their components in a list.
+        components = state["_ComponentCollection__components"]
+        if isinstance(components, list):
+            state["_ComponentCollection__components"] = OrderStatisticList(components)
+            state["_ComponentCollection__components_by_id"] = {
+                component.get_internal_id(): component for component in components
+            }
+        self.__dict__.update(state)
 
     def add_component(self, component: Component) -> None:
-        """Adds a component to the collection.
+        """Adds a component to the end of the collection.
 
         Args:
             component (:obj:`Component`): The component to add to the collection.
         """
-        self.__components.append(component)
+        self.insert_component(len(self.__components), component)
+
+    def insert_component(self, index: int, component: Component) -> None:
+        """Inserts a component at a position in the collection.
+
+        The component is indexed by its internal id, which must already be set.
+
+        Args:
+            index (int): The position the component will have.
+            component (:obj:`Component`): The component to insert into the collection.
+        """
+        self.__components.insert(index, [component])
+        self.__components_by_id[component.get_internal_id()] = component
 
     def delete_component(self, component_id: int) -> None:
         """Deletes a component from the collection.
@@ -35,17 +64,16 @@ class ComponentCollection:
         Note:
             If the component is not in this collection, nothing happens.
         """
-        self.__components = [
-            component
-            for component in self.__components
-            if component.get_internal_id() != component_id
-        ]
+        component = self.__components_by_id.pop(component_id, None)
+        if component is not None:
+            self.__components.remove(component)
 
     def clear(self):
         """
         Deletes all the components from this collection.
         """
-        self.__components = []
+        self.__components = OrderStatisticList()
+        self.__components_by_id = dict()
 
     def replace_component(self, component_to_replace_with: Component, replace_id):
         """
@@ -58,16 +86,13 @@ class ComponentCollection:
         Raises:
             ValueError: If there is no such component with :obj:`replace_id`
         """
-        if not self.contains_component(replace_id):
+        if replace_id not in self.__components_by_id:
             raise ValueError(
-                "Treid to replace component with id {replace_id} but it doesn't exist."
+                f"Tried to replace component with id {replace_id} but it doesn't exist."
             )
-        self.__components = [
-            component
-            if component.get_internal_id() != replace_id
-            else component_to_replace_with
-            for component in self.__components
-        ]
+        index = self.get_position(replace_id)
+        self.delete_component(replace_id)
+        self.insert_component(index, component_to_replace_with)
 
     def get_name(self) -> str:
         """
@@ -80,23 +105,20 @@ class ComponentCollection:
 
     def contains_component(self, component_id: int) -> bool:
         """
-        Checks if the collection contains a component with the given ID.
+        Checks if the collection directly holds a component with the given ID, in O(1).
 
         Args:
             component_id (int): The id of the component to check for.
 
         Returns:
-            bool: True if the component is in the collection, false otherwise.
+            bool: True if the component is held directly by the collection, false otherwise, including when
+            it is nested in a component of the collection.
         """
-        try:
-            self.get_component(component_id)
-            return True
-        except:
-            return False
+        return component_id in self.__components_by_id
 
     def get_component(self, component_id: int) -> Component:
         """
-        Returns a component from the collection by its ID.
+        Returns a component held directly by the collection by its ID, in O(1).
 
         Args:
             component_id (int): The id of the component to get from the collection.
@@ -105,33 +127,59 @@ class ComponentCollection:
             :obj:`Component`: The component requested for.
 
         Raises:
-            ValueError: If the component is not in the collection.
-        """
-        for component in self.__components:
-            if component.get_internal_id() == component_id:
-                return component
-            if isinstance(component, ChainComponent):
-                found_component = self._search_chain_component(component, component_id)
-                if found_component is not None:
-                    return found_component
-            if isinstance(component, ChainParent):
-                for child in component.get_children():
-                    found_component = self._search_chain_component(child, component_id)
-                    if found_component is not None:
-                        return found_component
-        raise ValueError(f"Component with id {component_id} not found")
+            ValueError: If the component is not held directly by the collection.
+        """
+        if component_id not in self.__components_by_id:
+            raise ValueError(f"Component with id {component_id} not found")
+        return self.__components_by_id[component_id]
+
+    def get_component_at(self, index: int) -> Component:
+        """
+        Returns the component at a position in the collection, in O(log n).
+
+        Args:
+            index (int): The position of the component.
+
+        Returns:
+            :obj:`Component`: The component at position :obj:`index`.
+
+        Raises:
+            IndexError: If there is no component at :obj:`index`.
+        """
+        return self.__components[index]
+
+    def get_position(self, component_id: int) -> int:
+        """
+        Returns the position of a component held directly by the collection, in O(log n).
+
+        Args:
+            component_id (int): The id of the component.
+
+        Returns:
+            int: The position of the component.
+
+        Raises:
+            ValueError: If the component is not held directly by the collection.
+        """
+        if component_id not in self.__components_by_id:
+            raise ValueError(f"Component with id {component_id} not found")
+        return self.__components.index(self.__components_by_id[component_id])
+
+    def get_component_count(self) -> int:
+        """
+        Returns the number of components held directly by the collection.
+
+        Returns:
+            int: The number of components.
+        """
+        return len(self.__components)
 
     def get_components(self) -> List[Component]:
         """
         Returns all components in the collection.
 
         Returns:
-            :obj:`List[Component]`: All the components in the collection.
+            :obj:`List[Component]`: All the components in the collection, in order. Changing the list doesn't
+            change the collection.
         """
-        return self.__components
-
-    def _search_chain_component(self, component, component_id):
-        current_component = component
-        while current_component and current_component.get_internal_id() != component_id:
-            current_component = current_component.get_next()
-        return current_component
+        return list(self.__components)
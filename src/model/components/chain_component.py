@@ -1,11 +1,19 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from src.model.chain_parent import ChainParent
 from src.model.component_specifications.chain_component_spec import \
     ChainComponentSpec
+from src.model.components.component import Component
 from src.model.components.simple_component import SimpleComponent
 
 
+class _ChainEnd:
+    """The last component of a chain, shared by every component in the chain."""
+
+    def __init__(self, last: "ChainComponent") -> None:
+        self.last = last
+
+
 class ChainComponent(SimpleComponent):
     """
     The ChainComponent class represents a component in a chain of components.
@@ -18,25 +26,113 @@ class ChainComponent(SimpleComponent):
     def __init__(self, component_spec: ChainComponentSpec, parent: ChainParent) -> None:
         super().__init__(component_spec)
         self.__component_spec: ChainComponentSpec = component_spec
-        self.__next = None
+        self.__next: ChainComponent | None = None
+        self.__previous: ChainComponent | None = None
+        self.__end = _ChainEnd(self)
         self.__parent: ChainParent = parent
         self.__linking_attribute = component_spec.get_linking_attribute()
 
+    def __setstate__(self, state):
+        # Contracts saved before chains were doubly linked get their links back from relink.
+        state.setdefault("_ChainComponent__previous", None)
+        state.setdefault("_ChainComponent__end", None)
+        super().__setstate__(state)
+
     def add_next(self) -> None:
-        """Adds another component to the chain."""
+        """Adds another component to the chain, straight after this one, in O(1)."""
         old_next = self.__next
         new_next = ChainComponent(self.__component_spec.create_blank(), self.__parent)
-        self.set_next(new_next)
-        new_next.set_next(old_next)
+        new_next.__end = self.__end
+        new_next.__previous = self
+        new_next.__next = old_next
+        if old_next is None:
+            self.__end.last = new_next
+        else:
+            old_next.__previous = new_next
+        self.__next = new_next
 
     def set_next(self, next_component: "ChainComponent | None") -> None:
         """
         Sets the next component in the chain.
 
+        The predecessor and last component of the chain are kept in sync. This takes O(1), unless components
+        are cut off from the chain, which then form a chain of their own, or :obj:`next_component` comes from
+        another chain, whose components then join this one.
+
         Args:
             next_component (:obj:`ChainComponent`, optional): The next component in the chain.
         """
+        old_next = self.__next
+        if old_next is not None and old_next.__previous is self:
+            old_next.__previous = None
+        if old_next is not None and old_next.__end is self.__end:
+            # The components up to the new next one are cut off, and no longer end where this chain does.
+            end = _ChainEnd(old_next)
+            current_component: ChainComponent | None = old_next
+            while (
+                current_component is not None
+                and current_component is not next_component
+            ):
+                current_component.__end = end
+                end.last = current_component
+                current_component = current_component.__next
         self.__next = next_component
+        if next_component is None:
+            self.__end.last = self
+            return
+        next_component.__previous = self
+        if next_component.__end is not self.__end:
+            current_component = next_component
+            while current_component is not None:
+                current_component.__end = self.__end
+                self.__end.last = current_component
+                current_component = current_component.__next
+
+    def get_previous(self) -> "ChainComponent | None":
+        """Retrieves the previous component in the chain, in O(1).
+
+        Returns:
+            :obj:`ChainComponent | None` : The previous component in the chain, or None if this is the first.
+        """
+        return self.__previous
+
+    def get_last(self) -> "ChainComponent":
+        """Retrieves the last component of the chain, in O(1).
+
+        Returns:
+            :obj:`ChainComponent` : The last component of the chain this component is in.
+        """
+        return self.__end.last
+
+    def unlink(self) -> None:
+        """
+        Removes this component from its chain in O(1), joining its previous component to its next one.
+
+        Note:
+            The parent of the chain isn't told, use :obj:`delete` if the component could be the first of its
+            chain.
+        """
+        previous_component, next_component = self.__previous, self.__next
+        if previous_component is not None:
+            previous_component.set_next(next_component)
+        elif next_component is not None:
+            next_component.__previous = None
+        self.__previous = None
+        self.__next = None
+        self.__end = _ChainEnd(self)
+
+    def relink(self) -> None:
+        """
+        Rebuilds the previous and last component links of the chain starting at this component.
+        """
+        self.__previous = None
+        self.__end = _ChainEnd(self)
+        current_component = self
+        while current_component.__next is not None:
+            current_component.__next.__previous = current_component
+            current_component.__next.__end = self.__end
+            current_component = current_component.__next
+        self.__end.last = current_component
 
     def get_next(self) -> "ChainComponent | None":
         """Retrieves the next component in the chain.
@@ -48,35 +144,14 @@ class ChainComponent(SimpleComponent):
 
     def delete(self) -> None:
         """
-        Attempts to delete this component from the chain.
+        Attempts to delete this component from the chain in O(1).
 
         Note:
             The object will not be deleted if it is the only component in the chain
             and the parent component has the :obj:`allow_chain_deletion` attribute
             set to True.
         """
-        self.__parent.delete_chain_component(self.get_internal_id())
-
-    def get_chain_component(
-        self, internal_id: int, prev_component: "ChainComponent | None" = None
-    ) -> Tuple:
-        """
-        Gets the predecessor component and the component of a component.
-
-        Args:
-            internal_id (int): The id of the component to search for.
-            prev_component (:obj:`ChainComponent`, optional): The last component checked.
-
-        Returns:
-            :obj:`tuple`: The component with internal id and its predecessor, or None and the last component
-            in the chain if it doesn't exist in the chain.
-        """
-        if internal_id == self.get_internal_id():
-            return prev_component, self
-        next_component = self.get_next()
-        if next_component:
-            return next_component.get_chain_component(internal_id, self)
-        return self, None
+        self.__parent.unlink_chain_component(self)
 
     def get_display_text(self) -> str:
         """
@@ -104,24 +179,59 @@ class ChainComponent(SimpleComponent):
         attributes.append(self.get_attribute(self.__linking_attribute))
         return attributes
 
-    def reset_id(self, id: int, internal_id: int) -> Tuple[int, int]:
+    def get_numbered_components(self) -> List[Component]:
+        """
+        Gets the components that are given display numbers, in the order they are numbered.
+
+        Returns:
+            :obj:`List[Component]`: This component and its subsequent components in the chain.
+        """
+        components: List[Component] = []
+        current_component: ChainComponent | None = self
+        while current_component:
+            components.append(current_component)
+            current_component = current_component.get_next()
+        return components
+
+    def get_last_numbered_component(self) -> Component:
         """
-        Resets the IDs of the component and its subsequent components in the chain.
+        Gets the component numbered last among this component and the ones nested in it, in O(1).
+
+        Returns:
+            :obj:`Component`: The last component of the chain.
+        """
+        return self.get_last()
+
+    def reset_id(self, id: int) -> int:
+        """
+        Resets the display numbers of the component and its subsequent components in the chain.
 
         Args:
-            id (int): The new ID to be set.
-            internal_id (int): The new internal ID to be set.
+            id (int): The new display number to be set.
 
         Returns:
-            The updated ID.
-        """
-        self.set_id(id)
-        self.set_internal_id(internal_id)
-        id += 1
-        internal_id += 1
-        if self.__next:
-            return self.__next.reset_id(id, internal_id)
-        return id, internal_id
+            int: The next available display number.
+        """
+        current_component: ChainComponent | None = self
+        while current_component is not None:
+            current_component.set_id(id)
+            id += 1
+            current_component = current_component.__next
+        return id
+
+    def _rebind(self, component_spec) -> List[Tuple[Component, str]]:
+        assert isinstance(component_spec, ChainComponentSpec)
+        problems = super()._rebind(component_spec)
+        self.__component_spec = component_spec
+        self.__linking_attribute = component_spec.get_linking_attribute()
+        if self.__previous is not None:
+            return problems
+        # The first component rebinds the rest of the chain, so that long chains don't recurse.
+        current_component = self.__next
+        while current_component is not None:
+            problems += current_component.rebind(component_spec)
+            current_component = current_component.__next
+        return problems
 
     def to_cola(self):
         """
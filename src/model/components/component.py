@@ -8,6 +8,7 @@ from typing import List, Tuple
 
 from src.model.component_specifications.component_spec import ComponentSpec
 from src.model.form_spec import FormSpec
+from src.model.order_statistic_list import OrderStatisticList
 
 
 class Component(ABC):
@@ -24,6 +25,14 @@ class Component(ABC):
         self._form = self._forms[0]
         self._component_type = component_spec.get_component_type()
         self._component_location = component_spec.get_location()
+        self._component_name = component_spec.get_name()
+        self._numbering: OrderStatisticList | None = None
+
+    def __setstate__(self, state):
+        # Contracts saved before components could be rebound don't store the name of their spec.
+        state.setdefault("_component_name", None)
+        state.setdefault("_numbering", None)
+        self.__dict__.update(state)
 
     @abstractmethod
     def get_display_text(self) -> str:
@@ -36,15 +45,34 @@ class Component(ABC):
         pass
 
     @abstractmethod
-    def reset_id(self, id: int, internal_id: int) -> Tuple[int, int]:
-        """Resets the id (internal and non-internal) of the component.
+    def reset_id(self, id: int) -> int:
+        """Resets the display number of the component.
+
+        The internal id of the component is permanent and isn't changed.
 
         Args:
-            id (int): The new identifier of the component.
-            internal_id (int): The new internal identifier of the component.
+            id (int): The new display number of the component.
+
+        Returns:
+             int: The next available display number.
+        """
+        pass
+
+    @abstractmethod
+    def get_numbered_components(self) -> List["Component"]:
+        """Gets the components that are given display numbers, in the order they are numbered.
+
+        Returns:
+            :obj:`List[Component]`: This component and the components nested in it that have display numbers.
+        """
+        pass
+
+    @abstractmethod
+    def get_last_numbered_component(self) -> "Component":
+        """Gets the component numbered last among this component and the components nested in it.
 
         Returns:
-             :obj:`tuple` of :obj:`[int, int]`: The next values of the next available unique id and internal id.
+            :obj:`Component`: The last component of :obj:`get_numbered_components`.
         """
         pass
 
@@ -64,7 +92,7 @@ class Component(ABC):
         Returns:
             str: The textual form of this component's ID in the form [ID].
         """
-        return f"[{self._id}]"
+        return f"[{self.get_id()}]"
 
     def set_form(self, component_form: str) -> None:
         """
@@ -102,6 +130,20 @@ class Component(ABC):
         """
         return self._forms
 
+    def get_id(self) -> int:
+        """
+        Gets the id of the component, as shown to the user.
+
+        The id of a component in a contract is its position in the contract's numbering, which is found in
+        O(log n).
+
+        Returns:
+            int: The id of the component.
+        """
+        if self._numbering is not None and self in self._numbering:
+            return self._numbering.index(self)
+        return self._id
+
     def get_internal_id(self) -> int:
         """
         Gets the internal id of the component.
@@ -115,6 +157,8 @@ class Component(ABC):
         """
         Sets the internal_id of the component.
 
+        Internal ids are permanent, the contract sets them once when the component is added to it.
+
         Args:
             id (int): The value to set the internal id to.
         """
@@ -129,6 +173,66 @@ class Component(ABC):
         """
         self._id = id
 
+    def set_numbering(self, numbering: OrderStatisticList | None) -> None:
+        """
+        Sets the numbering the id of the component is taken from.
+
+        Args:
+            numbering (:obj:`OrderStatisticList`, optional): The numbered components of the contract, or None
+                to use the id set with :obj:`set_id`.
+        """
+        self._numbering = numbering
+
+    def get_spec_name(self) -> str | None:
+        """
+        Gets the name of the specification the component was built from.
+
+        Returns:
+            str | None: The name of the component's specification, or None if it was saved without one.
+        """
+        return self._component_name
+
+    def rebind(self, component_spec: ComponentSpec) -> List[Tuple["Component", str]]:
+        """
+        Rebinds the component, and the components nested in it, to a new version of its specification.
+
+        The current form is kept if the new specification still has it, otherwise the first form is used.
+
+        Args:
+            component_spec (:obj:`ComponentSpec`): The new specification of the component.
+
+        Returns:
+            :obj:`List[Tuple[Component, str]]`: The components that no longer conform to their
+            specification, each with a description of the problem.
+        """
+        if component_spec.get_component_type() != self._component_type:
+            return [
+                (
+                    self,
+                    f"{component_spec.get_name()} is now a {component_spec.get_component_type()}, "
+                    f"not a {self._component_type}.",
+                )
+            ]
+        problems: List[Tuple[Component, str]] = []
+        form_name = self._form.get_name()
+        self._forms = component_spec.get_forms()
+        self._component_location = component_spec.get_location()
+        self._component_name = component_spec.get_name()
+        try:
+            self._form = self._get_form_spec(form_name)
+        except ValueError:
+            self._form = self._forms[0]
+            problems.append(
+                (
+                    self,
+                    f"Form {form_name} no longer exists, it was changed to {self._form.get_name()}.",
+                )
+            )
+        return problems + self._rebind(component_spec)
+
+    def _rebind(self, component_spec: ComponentSpec) -> List[Tuple["Component", str]]:
+        return []
+
     def _get_form_spec(self, component_form: str) -> FormSpec:
         for type_spec in self._forms:
             if type_spec.get_name() == component_form:
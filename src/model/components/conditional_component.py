@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from src.model.chain_parent import ChainParent
 from src.model.component_specifications.conditional_component_spec import \
@@ -54,29 +54,68 @@ class ConditionalComponent(Component, ChainParent):
         """Returns nothing as this component has no display text."""
         return ""
 
-    def reset_id(self, id: int, internal_id: int) -> Tuple[int, int]:
+    def get_numbered_components(self) -> List[Component]:
         """
-        Resets the ID of the component and its subsequent components in the chain.
+        Gets the components nested in this component, in the order they are numbered.
+
+        Returns:
+            :obj:`List[Component]`: The chains of the result and the condition, in the order of the form.
+        """
+        current_type = self.get_form().get_name()
+        if current_type == "if":
+            return (
+                self.__result_component.get_numbered_components()
+                + self.__condition_component.get_numbered_components()
+            )
+        elif current_type == "if then":
+            return (
+                self.__condition_component.get_numbered_components()
+                + self.__result_component.get_numbered_components()
+            )
+        raise ValueError(f"Conditional component has invalid type: {current_type}")
+
+    def get_last_numbered_component(self) -> Component:
+        """
+        Gets the component numbered last among the components nested in this component, in O(1).
+
+        Returns:
+            :obj:`Component`: The last component of the chain numbered last.
+        """
+        if self.get_form().get_name() == "if then":
+            return self.__result_component.get_last()
+        return self.__condition_component.get_last()
+
+    def reset_id(self, id: int) -> int:
+        """
+        Resets the display numbers of the components nested in this component.
 
         Args:
-            id (int): The new ID to be set.
+            id (int): The new display number to be set.
 
         Returns:
-            int: The updated ID.
+            int: The next available display number.
         """
-        self.set_internal_id(internal_id)
-        internal_id += 1
         current_type = self.get_form().get_name()
         if current_type == "if":
-            id, internal_id = self.__result_component.reset_id(id, internal_id)
-            return self.__condition_component.reset_id(id, internal_id)
+            id = self.__result_component.reset_id(id)
+            return self.__condition_component.reset_id(id)
         elif current_type == "if then":
-            id, internal_id = self.__condition_component.reset_id(id, internal_id)
-            return self.__result_component.reset_id(id, internal_id)
+            id = self.__condition_component.reset_id(id)
+            return self.__result_component.reset_id(id)
         raise ValueError(f"Conditional component has invalid type: {current_type}")
 
-    def delete_chain_component(self, id):
-        super().delete_chain_component(id)
+    def _replace_child(self, child, new_child) -> None:
+        super()._replace_child(child, new_child)
+        if child is self.__condition_component:
+            self.__condition_component = new_child
+        elif child is self.__result_component:
+            self.__result_component = new_child
+
+    def _rebind(self, component_spec) -> List[Tuple[Component, str]]:
+        assert isinstance(component_spec, ConditionalComponentSpec)
+        return self.__condition_component.rebind(
+            component_spec.get_condition_spec()
+        ) + self.__result_component.rebind(component_spec.get_result_spec())
 
     def to_cola(self) -> str:
         """
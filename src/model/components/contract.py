@@ -1,14 +1,23 @@
-from typing import Dict, List, Type
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Type
 
 from src.model.chain_parent import ChainParent
+from src.model.component_attribute import ComponentAttribute
 from src.model.component_collection import ComponentCollection
 from src.model.component_specifications.chain_component_spec import \
     ChainComponentSpec
 from src.model.component_specifications.component_spec import ComponentSpec
 from src.model.components.chain_component import ChainComponent
 from src.model.components.component import Component
+from src.model.components.conditional_component import ConditionalComponent
 from src.model.components.simple_component import SimpleComponent
 from src.model.constants import Constants
+from src.model.order_statistic_list import OrderStatisticList
+from src.model.terminal_types.hybrid_terminal import HybridTerminal
+from src.model.terminal_types.text_terminal import TextTerminal
+from src.parser.batch_validator import BatchValidator
+from src.parser.cola_verifier import ColaVerifier
+from src.parser.validation_result import ValidationResult
 
 
 class Contract(ChainParent):
@@ -29,6 +38,34 @@ class Contract(ChainParent):
         self.__component_collections: List[ComponentCollection] = component_collections
         self.__component_types: Dict[str, Type[Component]] = component_types
         self.__path: str = ""
+        # Maps the internal id of every component to the component, the parent of its chain and its collection.
+        self.__index: Dict[
+            int, Tuple[Component, ChainParent | None, ComponentCollection]
+        ] = dict()
+        self.__index_stale: bool = False
+        self.__next_internal_id: int = 0
+        # The components with display numbers, in order, so that their numbers follow edits in O(log n).
+        self.__numbering: OrderStatisticList = OrderStatisticList()
+        self._build_numbering()
+
+    def __setstate__(self, state):
+        # Contracts saved before the index existed build it on their first lookup.
+        if "_Contract__index" not in state:
+            state["_Contract__index"] = dict()
+            state["_Contract__index_stale"] = True
+        self.__dict__.update(state)
+        if "_Contract__next_internal_id" not in state:
+            # Their internal ids are those of their last renumbering, which are unique and kept.
+            self.__next_internal_id = 1 + max(
+                (component.get_internal_id() for component in self._get_components()),
+                default=-1,
+            )
+        if "_Contract__numbering" not in state:
+            self._build_numbering()
+        # Chains are visited from their first component, which links the rest of the chain to it.
+        for component in self._get_components():
+            if isinstance(component, ChainComponent) and not component.get_previous():
+                component.relink()
 
     def delete_component(self, component_id: int) -> None:
         """
@@ -40,13 +77,19 @@ class Contract(ChainParent):
         Raises:
             ValueError: If there doesn't exist a component with id :obj:`component_id`.
         """
-        for component_collection in self.__component_collections:
-            if component_collection.contains_component(component_id):
-                component_collection.delete_component(component_id)
-                return
-        raise ValueError(
-            f"Tried to delete component with id {component_id} but it doesn't exist."
+        component, parent, component_collection = self._get_index_entry(
+            component_id,
+            f"Tried to delete component with id {component_id} but it doesn't exist.",
         )
+        component_count = component_collection.get_component_count()
+        component_collection.delete_component(component_id)
+        if component_collection.get_component_count() == component_count:
+            # Only whole components can be deleted from a collection, not the ones nested in them.
+            return
+        if parent is self:
+            self.remove_child(component)
+        self._unindex_component(component)
+        self._unnumber(component.get_numbered_components())
 
     def get_component(self, component_id: int) -> Component:
         """
@@ -61,12 +104,11 @@ class Contract(ChainParent):
         Raises:
             ValueError: If there doesn't exist a component with id :obj:`component_id`.
         """
-        for component_collection in self.__component_collections:
-            if component_collection.contains_component(component_id):
-                return component_collection.get_component(component_id)
-        raise ValueError(
-            f"Tried to delete component with id {component_id} but it doesn't exist."
+        component, _, _ = self._get_index_entry(
+            component_id,
+            f"Tried to get component with id {component_id} but it doesn't exist.",
         )
+        return component
 
     def update_component(self, component_id: int, **kwargs) -> None:
         """
@@ -79,13 +121,37 @@ class Contract(ChainParent):
             AssertionError: If the component did not have attributes to update - it isn't an instance of :obj:`SimpleComponent`.
             ValueError: If there doesn't exist a component with id :obj:`component_id`.
         """
-        for component_collection in self.__component_collections:
-            if component_collection.contains_component(component_id):
-                component = component_collection.get_component(component_id)
-                assert isinstance(component, SimpleComponent)
-                component.update(**kwargs)
-                return
-        raise ValueError(f"This statement does not exist! {component_id}")
+        component, _, _ = self._get_index_entry(
+            component_id, f"This statement does not exist! {component_id}"
+        )
+        assert isinstance(component, SimpleComponent)
+        component.update(**kwargs)
+
+    def change_component_form(self, component_id: int, component_form: str) -> None:
+        """
+        Changes the form of a component in the contract.
+
+        Changing the form of a conditional component changes the order its condition and result are numbered in.
+
+        Args:
+            component_id (int): The id of the component.
+            component_form (str): The name of the new form of the component.
+
+        Raises:
+            ValueError: If there doesn't exist a component with id :obj:`component_id`.
+        """
+        component, _, _ = self._get_index_entry(
+            component_id,
+            f"Tried to change component with id {component_id} but it doesn't exist.",
+        )
+        if not isinstance(component, ConditionalComponent):
+            component.set_form(component_form)
+            return
+        numbered_components = component.get_numbered_components()
+        index = self.__numbering.index(numbered_components[0])
+        self._unnumber(numbered_components)
+        component.set_form(component_form)
+        self._number(component.get_numbered_components(), index)
 
     def add_component(self, component_spec: ComponentSpec) -> None:
         """
@@ -104,7 +170,62 @@ class Contract(ChainParent):
             self.add_child(component)
         else:
             component = component_type(component_spec)
+        last_numbered_component = self._get_last_numbered_component(
+            component_collection
+        )
+        self._index_component(
+            component,
+            self if isinstance(component, ChainComponent) else None,
+            component_collection,
+        )
         component_collection.add_component(component)
+        index = (
+            0
+            if last_numbered_component is None
+            else self.__numbering.index(last_numbered_component) + 1
+        )
+        self._number(component.get_numbered_components(), index)
+
+    def get_numbered_component(self, number: int) -> Component:
+        """
+        Gets the component shown to the user with a display number, in O(log n).
+
+        Args:
+            number (int): The display number of the component.
+
+        Returns:
+            :obj:`Component`: The component numbered :obj:`number`.
+
+        Raises:
+            ValueError: If no component is numbered :obj:`number`.
+        """
+        if not 0 <= number < len(self.__numbering):
+            raise ValueError(
+                f"Tried to get component number {number} but it doesn't exist."
+            )
+        return self.__numbering[number]
+
+    def extend_chain_component(self, component_id: int) -> None:
+        """
+        Adds another component to a chain after the given component.
+
+        Args:
+            component_id (int): The id of the chain component to extend.
+
+        Raises:
+            AssertionError: If the component isn't an instance of :obj:`ChainComponent`.
+            ValueError: If there doesn't exist a component with id :obj:`component_id`.
+        """
+        component, parent, component_collection = self._get_index_entry(
+            component_id,
+            f"Tried to extend component with id {component_id} but it doesn't exist.",
+        )
+        assert isinstance(component, ChainComponent)
+        component.add_next()
+        new_component = component.get_next()
+        assert new_component is not None
+        self._assign_internal_id(new_component, parent, component_collection)
+        self._number([new_component], self.__numbering.index(component) + 1)
 
     def get_component_collections(self) -> List[ComponentCollection]:
         """
@@ -143,33 +264,62 @@ class Contract(ChainParent):
 
     def reset_ids(self) -> None:
         """
-        Reset the IDs of all components in the contract.
+        Renumbers all components in the contract from scratch.
+
+        Edits made through the contract keep the display numbers up to date, so this is only needed after the
+        components were changed directly. Internal ids are assigned once, when a component is added to the
+        contract, and aren't changed.
         """
-        current_id = 0
-        current_internal_id = 0
-        for component_collection in self.__component_collections:
-            for component in component_collection.get_components():
-                current_id, current_internal_id = component.reset_id(
-                    current_id, current_internal_id
-                )
+        self._build_numbering()
 
     def delete_chain_component(self, id: int):
         """
         Deletes a chain component from its chain.
 
+        Chains nested in other components are deleted from through their parent. Deleting them through the
+        contract rather than :obj:`ChainComponent.delete` keeps the contract's index and numbering up to
+        date.
+
         Args:
             id: The id of the component to be deleted.
         """
-        new_first_element = super().delete_chain_component(id)
-        if new_first_element:
-            component_collection_name = new_first_element.get_location()
-            component_collection = self._get_component_collection(
-                component_collection_name
-            )
-            component_collection.replace_component(new_first_element, id)
-        else:
-            self.delete_component(id)
-        self.reset_ids()
+        component, parent, _ = self._get_index_entry(
+            id, f"Tried to delete component with id {id} but it doesn't exist."
+        )
+        assert isinstance(component, ChainComponent)
+        assert isinstance(parent, ChainParent)
+        # The parent of the chain, which may be another component, decides whether it can be deleted.
+        if parent.unlink_chain_component(component) and parent is not self:
+            self.__index.pop(id, None)
+            self._unnumber([component])
+
+    def unlink_chain_component(self, component) -> bool:
+        """
+        Removes a component from one of the chains at the top level of the contract in O(1).
+
+        Args:
+            component (:obj:`ChainComponent`): The component to remove.
+
+        Returns:
+            bool: True, as chains at the top level of the contract can always be deleted.
+        """
+        id = component.get_internal_id()
+        _, _, component_collection = self._get_index_entry(
+            id, f"Tried to delete component with id {id} but it doesn't exist."
+        )
+        next_component = component.get_next()
+        is_first = component.get_previous() is None
+        if not super().unlink_chain_component(component):
+            return False
+        if is_first:
+            # The collection holds the first component of every chain in it.
+            if next_component:
+                component_collection.replace_component(next_component, id)
+            else:
+                component_collection.delete_component(id)
+        self.__index.pop(id, None)
+        self._unnumber([component])
+        return True
 
     def to_cola(self) -> str:
         """
@@ -183,3 +333,279 @@ class Contract(ChainParent):
             components = component_collection.get_components()
             component_texts += [component.to_cola() for component in components]
         return f"\n{Constants.COMPONENT_JOINER}\n".join(component_texts)
+
+    def validate_all(
+        self, batch_validator: BatchValidator | None = None
+    ) -> Dict[Tuple[int, str], ValidationResult]:
+        """
+        Validates the text and hybrid attributes of every component in the contract.
+
+        Values are grouped by terminal and each distinct value is only validated once.
+
+        Args:
+            batch_validator (:obj:`BatchValidator`, optional): The validator to spread the work with.
+
+        Returns:
+            :obj:`Dict[Tuple[int, str], ValidationResult]`: The result of validating each attribute, keyed by
+            the internal id of its component and the attribute's name.
+        """
+        if batch_validator is None:
+            with BatchValidator() as batch_validator:
+                return self.validate_all(batch_validator)
+        attributes_by_terminal: Dict[int, List[Tuple[int, ComponentAttribute]]] = (
+            dict()
+        )
+        for component in self._get_simple_components():
+            for attribute in component.get_current_attributes():
+                if isinstance(attribute.get_terminal(), (TextTerminal, HybridTerminal)):
+                    attributes_by_terminal.setdefault(
+                        id(attribute.get_terminal()), []
+                    ).append((component.get_internal_id(), attribute))
+        results = dict()
+        for attributes in attributes_by_terminal.values():
+            terminal = attributes[0][1].get_terminal()
+            assert isinstance(terminal, (TextTerminal, HybridTerminal))
+            values = [
+                self._get_validated_value(attribute) for _, attribute in attributes
+            ]
+            terminal_results = terminal.validate_many(values, batch_validator)
+            for (component_id, attribute), value in zip(attributes, values):
+                results[(component_id, attribute.get_name())] = terminal_results[value]
+        return results
+
+    def verify_cola(
+        self, cola_verifier: ColaVerifier
+    ) -> Dict[int | None, ValidationResult]:
+        """
+        Verifies the CoLa form of the contract against the grammar.
+
+        Args:
+            cola_verifier (:obj:`ColaVerifier`): The verifier to check the CoLa with.
+
+        Returns:
+            :obj:`Dict[int | None, ValidationResult]`: The failures, keyed by the internal id of the component
+            the error is in, or None if it can't be traced back to a component.
+        """
+        return {
+            (
+                self.__numbering[component_id].get_internal_id()
+                if component_id is not None
+                and 0 <= component_id < len(self.__numbering)
+                else None
+            ): result
+            for component_id, result in cola_verifier.verify(self.to_cola()).items()
+        }
+
+    def rebind(
+        self,
+        component_specs: Dict[str, ComponentSpec],
+        component_collections: List[ComponentCollection],
+    ) -> Dict[int, List[str]]:
+        """
+        Rebinds the contract to a reloaded spec.
+
+        Every component is rebound to the component spec of the same name, keeping the values of its attributes.
+        Collections are matched by name, and collections the spec no longer has are kept while they hold components.
+
+        Args:
+            component_specs (:obj:`Dict[str, ComponentSpec]`): The component specs of the reloaded spec.
+            component_collections (:obj:`List[ComponentCollection]`): The component collections of the reloaded spec.
+
+        Returns:
+            :obj:`Dict[int, List[str]]`: The problems of the components that no longer conform to the spec,
+            keyed by their internal id.
+        """
+        problems: List[Tuple[Component, str]] = []
+        old_collections = {
+            component_collection.get_name(): component_collection
+            for component_collection in self.__component_collections
+        }
+        new_collections = [
+            old_collections.pop(component_collection.get_name(), component_collection)
+            for component_collection in component_collections
+        ]
+        for component_collection in old_collections.values():
+            if not component_collection.get_component_count():
+                continue
+            new_collections.append(component_collection)
+            problems += [
+                (
+                    component,
+                    f"The collection {component_collection.get_name()} no longer exists.",
+                )
+                for component in component_collection.get_components()
+            ]
+        self.__component_collections = new_collections
+        for component_collection in self.__component_collections:
+            for component in component_collection.get_components():
+                component_spec = component_specs.get(component.get_spec_name() or "")
+                if component_spec is None:
+                    problems.append(
+                        (component, f"{component.get_spec_name()} is not in the spec.")
+                    )
+                    continue
+                if component_spec.get_location() != component_collection.get_name():
+                    problems.append(
+                        (
+                            component,
+                            f"{component_spec.get_name()} now belongs in {component_spec.get_location()}.",
+                        )
+                    )
+                problems += component.rebind(component_spec)
+        self.reset_ids()
+        report: Dict[int, List[str]] = dict()
+        for component, problem in problems:
+            report.setdefault(component.get_internal_id(), []).append(problem)
+        return report
+
+    def _build_numbering(self) -> None:
+        self.__numbering = OrderStatisticList()
+        self._number(
+            [
+                numbered_component
+                for component_collection in self.__component_collections
+                for component in component_collection.get_components()
+                for numbered_component in component.get_numbered_components()
+            ],
+            0,
+        )
+
+    def _number(self, components: List[Component], index: int) -> None:
+        self.__numbering.insert(index, components)
+        for component in components:
+            component.set_numbering(self.__numbering)
+
+    def _unnumber(self, components: List[Component]) -> None:
+        for component in components:
+            self.__numbering.remove(component)
+            component.set_numbering(None)
+
+    def _get_last_numbered_component(
+        self, component_collection: ComponentCollection
+    ) -> Component | None:
+        # The component numbered last among this collection and the ones before it.
+        last_component = None
+        for current_collection in self.__component_collections:
+            component_count = current_collection.get_component_count()
+            if component_count:
+                last_component = current_collection.get_component_at(
+                    component_count - 1
+                )
+            if current_collection is component_collection:
+                break
+        if last_component is None:
+            return None
+        return last_component.get_last_numbered_component()
+
+    def _get_index_entry(
+        self, component_id: int, error_message: str
+    ) -> Tuple[Component, ChainParent | None, ComponentCollection]:
+        if self.__index_stale:
+            self._build_index()
+        if component_id not in self.__index:
+            raise ValueError(error_message)
+        return self.__index[component_id]
+
+    def _build_index(self) -> None:
+        self.__index = dict()
+        for component_collection in self.__component_collections:
+            for component in component_collection.get_components():
+                parent = self if isinstance(component, ChainComponent) else None
+                for nested_component, nested_parent in self._get_nested_components(
+                    component, parent
+                ):
+                    self.__index[nested_component.get_internal_id()] = (
+                        nested_component,
+                        nested_parent,
+                        component_collection,
+                    )
+        self.__index_stale = False
+
+    def _index_component(
+        self,
+        component: Component,
+        parent: ChainParent | None,
+        component_collection: ComponentCollection,
+    ) -> None:
+        for nested_component, nested_parent in self._get_nested_components(
+            component, parent
+        ):
+            self._assign_internal_id(
+                nested_component, nested_parent, component_collection
+            )
+
+    def _assign_internal_id(
+        self,
+        component: Component,
+        parent: ChainParent | None,
+        component_collection: ComponentCollection,
+    ) -> None:
+        if self.__index_stale:
+            self._build_index()
+        component.set_internal_id(self.__next_internal_id)
+        self.__index[self.__next_internal_id] = (
+            component,
+            parent,
+            component_collection,
+        )
+        self.__next_internal_id += 1
+
+    def _unindex_component(self, component: Component) -> None:
+        for nested_component, _ in self._get_nested_components(component, None):
+            self.__index.pop(nested_component.get_internal_id(), None)
+
+    @staticmethod
+    def _get_nested_components(
+        component: Component, parent: ChainParent | None
+    ) -> List[Tuple[Component, ChainParent | None]]:
+        nested_components: List[Tuple[Component, ChainParent | None]] = []
+        to_visit: List[Tuple[Component | None, ChainParent | None]] = [
+            (component, parent)
+        ]
+        while to_visit:
+            current_component, current_parent = to_visit.pop()
+            if current_component is None:
+                continue
+            nested_components.append((current_component, current_parent))
+            if isinstance(current_component, ChainComponent):
+                to_visit.append((current_component.get_next(), current_parent))
+            if isinstance(current_component, ChainParent):
+                # Pushed in reverse so that the children are visited in order.
+                to_visit += [
+                    (child, current_component)
+                    for child in reversed(current_component.get_children())
+                ]
+        return nested_components
+
+    def _get_simple_components(self) -> List[SimpleComponent]:
+        return [
+            component
+            for component in self._get_components()
+            if isinstance(component, SimpleComponent)
+        ]
+
+    def _get_components(self) -> List[Component]:
+        components = []
+        to_visit: Deque[Component | None] = deque(
+            component
+            for component_collection in self.__component_collections
+            for component in component_collection.get_components()
+        )
+        while to_visit:
+            component = to_visit.popleft()
+            if component is None:
+                continue
+            components.append(component)
+            if isinstance(component, ChainComponent):
+                to_visit.append(component.get_next())
+            if isinstance(component, ChainParent):
+                to_visit += component.get_children()
+        return components
+
+    @staticmethod
+    def _get_validated_value(attribute: ComponentAttribute) -> str:
+        value = attribute.get_raw_value()
+        if isinstance(value, tuple):
+            option, text = value
+            return text if option == HybridTerminal.CUSTOM_OPTION else option
+        return value
@@ -1,8 +1,9 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from src.model.component_specifications.else_conditional_component_spec import \
     ElseConditionalComponentSpec
 from src.model.components.chain_component import ChainComponent
+from src.model.components.component import Component
 from src.model.components.conditional_component import ConditionalComponent
 
 
@@ -17,7 +18,7 @@ class ElseConditionalComponent(ConditionalComponent):
         get_result(): Retrieves the result component.
         get_condition(): Retrieves the condition component.
         get_display_text(): Retrieves the display text of the component.
-        reset_id(id): Resets the ID of the component and its subsequent components.
+        reset_id(id): Resets the display numbers of the nested components.
 
     Attributes:
         Inherits all attributes from the Component class.
@@ -43,18 +44,49 @@ class ElseConditionalComponent(ConditionalComponent):
         """Retrieves the result component."""
         return self.__else_component
 
-    def reset_id(self, id: int, internal_id: int) -> Tuple[int, int]:
+    def get_numbered_components(self) -> List[Component]:
         """
-        Resets the ID of the component and its subsequent components in the chain.
+        Gets the components nested in this component, in the order they are numbered.
+
+        Returns:
+            :obj:`List[Component]`: The chains of the conditional, followed by the chain of the else.
+        """
+        return (
+            super().get_numbered_components()
+            + self.__else_component.get_numbered_components()
+        )
+
+    def get_last_numbered_component(self) -> Component:
+        """
+        Gets the component numbered last among the components nested in this component, in O(1).
+
+        Returns:
+            :obj:`Component`: The last component of the chain of the else.
+        """
+        return self.__else_component.get_last()
+
+    def reset_id(self, id: int) -> int:
+        """
+        Resets the display numbers of the components nested in this component.
 
         Args:
-            id (int): The new ID to be set.
+            id (int): The new display number to be set.
 
         Returns:
-            int: The updated ID.
+            int: The next available display number.
         """
-        id, internal_id = super().reset_id(id, internal_id)
-        return self.__else_component.reset_id(id, internal_id)
+        id = super().reset_id(id)
+        return self.__else_component.reset_id(id)
+
+    def _replace_child(self, child, new_child) -> None:
+        super()._replace_child(child, new_child)
+        if child is self.__else_component:
+            self.__else_component = new_child
+
+    def _rebind(self, component_spec) -> List[Tuple[Component, str]]:
+        assert isinstance(component_spec, ElseConditionalComponentSpec)
+        problems = super()._rebind(component_spec)
+        return problems + self.__else_component.rebind(component_spec.get_else_spec())
 
     def to_cola(self) -> str:
         text = super().to_cola()
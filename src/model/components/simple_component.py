@@ -106,19 +106,64 @@ class SimpleComponent(Component):
         ]
         return f"{self.get_textual_id()} {format_string.format(*format_params)}"
 
-    def reset_id(self, id: int, internal_id: int) -> Tuple[int, int]:
+    def get_numbered_components(self) -> List[Component]:
         """
-        Reset the ID of the component.
+        Gets the components that are given display numbers.
+
+        Returns:
+            :obj:`List[Component]`: Only this component.
+        """
+        return [self]
+
+    def get_last_numbered_component(self) -> Component:
+        """
+        Gets the component numbered last among this component and the ones nested in it.
+
+        Returns:
+            :obj:`Component`: This component.
+        """
+        return self
+
+    def reset_id(self, id: int) -> int:
+        """
+        Reset the display number of the component.
 
         Args:
-            id (int): The new ID to be set.
+            id (int): The new display number to be set.
 
         Returns:
-            :obj:`Tuple[int, int]`: The updated ID.
+            int: The next available display number.
         """
         self.set_id(id)
-        self.set_internal_id(internal_id)
-        return id + 1, internal_id + 1
+        return id + 1
+
+    def _rebind(self, component_spec) -> List[Tuple[Component, str]]:
+        # Values are carried over by attribute name, attributes the spec no longer has are dropped.
+        assert isinstance(component_spec, SimpleComponentSpec)
+        problems: List[Tuple[Component, str]] = []
+        old_attributes = {
+            attribute.get_name(): attribute for attribute in self.__attributes
+        }
+        self.__attributes = []
+        for spec_attribute in component_spec.get_attributes():
+            attribute = spec_attribute.create_blank()
+            old_attribute = old_attributes.pop(attribute.get_name(), None)
+            if old_attribute is not None:
+                attribute.set_value(old_attribute.get_raw_value())
+                if not attribute.is_valid():
+                    problems.append(
+                        (
+                            self,
+                            f"{attribute.get_name()} is {attribute.get_raw_value()!r}, which is not a valid "
+                            f"{attribute.get_terminal().get_name()}.",
+                        )
+                    )
+            self.__attributes.append(attribute)
+        problems += [
+            (self, f"{name} was removed from {component_spec.get_name()}.")
+            for name in old_attributes
+        ]
+        return problems
 
     def _get_component_value(self, component_key: str) -> str | Tuple:
         attribute = self.get_attribute(component_key)
@@ -2,10 +2,11 @@ import pickle
 from typing import Dict, List, Type
 
 from src.model.component_collection import ComponentCollection
-from src.model.components.chain_component import ChainComponent
+from src.model.component_specifications.component_spec import ComponentSpec
 from src.model.components.component import Component
 from src.model.components.contract import Contract
 from src.model.components.simple_component import SimpleComponent
+from src.parser.cola_verifier import ColaVerifier
 
 
 class Model:
@@ -19,6 +20,7 @@ class Model:
         delete_component(component_id): Deletes a component from the contract.
         add_component(component_spec): Adds a component to the contract.
         extend_chain_component(component): Extends a chain component in the contract.
+        delete_chain_component(component_id): Deletes a chain component from its chain.
         get_contract(): Retrieves the current contract.
         save_contract_file(path): Saves the current contract to a file.
         open_contract_file(path): Loads a contract from a file.
@@ -29,6 +31,7 @@ class Model:
         self,
         component_collections: List[ComponentCollection],
         component_spec_pairs: Dict[str, Type[Component]],
+        cola_verifier: ColaVerifier | None = None,
     ) -> None:
         """
         Initializes a Model object.
@@ -36,9 +39,11 @@ class Model:
         Args:
             component_collections (List[ComponentCollection]): A list of component collections.
             component_spec_pairs (List[ComponentSpecPair]): A list of component specification pairs.
+            cola_verifier (ColaVerifier, optional): The verifier to check exported CoLa with.
         """
         self.__component_collections: List[ComponentCollection] = component_collections
         self.__component_spec_pairs: Dict[str, Type[Component]] = component_spec_pairs
+        self.__cola_verifier = cola_verifier
         self.create_new_contract()
 
     def change_component_form(self, component_id, component_form):
@@ -49,9 +54,7 @@ class Model:
             component: The component whose type will be changed.
             component_type: The new type of the component.
         """
-        component = self.__contract.get_component(component_id)
-        component.set_form(component_form)
-        self.reset_ids()
+        self.__contract.change_component_form(component_id, component_form)
 
     def update_component(self, component_id, update_dict):
         """
@@ -64,7 +67,6 @@ class Model:
         component = self.__contract.get_component(component_id)
         assert isinstance(component, SimpleComponent)
         component.update(**update_dict)
-        self.reset_ids()
 
     def delete_component(self, component_id):
         """
@@ -74,7 +76,6 @@ class Model:
             component_id: The ID of the component to be deleted.
         """
         self.__contract.delete_component(component_id)
-        self.__contract.reset_ids()
 
     def add_component(self, component_spec):
         """
@@ -84,7 +85,6 @@ class Model:
             component_spec: The component specification to be added.
         """
         self.__contract.add_component(component_spec)
-        self.__contract.reset_ids()
 
     def extend_chain_component(self, component_id):
         """
@@ -93,10 +93,16 @@ class Model:
         Args:
             component: The chain component to be extended.
         """
-        component = self.__contract.get_component(component_id)
-        assert isinstance(component, ChainComponent)
-        component.add_next()
-        self.__contract.reset_ids()
+        self.__contract.extend_chain_component(component_id)
+
+    def delete_chain_component(self, component_id):
+        """
+        Deletes a chain component from its chain.
+
+        Args:
+            component_id: The ID of the chain component to be deleted.
+        """
+        self.__contract.delete_chain_component(component_id)
 
     def get_contract(self) -> Contract:
         """
@@ -151,6 +157,9 @@ class Model:
         """
         Exports the contract to CoLa and saves it.
 
+        If the model has a CoLa verifier, the exported CoLa is also checked against the grammar and every
+        component that doesn't conform is reported.
+
         Args:
             path (str): The file path to save the CoLa to.
         """
@@ -160,6 +169,44 @@ class Model:
                 file.write(cola)
         except Exception as e:
             print(f"Error exporting to contract: {e}")
+            return
+        if self.__cola_verifier is not None:
+            for internal_id, result in self.verify_cola().items():
+                print(
+                    f"Exported CoLa of component {internal_id} does not conform to the grammar, "
+                    f"the error is at character {result.get_position()}."
+                )
+
+    def verify_cola(self):
+        """
+        Verifies the CoLa form of the current contract against the grammar.
+
+        Returns:
+            Dict[int | None, ValidationResult]: The failures, keyed by the internal id of the component they
+            are in. There are none if the model has no CoLa verifier.
+        """
+        if self.__cola_verifier is None:
+            return dict()
+        return self.__contract.verify_cola(self.__cola_verifier)
+
+    def rebind(
+        self,
+        component_collections: List[ComponentCollection],
+        component_specs: Dict[str, ComponentSpec],
+    ) -> Dict[int, List[str]]:
+        """
+        Rebinds the current contract to a reloaded spec.
+
+        Args:
+            component_collections (List[ComponentCollection]): The component collections of the reloaded spec.
+            component_specs (Dict[str, ComponentSpec]): The component specifications of the reloaded spec.
+
+        Returns:
+            Dict[int, List[str]]: The problems of the components that no longer conform to the spec, keyed by
+            their internal id.
+        """
+        self.__component_collections = component_collections
+        return self.__contract.rebind(component_specs, component_collections)
 
     def reset_ids(self):
         self.__contract.reset_ids()
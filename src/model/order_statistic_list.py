@@ -0,0 +1,221 @@
+import random
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class _Node:
+    __slots__ = ("item", "priority", "size", "left", "right", "parent")
+
+    def __init__(self, item: Any, priority: float) -> None:
+        self.item = item
+        self.priority = priority
+        self.size = 1
+        self.left: "_Node | None" = None
+        self.right: "_Node | None" = None
+        self.parent: "_Node | None" = None
+
+
+class OrderStatisticList:
+    """
+    OrderStatisticList class is a list that finds the position of an item, and the item at a position, in
+    O(log n).
+
+    It is an implicit treap: a randomly balanced binary tree ordered by position, where every node counts the
+    items below it. Inserting and removing items also take O(log n). Items are looked up by identity, so an
+    item can only be in the list once.
+
+    Args:
+        items (:obj:`List[Any]`, optional): The items the list starts with, in order.
+        seed (int, optional): The seed of the random priorities that balance the tree.
+    """
+
+    def __init__(self, items: List[Any] | None = None, seed: int | None = None) -> None:
+        self.__random = random.Random(seed)
+        self.__nodes: Dict[int, _Node] = dict()
+        self.__root: _Node | None = self._build(items or [])
+
+    def __getstate__(self):
+        # The tree is rebuilt from the items when it's loaded, so it doesn't have to be pickled node by node.
+        return {"items": list(self)}
+
+    def __setstate__(self, state):
+        self.__random = random.Random()
+        self.__nodes = dict()
+        self.__root = self._build(state["items"])
+
+    def __len__(self) -> int:
+        return self._size(self.__root)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self.__nodes
+
+    def __iter__(self) -> Iterator[Any]:
+        to_visit: List[_Node] = []
+        node = self.__root
+        while to_visit or node is not None:
+            while node is not None:
+                to_visit.append(node)
+                node = node.left
+            node = to_visit.pop()
+            yield node.item
+            node = node.right
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Gets the item at a position.
+
+        Args:
+            index (int): The position of the item.
+
+        Returns:
+            :obj:`Any`: The item at position :obj:`index`.
+
+        Raises:
+            IndexError: If there is no item at :obj:`index`.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Tried to get item {index} of a list of {len(self)}.")
+        node = self.__root
+        while node is not None:
+            left_size = self._size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.item
+            else:
+                index -= left_size + 1
+                node = node.right
+        raise IndexError(f"Tried to get item {index} of a list of {len(self)}.")
+
+    def index(self, item: Any) -> int:
+        """
+        Gets the position of an item.
+
+        Args:
+            item (:obj:`Any`): The item to find.
+
+        Returns:
+            int: The position of :obj:`item`.
+
+        Raises:
+            ValueError: If :obj:`item` isn't in the list.
+        """
+        if item not in self:
+            raise ValueError("Tried to get the position of an item not in the list.")
+        node = self.__nodes[id(item)]
+        index = self._size(node.left)
+        while node.parent is not None:
+            if node is node.parent.right:
+                index += self._size(node.parent.left) + 1
+            node = node.parent
+        return index
+
+    def insert(self, index: int, items: List[Any]) -> None:
+        """
+        Inserts items at a position.
+
+        Args:
+            index (int): The position the first item will have.
+            items (:obj:`List[Any]`): The items to insert, in order.
+
+        Raises:
+            ValueError: If one of :obj:`items` is already in the list.
+        """
+        if any(item in self for item in items):
+            raise ValueError("Tried to insert an item already in the list.")
+        before, after = self._split(self.__root, index)
+        self.__root = self._merge(self._merge(before, self._build(items)), after)
+        if self.__root is not None:
+            self.__root.parent = None
+
+    def remove(self, item: Any) -> None:
+        """
+        Removes an item.
+
+        Args:
+            item (:obj:`Any`): The item to remove.
+
+        Raises:
+            ValueError: If :obj:`item` isn't in the list.
+        """
+        index = self.index(item)
+        before, after = self._split(self.__root, index)
+        _, after = self._split(after, 1)
+        self.__root = self._merge(before, after)
+        if self.__root is not None:
+            self.__root.parent = None
+        del self.__nodes[id(item)]
+
+    def _build(self, items: List[Any]) -> _Node | None:
+        # Builds the tree of the items in O(n), keeping the highest priority at the root of every subtree.
+        rightmost_path: List[_Node] = []
+        for item in items:
+            node = _Node(item, self.__random.random())
+            self.__nodes[id(item)] = node
+            last_popped = None
+            while rightmost_path and rightmost_path[-1].priority < node.priority:
+                last_popped = rightmost_path.pop()
+            node.left = last_popped
+            if rightmost_path:
+                rightmost_path[-1].right = node
+            rightmost_path.append(node)
+        if not rightmost_path:
+            return None
+        root = rightmost_path[0]
+        for node in self._get_post_order(root):
+            self._update(node)
+        root.parent = None
+        return root
+
+    def _split(
+        self, node: _Node | None, count: int
+    ) -> Tuple[_Node | None, _Node | None]:
+        # Splits the tree into its first count items and the rest.
+        if node is None:
+            return None, None
+        left_size = self._size(node.left)
+        if count <= left_size:
+            before, node.left = self._split(node.left, count)
+            self._update(node)
+            if before is not None:
+                before.parent = None
+            return before, node
+        node.right, after = self._split(node.right, count - left_size - 1)
+        self._update(node)
+        if after is not None:
+            after.parent = None
+        return node, after
+
+    def _merge(self, before: _Node | None, after: _Node | None) -> _Node | None:
+        if before is None:
+            return after
+        if after is None:
+            return before
+        if before.priority > after.priority:
+            before.right = self._merge(before.right, after)
+            self._update(before)
+            return before
+        after.left = self._merge(before, after.left)
+        self._update(after)
+        return after
+
+    @staticmethod
+    def _get_post_order(root: _Node) -> List[_Node]:
+        nodes: List[_Node] = []
+        to_visit = [root]
+        while to_visit:
+            node = to_visit.pop()
+            nodes.append(node)
+            to_visit += [child for child in (node.left, node.right) if child]
+        return nodes[::-1]
+
+    @staticmethod
+    def _update(node: _Node) -> None:
+        node.size = 1
+        for child in (node.left, node.right):
+            if child is not None:
+                node.size += child.size
+                child.parent = node
+
+    @staticmethod
+    def _size(node: _Node | None) -> int:
+        return 0 if node is None else node.size
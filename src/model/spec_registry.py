@@ -0,0 +1,119 @@
+from typing import Dict, List
+
+from src.model.aloc_spec import ALOCSpec
+from src.model.model import Model
+from src.model.terminal_types.terminal import Terminal
+from src.parser.cola_verifier import ColaVerifier
+
+
+class SpecRegistry:
+    """
+    SpecRegistry class loads several ALOC specs into one process, sharing what they have in common.
+
+    Terminals with the same definition are built once and shared by every spec that defines them. For text
+    and hybrid terminals the slice of the grammar reachable from their parse root must also be the same.
+    Compiled parsers are shared through :obj:`PARSER_REGISTRY`, which compiles each slice of a grammar once
+    whichever spec it comes from. Memory therefore grows with the distinct grammar material of the specs, not
+    with their number.
+
+    Args:
+        **spec_options: The options every spec is read with (see :obj:`ALOCSpec`).
+    """
+
+    def __init__(self, **spec_options) -> None:
+        self.__spec_options = spec_options
+        self.__specs: Dict[str, ALOCSpec] = dict()
+        self.__terminal_pool: Dict[str, Terminal] = dict()
+
+    def load(self, path: str, name: str | None = None) -> ALOCSpec:
+        """
+        Reads a spec and registers it.
+
+        Args:
+            path (str): The path of the ALOC spec to read.
+            name (str, optional): The name to register the spec under, its path if None.
+
+        Returns:
+            :obj:`ALOCSpec`: The spec that was read.
+
+        Raises:
+            ValueError: If a spec is already registered under :obj:`name`.
+        """
+        if name is None:
+            name = path
+        if name in self.__specs:
+            raise ValueError(f"A spec is already registered as {name}.")
+        spec = ALOCSpec(path, terminal_pool=self.__terminal_pool, **self.__spec_options)
+        self.__specs[name] = spec
+        return spec
+
+    def get_spec(self, name: str) -> ALOCSpec:
+        """
+        Gets a registered spec.
+
+        Args:
+            name (str): The name the spec was registered under.
+
+        Returns:
+            :obj:`ALOCSpec`: The spec registered as :obj:`name`.
+
+        Raises:
+            ValueError: If no spec is registered as :obj:`name`.
+        """
+        if name not in self.__specs:
+            raise ValueError(f"Tried to get spec {name} but it isn't registered.")
+        return self.__specs[name]
+
+    def get_spec_names(self) -> List[str]:
+        """
+        Gets the names of all registered specs.
+
+        Returns:
+            :obj:`List[str]`: The names of the specs, in the order they were loaded.
+        """
+        return list(self.__specs)
+
+    def create_model(
+        self, name: str, cola_verifier: ColaVerifier | None = None
+    ) -> Model:
+        """
+        Creates a model drafting contracts with a registered spec.
+
+        Args:
+            name (str): The name the spec was registered under.
+            cola_verifier (:obj:`ColaVerifier`, optional): The verifier to check exported CoLa with.
+
+        Returns:
+            :obj:`Model`: A model with a new, empty contract.
+
+        Raises:
+            ValueError: If no spec is registered as :obj:`name`.
+        """
+        spec = self.get_spec(name)
+        return Model(
+            spec.get_contract_collections(),
+            spec.get_component_types(),
+            cola_verifier,
+        )
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Returns statistics on how much the registered specs share.
+
+        Returns:
+            :obj:`Dict[str, int]`: The number of ``specs``, the number of ``terminals`` they define in total
+            and the number of ``distinct_terminals`` actually built.
+        """
+        return {
+            "specs": len(self.__specs),
+            "terminals": sum(
+                len(spec.get_terminals()) for spec in self.__specs.values()
+            ),
+            "distinct_terminals": len(
+                {
+                    id(terminal)
+                    for spec in self.__specs.values()
+                    for terminal in spec.get_terminals().values()
+                }
+            ),
+        }
@@ -1,7 +1,12 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from src.model.terminal_types.terminal import Terminal, TerminalTypeNames
+from src.model.terminal_types.validation_cache import ValidationCache
 from src.parser.base_parser import BaseParser
+from src.parser.batch_validator import BatchValidator
+from src.parser.incremental_parser import IncrementalParser
+from src.parser.typed_value_transformer import TypedValueTransformer
+from src.parser.validation_result import ValidationResult
 
 
 class HybridTerminal(Terminal):
@@ -16,6 +21,7 @@ class HybridTerminal(Terminal):
         parser (:obj:`BaseParser`): Parser responsible for validating textual input.
         explanation (str): The error text to show if the user enters an invalid value for this terminal.
         choices (:obj:`List[str]`): The possible choices the user can select from for this terminal.
+        validation_cache_size (int, optional): The number of validation results to remember.
     Note:
         The JSON representation of this class requires:
             :obj:`name` attribute of type str.
@@ -23,9 +29,12 @@ class HybridTerminal(Terminal):
             :obj:`default_option` attribute of type str (This should be in the choices list.).
             :obj:`choices` attribute of type :obj:`List[str]`.
             :obj:`explanation` of type str.
+        and Optionally:
+            :obj:`validation_cache_size` attribute of type int.
     """
 
     CUSTOM_OPTION = "CUSTOM"
+    PARSE_PREFIX = "on the "
 
     def __init__(
         self,
@@ -35,12 +44,30 @@ class HybridTerminal(Terminal):
         parser: BaseParser,
         explanation: str,
         choices: List[str],
+        validation_cache_size: int = ValidationCache.DEFAULT_SIZE,
     ):
         super().__init__(name, (default_option, default_text), TerminalTypeNames.HYBRID)
         self.__explanation = explanation
         self.__choices = choices
         self.__choices.append(self.CUSTOM_OPTION)
         self.__parser = parser
+        self.__validation_cache = ValidationCache(validation_cache_size)
+
+    def check_default(self) -> None:
+        """
+        Checks that the default option and default text of this terminal are valid.
+
+        Raises:
+            AssertionError: If the default option isn't one of the choices or the default text isn't valid
+                according to the grammar.
+        """
+        default_option, default_text = self.get_default()
+        assert (
+            default_option in self.__choices
+        ), f"The default option of a hybrid terminal must be one of its choices. {default_option} is not a choice of {self.get_name()}."
+        assert self.__parser.parse(
+            f"{self.PARSE_PREFIX}{default_text}"
+        ), f"The default text of a hybrid terminal must be valid. {default_text} is not a valid {self.get_name()} terminal according to the grammar."
 
     def get_explanation(self):
         """
@@ -63,7 +90,121 @@ class HybridTerminal(Terminal):
         """
         if value in self.get_choices():
             return True
-        return self.__parser.parse(f"on the {value}")
+        result = self.__validation_cache.get(value)
+        if result is None:
+            result = self.__parser.parse(f"{self.PARSE_PREFIX}{value}")
+            self.__validation_cache.put(value, result)
+        return result
+
+    def parse_value(self, value: Tuple[str, str]) -> Any | None:
+        """
+        Returns the typed value of a value of this terminal, such as the ordinal of a date.
+
+        Args:
+            value (:obj:`Tuple[str, str]`): The selected option and the custom text.
+
+        Returns:
+            :obj:`Any | None`: The typed value (see :obj:`TypedValueTransformer`) of the custom text if the
+            :obj:`CUSTOM` option is selected, or None if it is invalid. Otherwise the typed value of the selected
+            option, such as :obj:`ADATE` for ``on ADATE``, or the option itself if the grammar doesn't accept it.
+        """
+        option, text = value
+        if option != self.CUSTOM_OPTION:
+            # Options are normalised like custom text, so that both give the same kind of typed value.
+            tree = self.__parser.parse_tree(option)
+            if tree is None:
+                return option
+            typed_value = TypedValueTransformer.to_typed_value(tree)
+            return option if typed_value is None else typed_value
+        tree = self.__parser.parse_tree(f"{self.PARSE_PREFIX}{text}")
+        if tree is None:
+            return None
+        return TypedValueTransformer.to_typed_value(tree)
+
+    def validate_many(
+        self, values: Iterable[str], batch_validator: BatchValidator | None = None
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validates many values of this terminal at once.
+
+        Args:
+            values (:obj:`Iterable[str]`): The values to check, duplicates are only validated once.
+            batch_validator (:obj:`BatchValidator`, optional): The validator to spread the work with.
+
+        Returns:
+            :obj:`Dict[str, ValidationResult]`: The result of validating each distinct value, in the order
+            they were first given. Error positions are relative to the value, not the parsed text.
+        """
+        if batch_validator is None:
+            with BatchValidator() as batch_validator:
+                return self.validate_many(values, batch_validator)
+        unique_values = list(dict.fromkeys(values))
+        # Only valid results can be reused, invalid ones are parsed again to locate the error.
+        to_diagnose = [
+            value
+            for value in unique_values
+            if value not in self.get_choices() and not self.__validation_cache.get(value)
+        ]
+        diagnosed = batch_validator.diagnose(
+            self.__parser, [f"{self.PARSE_PREFIX}{value}" for value in to_diagnose]
+        )
+        results = dict()
+        for value in to_diagnose:
+            result = diagnosed[f"{self.PARSE_PREFIX}{value}"].shift(
+                -len(self.PARSE_PREFIX)
+            )
+            self.__validation_cache.put(value, result.is_valid())
+            results[value] = result
+        return {
+            value: results.get(value, ValidationResult(True)) for value in unique_values
+        }
+
+    def create_incremental_parser(self) -> IncrementalParser:
+        """
+        Creates a parser that validates values of this terminal as they are typed.
+
+        Returns:
+            :obj:`IncrementalParser`: A new incremental parser for this terminal, its error positions are
+            relative to the value rather than the parsed text.
+        """
+        return IncrementalParser(self.__parser, self.PARSE_PREFIX)
+
+    def get_parser(self) -> BaseParser:
+        """
+        Returns the parser associated with this terminal.
+
+        Returns:
+            :obj:`BaseParser`: The parser associated with this terminal.
+        """
+        return self.__parser
+
+    def set_parser(self, parser: BaseParser) -> None:
+        """
+        Sets the parser associated with this terminal, forgetting all cached validation results.
+
+        Args:
+            parser (:obj:`BaseParser`): The new parser of this terminal.
+        """
+        self.__parser = parser
+        self.__validation_cache.clear()
+
+    def get_validation_cache(self) -> ValidationCache:
+        """
+        Returns the cache of validation results of this terminal.
+
+        Returns:
+            :obj:`ValidationCache`: The validation cache of this terminal.
+        """
+        return self.__validation_cache
+
+    def get_validation_cache_statistics(self) -> Dict[str, float]:
+        """
+        Returns statistics on the validation results cached by this terminal.
+
+        Returns:
+            :obj:`Dict[str, float]`: The statistics of the validation cache.
+        """
+        return self.__validation_cache.get_statistics()
 
     def get_choices(self):
         """
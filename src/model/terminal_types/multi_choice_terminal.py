@@ -38,3 +38,15 @@ class MultiChoiceTerminal(Terminal):
             :obj:`List[str]`: The possible choices that satisft this terminal.
         """
         return self.__choices
+
+    def validate(self, value: str) -> bool:
+        """
+        Returns whether a value is one of the choices of this terminal.
+
+        Args:
+            value (str): The value to check.
+
+        Returns:
+            bool: True if the value is one of the choices, False otherwise.
+        """
+        return value in self.__choices
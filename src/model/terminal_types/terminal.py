@@ -25,6 +25,30 @@ class Terminal:
         """
         return self.__default
 
+    def validate(self, value) -> bool:
+        """
+        Returns whether a value is valid for this terminal.
+
+        Args:
+            value: The value to check.
+
+        Returns:
+            bool: True, unless the terminal restricts its values.
+        """
+        return True
+
+    def parse_value(self, value):
+        """
+        Returns the typed value of a value of this terminal.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            The typed value, which is the value itself unless the terminal parses its values.
+        """
+        return value
+
     def get_type(self):
         """
         Returns the type name of this terminal.
@@ -1,5 +1,12 @@
+from typing import Any, Dict, Iterable
+
 from src.model.terminal_types.terminal import Terminal, TerminalTypeNames
+from src.model.terminal_types.validation_cache import ValidationCache
 from src.parser.base_parser import BaseParser
+from src.parser.batch_validator import BatchValidator
+from src.parser.incremental_parser import IncrementalParser
+from src.parser.typed_value_transformer import TypedValueTransformer
+from src.parser.validation_result import ValidationResult
 
 
 class TextTerminal(Terminal):
@@ -12,23 +19,55 @@ class TextTerminal(Terminal):
         default (str): The default text for this terminal.
         parser (:obj:`BaseParser`): Parser responsible for validating textual input.
         explanation (str): The error text to show if the user enters an invalid value for this terminal.
+        validation_cache_size (int, optional): The number of validation results to remember.
+        lazy (bool, optional): Whether to check the default on the first validation rather than now, so that
+            the parser isn't compiled until the terminal is used.
     Note:
         The JSON representation of this class requires:
             :obj:`name` attribute of type str.
             :obj:`default` attribute of type str (This should be a valid value for this terminal.).
             :obj:`parser_root` attribute of type str (This should be a valid LHS of the :obj:`BaseParser`'s grammar.).
             :obj:`explanation` of type str.
+        and Optionally:
+            :obj:`validation_cache_size` attribute of type int.
     """
 
     def __init__(
-        self, name: str, default: str, parser: BaseParser, explanation: str
+        self,
+        name: str,
+        default: str,
+        parser: BaseParser,
+        explanation: str,
+        validation_cache_size: int = ValidationCache.DEFAULT_SIZE,
+        lazy: bool = False,
     ) -> None:
         super().__init__(name, default, TerminalTypeNames.TEXT)
         self.__explanation = explanation
         self.__parser = parser
+        self.__validation_cache = ValidationCache(validation_cache_size)
+        self.__default_checked = False
+        if not lazy:
+            self.check_default()
+
+    def check_default(self) -> None:
+        """
+        Checks that the default of this terminal is valid, unless it has already been checked.
+
+        Raises:
+            AssertionError: If the default isn't valid according to the grammar.
+        """
+        if self.__default_checked:
+            return
+        default = self.get_default()
         assert self.__parser.parse(
             default
-        ), f"The default of a text terminal must be valid. {default} is not a valid {name} terminal according to the grammar."
+        ), f"The default of a text terminal must be valid. {default} is not a valid {self.get_name()} terminal according to the grammar."
+        self.__default_checked = True
+
+    def __setstate__(self, state):
+        # Terminals saved before defaults were checked lazily checked them when they were built.
+        state.setdefault("_TextTerminal__default_checked", True)
+        self.__dict__.update(state)
 
     def get_explanation(self):
         """
@@ -39,6 +78,15 @@ class TextTerminal(Terminal):
         """
         return self.__explanation
 
+    def create_incremental_parser(self) -> IncrementalParser:
+        """
+        Creates a parser that validates values of this terminal as they are typed.
+
+        Returns:
+            :obj:`IncrementalParser`: A new incremental parser for this terminal.
+        """
+        return IncrementalParser(self.__parser)
+
     def get_parser(self):
         """
         Returns the parser associated with this terminal.
@@ -48,6 +96,34 @@ class TextTerminal(Terminal):
         """
         return self.__parser
 
+    def set_parser(self, parser: BaseParser) -> None:
+        """
+        Sets the parser associated with this terminal, forgetting all cached validation results.
+
+        Args:
+            parser (:obj:`BaseParser`): The new parser of this terminal.
+        """
+        self.__parser = parser
+        self.__validation_cache.clear()
+
+    def get_validation_cache(self) -> ValidationCache:
+        """
+        Returns the cache of validation results of this terminal.
+
+        Returns:
+            :obj:`ValidationCache`: The validation cache of this terminal.
+        """
+        return self.__validation_cache
+
+    def get_validation_cache_statistics(self) -> Dict[str, float]:
+        """
+        Returns statistics on the validation results cached by this terminal.
+
+        Returns:
+            :obj:`Dict[str, float]`: The statistics of the validation cache.
+        """
+        return self.__validation_cache.get_statistics()
+
     def validate(self, text: str):
         """
         Returns whether the value passes in is of this terminal type.
@@ -58,4 +134,55 @@ class TextTerminal(Terminal):
         Returns:
             bool: True if the value is an instance of this terminal, False otherwise.
         """
-        return self.__parser.parse(text)
+        self.check_default()
+        result = self.__validation_cache.get(text)
+        if result is None:
+            result = self.__parser.parse(text)
+            self.__validation_cache.put(text, result)
+        return result
+
+    def parse_value(self, text: str) -> Any | None:
+        """
+        Returns the typed value of a value of this terminal, such as an amount for an object.
+
+        Args:
+            text (str): The value to convert.
+
+        Returns:
+            :obj:`Any | None`: The typed value (see :obj:`TypedValueTransformer`), or None if the value is
+            invalid or the terminal's parse root has no typed value.
+        """
+        tree = self.__parser.parse_tree(text)
+        if tree is None:
+            return None
+        return TypedValueTransformer.to_typed_value(tree)
+
+    def validate_many(
+        self, texts: Iterable[str], batch_validator: BatchValidator | None = None
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validates many values of this terminal at once.
+
+        Args:
+            texts (:obj:`Iterable[str]`): The values to check, duplicates are only validated once.
+            batch_validator (:obj:`BatchValidator`, optional): The validator to spread the work with.
+
+        Returns:
+            :obj:`Dict[str, ValidationResult]`: The result of validating each distinct value, in the order
+            they were first given.
+        """
+        if batch_validator is None:
+            with BatchValidator() as batch_validator:
+                return self.validate_many(texts, batch_validator)
+        self.check_default()
+        unique_texts = list(dict.fromkeys(texts))
+        # Only valid results can be reused, invalid ones are parsed again to locate the error.
+        to_diagnose = [
+            text for text in unique_texts if not self.__validation_cache.get(text)
+        ]
+        diagnosed = batch_validator.diagnose(self.__parser, to_diagnose)
+        for text, result in diagnosed.items():
+            self.__validation_cache.put(text, result.is_valid())
+        return {
+            text: diagnosed.get(text, ValidationResult(True)) for text in unique_texts
+        }
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import Dict
+
+
+class ValidationCache:
+    """
+    ValidationCache class remembers the results of validating values against a terminal.
+
+    The least recently used result is evicted once the cache holds :obj:`max_size` results.
+
+    Args:
+        max_size (int): The maximum number of results to hold, 0 disables the cache.
+    """
+
+    DEFAULT_SIZE = 256
+
+    def __init__(self, max_size: int = DEFAULT_SIZE) -> None:
+        self.__max_size = max_size
+        self.__results: OrderedDict[str, bool] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, value: str) -> bool | None:
+        """
+        Returns the cached result of validating a value.
+
+        Args:
+            value (str): The value that was validated.
+
+        Returns:
+            bool | None: The cached result, or None if the value has no cached result.
+        """
+        result = self.__results.get(value)
+        if result is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__results.move_to_end(value)
+        return result
+
+    def put(self, value: str, result: bool) -> None:
+        """
+        Caches the result of validating a value.
+
+        Args:
+            value (str): The value that was validated.
+            result (bool): Whether the value was valid.
+        """
+        if self.__max_size <= 0:
+            return
+        self.__results[value] = result
+        self.__results.move_to_end(value)
+        while len(self.__results) > self.__max_size:
+            self.__results.popitem(last=False)
+            self.__evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all cached results, used when the grammar behind the terminal changes.
+        """
+        self.__results.clear()
+
+    def get_max_size(self) -> int:
+        """
+        Returns the maximum number of results the cache holds.
+
+        Returns:
+            int: The maximum size of the cache.
+        """
+        return self.__max_size
+
+    def set_max_size(self, max_size: int) -> None:
+        """
+        Sets the maximum number of results the cache holds, evicting results if it is now too large.
+
+        Args:
+            max_size (int): The new maximum size of the cache, 0 disables the cache.
+        """
+        self.__max_size = max_size
+        while len(self.__results) > max(max_size, 0):
+            self.__results.popitem(last=False)
+            self.__evictions += 1
+
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        Returns statistics on how the cache has been used.
+
+        Returns:
+            :obj:`Dict[str, float]`: The number of ``hits``, ``misses`` and ``evictions``, the ``hit_rate``,
+            the current ``size`` and the ``max_size`` of the cache.
+        """
+        lookups = self.__hits + self.__misses
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "hit_rate": self.__hits / lookups if lookups else 0.0,
+            "size": len(self.__results),
+            "max_size": self.__max_size,
+        }
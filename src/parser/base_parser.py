@@ -1,15 +1,228 @@
-from lark import Lark, exceptions
+import re
+
+from lark import Lark, Tree, exceptions
+
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY, ParserRegistry
+from src.parser.validation_result import ValidationResult
 
 
 class BaseParser:
-    def __init__(self, start_from: str, grammar: str):
+    """
+    BaseParser class validates text against a rule of a grammar.
+
+    Args:
+        start_from (str): The rule of the grammar to start parsing from.
+        grammar (str): The text of the grammar.
+        registry (:obj:`ParserRegistry`, optional): The registry to fetch compiled parsers from.
+        engine (:obj:`ParserEngine`, optional): The engine to build the parser with.
+        regex_fast_path (bool, optional): Whether to validate with a regular expression when the start rule is regular.
+        debug (bool, optional): Whether to cross-check the regular expression against the full parser.
+
+    Note:
+        The compiled parser is fetched from the registry on first use, so every BaseParser
+        with the same grammar, start rule and engine shares one compiled parser.
+    """
+
+    def __init__(
+        self,
+        start_from: str,
+        grammar: str,
+        registry: ParserRegistry = PARSER_REGISTRY,
+        engine: ParserEngine = ParserEngine.EARLEY,
+        regex_fast_path: bool = True,
+        debug: bool = False,
+    ):
         self.__start_from = start_from
         self.__grammar = grammar
+        self.__grammar_hash = ParserRegistry.hash_grammar(grammar)
+        self.__registry = registry
+        self.__requested_engine = engine
+        self.__engine: ParserEngine | None = None
+        self.__parser: Lark | None = None
+        self.__regex_fast_path = regex_fast_path
+        self.__regex: re.Pattern | None = None
+        self.__regex_resolved = False
+        self.__debug = debug
 
     def parse(self, input_string: str):
-        parser = Lark(self.__grammar, start=self.__start_from)
+        regex = self.get_regex()
+        if regex is None:
+            return self._parse_with_parser(input_string)
+        result = regex.fullmatch(input_string) is not None
+        if self.__debug:
+            assert result == self._parse_with_parser(
+                input_string
+            ), f"Regular expression of {self.__start_from} disagrees with its parser on {input_string!r}."
+        return result
+
+    def _parse_with_parser(self, input_string: str):
+        parser = self.get_lark_parser()
         try:
             parser.parse(input_string)
             return True
         except exceptions.LarkError:
             return False
+
+    def diagnose(self, input_string: str) -> ValidationResult:
+        """
+        Validates text, reporting where it stops conforming to the grammar.
+
+        Args:
+            input_string (str): The text to validate.
+
+        Returns:
+            :obj:`ValidationResult`: The result of validating :obj:`input_string`.
+
+        Note:
+            Valid text is recognised by the regular expression when there is one, the full parser is
+            only run to locate the error in invalid text.
+        """
+        regex = self.get_regex()
+        if regex is not None and regex.fullmatch(input_string) is not None:
+            return ValidationResult(True)
+        parser = self.get_lark_parser()
+        try:
+            parser.parse(input_string)
+            return ValidationResult(True)
+        except exceptions.UnexpectedInput as exception:
+            return ValidationResult.from_exception(exception, input_string)
+        except exceptions.LarkError:
+            return ValidationResult(False, 0)
+
+    def parse_tree(self, input_string: str) -> Tree | None:
+        """
+        Parses text into a tree that keeps all of its tokens.
+
+        Args:
+            input_string (str): The text to parse.
+
+        Returns:
+            :obj:`Tree | None`: The parse tree, or None if the text is invalid.
+        """
+        parser = self.__registry.get_tree_parser(
+            self.__grammar, self.__start_from, self.__grammar_hash
+        )
+        try:
+            return parser.parse(input_string)
+        except exceptions.LarkError:
+            return None
+
+    def get_lark_parser(self) -> Lark:
+        """
+        Returns the compiled parser used by this parser, fetching it from the registry if needed.
+
+        Returns:
+            :obj:`Lark`: The compiled parser.
+        """
+        if self.__parser is None:
+            self.__parser, self.__engine = self.__registry.get_parser(
+                self.__grammar,
+                self.__start_from,
+                self.__grammar_hash,
+                self.__requested_engine,
+            )
+        return self.__parser
+
+    def get_lalr_parser(self) -> Lark | None:
+        """
+        Returns an LALR parser for the start rule of this parser, whatever engine this parser uses.
+
+        Returns:
+            :obj:`Lark | None`: The compiled parser of this parser if it was built with LALR, otherwise a
+            separate LALR parser, or None if the start rule can't be built with LALR.
+
+        Note:
+            The separate parser is only used to locate errors and list completions, so a start rule that can't
+            be built with it isn't reported as a fallback.
+        """
+        if self.__requested_engine.is_lalr():
+            parser = self.get_lark_parser()
+            return parser if self.get_engine().is_lalr() else None
+        parser, engine = self.__registry.get_parser(
+            self.__grammar,
+            self.__start_from,
+            self.__grammar_hash,
+            ParserEngine.LALR,
+            record_fallback=False,
+        )
+        return parser if engine == ParserEngine.LALR else None
+
+    def get_regex(self) -> re.Pattern | None:
+        """
+        Returns the regular expression used to validate text, fetching it from the registry if needed.
+
+        Returns:
+            :obj:`re.Pattern | None`: The regular expression equivalent to the start rule, or None if the
+            start rule isn't regular or the fast path is disabled.
+        """
+        if not self.__regex_fast_path:
+            return None
+        if not self.__regex_resolved:
+            self.__regex = self.__registry.get_regex(
+                self.__grammar, self.__start_from, self.__grammar_hash
+            )
+            self.__regex_resolved = True
+        return self.__regex
+
+    def get_engine(self) -> ParserEngine:
+        """
+        Returns the engine this parser was built with.
+
+        Returns:
+            :obj:`ParserEngine`: The engine of the compiled parser, which is Earley if an LALR parser was
+            requested but could not be built.
+        """
+        self.get_lark_parser()
+        assert self.__engine is not None
+        return self.__engine
+
+    def get_requested_engine(self) -> ParserEngine:
+        """
+        Returns the engine that was requested for this parser.
+
+        Returns:
+            :obj:`ParserEngine`: The requested engine.
+        """
+        return self.__requested_engine
+
+    def get_start_from(self) -> str:
+        """
+        Returns the rule of the grammar this parser starts from.
+
+        Returns:
+            str: The start rule of this parser.
+        """
+        return self.__start_from
+
+    def get_grammar(self) -> str:
+        """
+        Returns the grammar of this parser.
+
+        Returns:
+            str: The text of the grammar.
+        """
+        return self.__grammar
+
+    def get_grammar_hash(self) -> str:
+        """
+        Returns the hash of the grammar of this parser.
+
+        Returns:
+            str: The hex digest of the grammar.
+        """
+        return self.__grammar_hash
+
+    def __getstate__(self):
+        # Compiled parsers can't be pickled, they are fetched again from the registry on first use.
+        state = self.__dict__.copy()
+        state["_BaseParser__parser"] = None
+        state["_BaseParser__engine"] = None
+        state["_BaseParser__regex"] = None
+        state["_BaseParser__regex_resolved"] = False
+        state["_BaseParser__registry"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__registry = PARSER_REGISTRY
@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List
+
+from src.parser.base_parser import BaseParser
+from src.parser.validation_result import ValidationResult
+
+
+def _diagnose_chunk(parser: BaseParser, texts: List[str]) -> List[ValidationResult]:
+    # Runs in a worker process, the parser is fetched again from that process' registry.
+    return [parser.diagnose(text) for text in texts]
+
+
+class BatchValidator:
+    """
+    BatchValidator class validates many texts at once, spreading large batches over a process pool.
+
+    It can be used as a context manager so that one pool is shared by several batches.
+
+    Args:
+        processes (int | None, optional): The number of worker processes, defaults to the number of CPUs.
+        chunk_size (int, optional): The number of texts sent to a worker at a time.
+        min_pool_size (int, optional): The number of texts below which a batch is validated in this process.
+
+    Note:
+        Compiled parsers can't be sent to workers, so each worker compiles (or loads from the disk
+        cache) its own parsers. Small batches are not worth that cost and are validated in this process.
+    """
+
+    DEFAULT_CHUNK_SIZE = 64
+    DEFAULT_MIN_POOL_SIZE = 512
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        min_pool_size: int = DEFAULT_MIN_POOL_SIZE,
+    ) -> None:
+        assert chunk_size > 0, "The chunk size of a batch validator must be positive."
+        self.__processes = processes if processes is not None else os.cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__min_pool_size = min_pool_size
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def diagnose(
+        self, parser: BaseParser, texts: Iterable[str]
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validates texts against a parser.
+
+        Args:
+            parser (:obj:`BaseParser`): The parser to validate the texts with.
+            texts (:obj:`Iterable[str]`): The texts to validate, duplicates are only validated once.
+
+        Returns:
+            :obj:`Dict[str, ValidationResult]`: The result of validating each distinct text.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if self.__processes > 1 and len(unique_texts) >= self.__min_pool_size:
+            try:
+                return self._diagnose_in_pool(parser, unique_texts)
+            except (BrokenProcessPool, OSError):
+                self.close()
+        return {text: parser.diagnose(text) for text in unique_texts}
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes of this validator, they are started again when needed.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def _diagnose_in_pool(
+        self, parser: BaseParser, texts: List[str]
+    ) -> Dict[str, ValidationResult]:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(self.__processes)
+        chunks = [
+            texts[start : start + self.__chunk_size]
+            for start in range(0, len(texts), self.__chunk_size)
+        ]
+        results = dict()
+        for chunk, chunk_results in zip(
+            chunks,
+            self.__executor.map(_diagnose_chunk, [parser] * len(chunks), chunks),
+        ):
+            results.update(zip(chunk, chunk_results))
+        return results
+
+    def __enter__(self) -> "BatchValidator":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
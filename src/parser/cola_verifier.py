@@ -0,0 +1,116 @@
+import re
+from typing import Dict, List, Tuple
+
+from src.model.constants import Constants
+from src.parser.base_parser import BaseParser
+from src.parser.batch_validator import BatchValidator
+from src.parser.validation_result import ValidationResult
+
+# Matches the textual ids of components, such as [3], in exported CoLa.
+_COMPONENT_ID_PATTERN = re.compile(r"\[(\d+)\]")
+
+
+class ColaVerifier:
+    """
+    ColaVerifier class checks exported CoLa against the grammar, one top level component at a time.
+
+    The CoLa is split on the component joiners and each part is parsed from the component rule, spread over
+    a :obj:`BatchValidator`. The results of the last verification are kept, so parts whose text hasn't
+    changed since are not parsed again.
+
+    Args:
+        parser (:obj:`BaseParser`): The parser of the grammar's component rule.
+        batch_validator (:obj:`BatchValidator`, optional): The validator to spread the parsing with.
+        joiner (str, optional): The text joining top level components in exported CoLa.
+    """
+
+    DEFAULT_START = "component"
+
+    def __init__(
+        self,
+        parser: BaseParser,
+        batch_validator: BatchValidator | None = None,
+        joiner: str = Constants.COMPONENT_JOINER,
+    ) -> None:
+        self.__parser = parser
+        self.__batch_validator = (
+            batch_validator if batch_validator is not None else BatchValidator()
+        )
+        self.__separator = f"\n{joiner}\n"
+        self.__results: Dict[str, ValidationResult] = dict()
+        self.__reused = 0
+        self.__parsed = 0
+
+    def verify(self, cola: str) -> Dict[int | None, ValidationResult]:
+        """
+        Verifies exported CoLa.
+
+        Args:
+            cola (str): The CoLa to verify.
+
+        Returns:
+            :obj:`Dict[int | None, ValidationResult]`: The failures, keyed by the textual id of the component
+            the error is in, or None if the failing part has no component id. Error positions are relative
+            to the whole of :obj:`cola`. The CoLa is valid if there are no failures.
+        """
+        if not cola:
+            return dict()
+        chunks = self._split(cola)
+        to_parse = list(
+            dict.fromkeys(text for _, text in chunks if text not in self.__results)
+        )
+        parsed = self.__batch_validator.diagnose(self.__parser, to_parse)
+        self.__reused += len(chunks) - len(to_parse)
+        self.__parsed += len(parsed)
+        results = {
+            text: self.__results[text] if text in self.__results else parsed[text]
+            for _, text in chunks
+        }
+        # Only the current parts are kept, so the results don't grow with every edit.
+        self.__results = results
+        failures = dict()
+        for offset, text in chunks:
+            result = results[text]
+            if result.is_valid():
+                continue
+            component_id = self._find_component_id(text, result.get_position() or 0)
+            failures[component_id] = result.shift(offset)
+        return failures
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Returns statistics on the verifications done so far.
+
+        Returns:
+            :obj:`Dict[str, int]`: The number of parts ``parsed`` and the number of parts ``reused`` from
+            the previous verification.
+        """
+        return {"parsed": self.__parsed, "reused": self.__reused}
+
+    def clear(self) -> None:
+        """
+        Forgets the results of the last verification, used when the grammar changes.
+        """
+        self.__results = dict()
+
+    def _split(self, cola: str) -> List[Tuple[int, str]]:
+        chunks = []
+        offset = 0
+        for text in cola.split(self.__separator):
+            chunks.append((offset, text))
+            offset += len(text) + len(self.__separator)
+        return chunks
+
+    @staticmethod
+    def _find_component_id(text: str, position: int) -> int | None:
+        # The error belongs to the last component that starts before it, or the first one if none do.
+        component_ids = [
+            (match.start(), int(match.group(1)))
+            for match in _COMPONENT_ID_PATTERN.finditer(text)
+        ]
+        if not component_ids:
+            return None
+        preceding_ids = [
+            component_id for start, component_id in component_ids if start <= position
+        ]
+        return preceding_ids[-1] if preceding_ids else component_ids[0][1]
@@ -0,0 +1,151 @@
+import os
+from typing import List
+
+from lark import Lark
+from lark.lexer import PatternStr
+from lark.parsers.lalr_analysis import Shift
+from lark.parsers.lalr_parser_state import ParserState
+
+
+class Completions:
+    """
+    Completions class represents what can be typed after a piece of text.
+
+    Args:
+        fragment (str): The end of the text that doesn't form a complete token yet.
+        literals (:obj:`List[str]`): The fixed strings that can follow the text, including :obj:`fragment`.
+        terminals (:obj:`List[str]`): The names of all terminals that can follow the text.
+        can_end (bool): Whether the text is complete, without :obj:`fragment`.
+    """
+
+    def __init__(
+        self, fragment: str, literals: List[str], terminals: List[str], can_end: bool
+    ) -> None:
+        self.__fragment = fragment
+        self.__literals = literals
+        self.__terminals = terminals
+        self.__can_end = can_end
+
+    @classmethod
+    def from_parser_state(
+        cls, lark_parser: Lark, parser_state: ParserState, fragment: str
+    ) -> "Completions":
+        """
+        Constructs the Completions of an LALR parser state.
+
+        Args:
+            lark_parser (:obj:`Lark`): The parser the state belongs to.
+            parser_state (:obj:`ParserState`): The state of the parser after the complete tokens of the text.
+            fragment (str): The rest of the text, which is not a complete token.
+
+        Returns:
+            :obj:`Completions`: The terminals the state accepts that can start with :obj:`fragment`.
+        """
+        literals = []
+        terminals = []
+        for terminal_name in sorted(cls._get_acceptable_terminals(parser_state)):
+            pattern = lark_parser.get_terminal(terminal_name).pattern
+            if isinstance(pattern, PatternStr):
+                value, start = pattern.value, fragment
+                if "i" in pattern.flags:
+                    value, start = value.lower(), start.lower()
+                if not value.startswith(start):
+                    continue
+                literals.append(pattern.value)
+            elif fragment and len(fragment) >= pattern.max_width:
+                continue
+            terminals.append(terminal_name)
+        can_end = not fragment and cls._accepts(parser_state, "$END")
+        return cls(fragment, literals, terminals, can_end)
+
+    def get_fragment(self) -> str:
+        """
+        Returns the end of the text that doesn't form a complete token yet.
+
+        Returns:
+            str: The incomplete end of the text, empty if the text ends with a complete token.
+        """
+        return self.__fragment
+
+    def get_literals(self) -> List[str]:
+        """
+        Returns the fixed strings that can follow the text.
+
+        Returns:
+            :obj:`List[str]`: The literals that can be typed from the start of the fragment.
+        """
+        return self.__literals
+
+    def get_continuations(self) -> List[str]:
+        """
+        Returns what can be typed after the text to complete a literal.
+
+        Returns:
+            :obj:`List[str]`: The literals, without the fragment already typed.
+        """
+        return [literal[len(self.__fragment) :] for literal in self.__literals]
+
+    def get_common_continuation(self) -> str:
+        """
+        Returns the text that all possible continuations start with.
+
+        Returns:
+            str: The longest text that can be added without ruling anything out, empty if the text can end here
+            or a terminal that isn't a literal can follow it.
+        """
+        if self.__can_end or len(self.__terminals) != len(self.__literals):
+            return ""
+        return os.path.commonprefix(self.get_continuations())
+
+    def get_terminals(self) -> List[str]:
+        """
+        Returns the names of the terminals that can follow the text.
+
+        Returns:
+            :obj:`List[str]`: The names of all terminals that can start with the fragment.
+        """
+        return self.__terminals
+
+    def can_end(self) -> bool:
+        """
+        Returns whether the text is already complete.
+
+        Returns:
+            bool: True if the text is valid as it is, False otherwise.
+        """
+        return self.__can_end
+
+    @classmethod
+    def _get_acceptable_terminals(cls, parser_state: ParserState) -> List[str]:
+        actions = parser_state.parse_conf.states[parser_state.position]
+        return [
+            name
+            for name in actions
+            if name.isupper() and name != "$END" and cls._accepts(parser_state, name)
+        ]
+
+    @staticmethod
+    def _accepts(parser_state: ParserState, terminal_name: str) -> bool:
+        # Replays the reductions the terminal would cause without copying the parser's stacks.
+        states = parser_state.parse_conf.states
+        end_state = parser_state.parse_conf.end_state
+        state_stack = parser_state.state_stack
+        depth = len(state_stack)
+        pushed: List = []
+        while True:
+            state = pushed[-1] if pushed else state_stack[depth - 1]
+            if terminal_name == "$END" and state == end_state:
+                return True
+            action = states[state].get(terminal_name)
+            if action is None:
+                return False
+            action_type, argument = action
+            if action_type is Shift:
+                return True
+            size = len(argument.expansion)
+            popped_from_pushed = min(size, len(pushed))
+            del pushed[len(pushed) - popped_from_pushed :]
+            depth -= size - popped_from_pushed
+            state = pushed[-1] if pushed else state_stack[depth - 1]
+            _, new_state = states[state][argument.origin.name]
+            pushed.append(new_state)
@@ -0,0 +1,109 @@
+import re
+from typing import Dict, List, Set
+
+# Strings and regular expressions are matched so that names inside them are skipped.
+_TOKEN_PATTERN = re.compile(
+    r'(?P<string>"(?:\\.|[^"\\])*"i?)'
+    r"|(?P<comment>//[^\n]*)"
+    r"|(?P<regexp>/(?:\\.|[^/\\\n])+/[imslux]*)"
+    r"|(?P<name>[_a-zA-Z][_a-zA-Z0-9]*)"
+)
+_DEFINITION_PATTERN = re.compile(
+    r"^\s*[?!]?(?P<name>[_a-zA-Z][_a-zA-Z0-9]*)(\{[^}]*\})?(\.-?\d+)?\s*:"
+)
+# Directives that change existing definitions can't be sliced safely.
+_UNSLICEABLE_DIRECTIVES = ("%override", "%extend")
+
+
+class GrammarSlicer:
+    """
+    GrammarSlicer class cuts a grammar down to the definitions reachable from a start rule.
+
+    Directives such as :obj:`%import` and :obj:`%ignore` are always kept, along with everything they refer to.
+
+    Args:
+        grammar (str): The text of the grammar.
+    """
+
+    def __init__(self, grammar: str) -> None:
+        self.__grammar = grammar
+        self.__definitions: Dict[str, List[str]] = dict()
+        self.__directives: List[str] = []
+        self.__sliceable = True
+        self._split_statements()
+
+    def slice(self, start_from: str) -> str:
+        """
+        Returns the part of the grammar reachable from a start rule.
+
+        Args:
+            start_from (str): The rule the slice should start from.
+
+        Returns:
+            str: The text of the definitions reachable from :obj:`start_from` and all directives.
+            The whole grammar is returned if the start rule isn't defined or the grammar can't be sliced.
+        """
+        if not self.__sliceable or start_from not in self.__definitions:
+            return self.__grammar
+        reachable = self.get_reachable(start_from)
+        lines = list(self.__directives)
+        for name, definition_lines in self.__definitions.items():
+            if name in reachable:
+                lines += definition_lines
+        return "\n".join(lines) + "\n"
+
+    def get_reachable(self, start_from: str) -> Set[str]:
+        """
+        Returns the names of the definitions reachable from a start rule.
+
+        Args:
+            start_from (str): The rule to start from.
+
+        Returns:
+            :obj:`Set[str]`: The names of all rules and terminals reachable from :obj:`start_from`,
+            including those used by directives.
+        """
+        to_visit = [start_from] + [
+            name
+            for directive in self.__directives
+            for name in self._get_references(directive)
+        ]
+        reachable = set()
+        while to_visit:
+            name = to_visit.pop()
+            if name in reachable or name not in self.__definitions:
+                continue
+            reachable.add(name)
+            for line in self.__definitions[name]:
+                to_visit += self._get_references(line)
+        return reachable
+
+    def _split_statements(self) -> None:
+        current_lines = None
+        for line in self.__grammar.splitlines():
+            stripped_line = line.strip()
+            if stripped_line.startswith("%"):
+                if stripped_line.startswith(_UNSLICEABLE_DIRECTIVES):
+                    self.__sliceable = False
+                self.__directives.append(line)
+                current_lines = None
+                continue
+            definition = _DEFINITION_PATTERN.match(line)
+            if definition:
+                name = definition.group("name")
+                if name in self.__definitions:
+                    self.__sliceable = False
+                current_lines = self.__definitions.setdefault(name, [])
+                current_lines.append(line)
+            elif current_lines is not None:
+                current_lines.append(line)
+            elif stripped_line and not stripped_line.startswith("//"):
+                self.__sliceable = False
+
+    @staticmethod
+    def _get_references(line: str) -> List[str]:
+        return [
+            match.group("name")
+            for match in _TOKEN_PATTERN.finditer(line)
+            if match.group("name")
+        ]
@@ -0,0 +1,209 @@
+import os
+from copy import copy
+from typing import List, Tuple
+
+from lark import Lark, exceptions
+from lark.lexer import PatternStr
+from lark.parsers.lalr_interactive_parser import InteractiveParser
+from lark.parsers.lalr_parser_state import ParserState
+
+from src.parser.base_parser import BaseParser
+from src.parser.completions import Completions
+from src.parser.validation_result import ValidationResult
+
+
+class IncrementalParser:
+    """
+    IncrementalParser class validates text that is edited a keystroke at a time.
+
+    It keeps the state of Lark's interactive parser after each of the last tokens of the previous text,
+    and resumes from the last state whose tokens the new text still starts with, so the cost of
+    validating a keystroke scales with the edit rather than with the whole text.
+
+    Args:
+        parser (:obj:`BaseParser`): The parser whose grammar and start rule the text is validated against.
+        prefix (str, optional): Text placed before every validated text, error positions exclude it.
+
+    Note:
+        Lark can only resume LALR parsers. If the start rule can't be built with LALR, every text is
+        validated from scratch with :obj:`BaseParser.diagnose`.
+    """
+
+    # Only tokens ending this close to the end of the text are checkpointed, which bounds both the
+    # memory used and the number of parser states copied on every keystroke.
+    CHECKPOINT_WINDOW = 32
+
+    def __init__(self, parser: BaseParser, prefix: str = "") -> None:
+        self.__parser = parser
+        self.__prefix = prefix
+        self.__text = ""
+        self.__checkpoints: List[Tuple[int, InteractiveParser]] = []
+        self.__last_token_state: Tuple[int, ParserState] | None = None
+        self.__fed_token_count = 0
+
+    def diagnose(self, text: str) -> ValidationResult:
+        """
+        Validates text, resuming from the parser state of the previous text where possible.
+
+        Args:
+            text (str): The text to validate.
+
+        Returns:
+            :obj:`ValidationResult`: The result of validating :obj:`text`. If the text is invalid, the result
+            also says whether it can still become valid by typing more.
+        """
+        full_text = f"{self.__prefix}{text}"
+        lark_parser = self.__parser.get_lalr_parser()
+        if lark_parser is None:
+            return self.__parser.diagnose(full_text).shift(-len(self.__prefix))
+        interactive_parser, exception = self._feed(lark_parser, full_text)
+        if exception is None:
+            try:
+                interactive_parser.feed_eof(
+                    interactive_parser.lexer_thread.state.last_token
+                )
+                return ValidationResult(True)
+            except exceptions.UnexpectedToken as eof_exception:
+                exception = eof_exception
+        result = ValidationResult.from_exception(exception, full_text)
+        if isinstance(exception, exceptions.UnexpectedCharacters):
+            completable = self._can_be_lexed(
+                lark_parser, full_text[exception.pos_in_stream :], exception.allowed
+            )
+        elif isinstance(exception, exceptions.UnexpectedToken):
+            # A token touching the end of the text may still be lexed as a longer, expected token.
+            token = exception.token
+            completable = token.type == "$END" or (
+                token.end_pos is not None
+                and token.end_pos >= len(full_text)
+                and self._can_be_lexed(
+                    lark_parser, full_text[token.start_pos :], exception.expected
+                )
+            )
+        else:
+            completable = False
+        result = ValidationResult(
+            False, result.get_position(), result.get_expected(), completable
+        )
+        return result.shift(-len(self.__prefix))
+
+    def complete(self, text: str) -> Completions:
+        """
+        Lists what can be typed after text, resuming from the parser state of the previous text where possible.
+
+        Args:
+            text (str): The text typed so far.
+
+        Returns:
+            :obj:`Completions`: The terminals that can follow :obj:`text`, which are empty if the text can no
+            longer become valid or the start rule can't be built with LALR.
+        """
+        full_text = f"{self.__prefix}{text}"
+        lark_parser = self.__parser.get_lalr_parser()
+        if lark_parser is None:
+            return Completions("", [], [], False)
+        interactive_parser, exception = self._feed(lark_parser, full_text)
+        parser_state = interactive_parser.parser_state
+        fragment_start = len(full_text)
+        if isinstance(exception, exceptions.UnexpectedCharacters):
+            fragment_start = exception.pos_in_stream
+        elif isinstance(exception, exceptions.UnexpectedToken):
+            # The rejected token may be the start of a longer one, so complete from before it.
+            token = exception.token
+            if (
+                token.end_pos < len(full_text)
+                or self.__last_token_state is None
+                or self.__last_token_state[0] != token.start_pos
+            ):
+                return Completions(full_text[token.start_pos :], [], [], False)
+            parser_state = self.__last_token_state[1]
+            fragment_start = token.start_pos
+        if fragment_start < len(self.__prefix):
+            return Completions("", [], [], False)
+        return Completions.from_parser_state(
+            lark_parser, parser_state, full_text[fragment_start:]
+        )
+
+    def get_fed_token_count(self) -> int:
+        """
+        Returns the number of tokens fed to the parser so far.
+
+        Returns:
+            int: The number of tokens fed since this parser was created.
+        """
+        return self.__fed_token_count
+
+    def _feed(
+        self, lark_parser: Lark, full_text: str
+    ) -> Tuple[InteractiveParser, exceptions.UnexpectedInput | None]:
+        interactive_parser = self._resume(lark_parser, full_text)
+        lexer_thread = interactive_parser.lexer_thread
+        self.__last_token_state = None
+        try:
+            for token in lexer_thread.lex(interactive_parser.parser_state):
+                if token.end_pos >= len(full_text):
+                    # Kept so that a last token that is rejected can be completed from before it.
+                    self.__last_token_state = (
+                        token.start_pos,
+                        self._snapshot(interactive_parser).parser_state,
+                    )
+                interactive_parser.feed_token(token)
+                self.__fed_token_count += 1
+                if token.end_pos >= len(full_text) - self.CHECKPOINT_WINDOW:
+                    self.__checkpoints.append(
+                        (token.end_pos, self._snapshot(interactive_parser))
+                    )
+        except exceptions.UnexpectedInput as exception:
+            return interactive_parser, exception
+        return interactive_parser, None
+
+    def _resume(self, lark_parser: Lark, full_text: str) -> InteractiveParser:
+        common_length = len(os.path.commonprefix([self.__text, full_text]))
+        # The character after a token decides where the lexer ends it, so it must be unchanged too.
+        self.__checkpoints = [
+            (end_position, checkpoint)
+            for end_position, checkpoint in self.__checkpoints
+            if end_position < common_length
+            and end_position >= len(full_text) - self.CHECKPOINT_WINDOW
+        ]
+        self.__text = full_text
+        if not self.__checkpoints:
+            return lark_parser.parse_interactive(full_text)
+        interactive_parser = self._snapshot(self.__checkpoints[-1][1])
+        interactive_parser.lexer_thread.state.text = full_text
+        return interactive_parser
+
+    @staticmethod
+    def _snapshot(interactive_parser: InteractiveParser) -> InteractiveParser:
+        # Lark deep copies the value stack, the values are never modified so a shallow copy is enough.
+        parser_state = interactive_parser.parser_state
+        lexer_thread = copy(interactive_parser.lexer_thread)
+        return InteractiveParser(
+            interactive_parser.parser,
+            ParserState(
+                parser_state.parse_conf,
+                lexer_thread,
+                list(parser_state.state_stack),
+                list(parser_state.value_stack),
+            ),
+            lexer_thread,
+        )
+
+    @staticmethod
+    def _can_be_lexed(lark_parser: Lark, rest: str, allowed) -> bool:
+        # No expected terminal matches the rest of the text, but a longer text could still match
+        # one that is wider than what is left.
+        for terminal_name in allowed or []:
+            try:
+                pattern = lark_parser.get_terminal(terminal_name).pattern
+            except KeyError:
+                continue
+            if isinstance(pattern, PatternStr):
+                value, start = pattern.value, rest
+                if "i" in pattern.flags:
+                    value, start = value.lower(), start.lower()
+                if value.startswith(start):
+                    return True
+            elif len(rest) < pattern.max_width:
+                return True
+        return False
@@ -0,0 +1,146 @@
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from lark import Lark, exceptions
+
+from src.parser.grammar_slicer import GrammarSlicer
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY, ParserRegistry
+
+
+def _build_parser(grammar: str, start_from: str, engine: ParserEngine) -> Tuple:
+    # Runs in a worker process, so it can't share the registry of the caller. Only LALR parsers are built here,
+    # as they are the only ones that can be serialized back.
+    regex = ParserRegistry().get_regex(grammar, start_from)
+    pattern = regex.pattern if regex else None
+    try:
+        parser = Lark(
+            GrammarSlicer(grammar).slice(start_from),
+            start=start_from,
+            **engine.get_lark_options(),
+        )
+    except exceptions.GrammarError:
+        # The caller compiles the Earley parser the request falls back to.
+        return start_from, engine, ParserEngine.EARLEY, None, pattern
+    parser_file = io.BytesIO()
+    parser.save(parser_file)
+    return start_from, engine, engine, parser_file.getvalue(), pattern
+
+
+class ParallelParserBuilder:
+    """
+    ParallelParserBuilder class compiles many parsers of a grammar at once in a pool of worker processes.
+
+    Each distinct start rule and LALR engine is compiled in a worker, along with the regular expression of the
+    start rule, and the serialized parser is added to a registry. Parsers the registry already holds, or can
+    load from its disk cache, are skipped. If no pool can be started the parsers are compiled one after another.
+
+    Args:
+        processes (int | None, optional): The number of worker processes, the number of CPUs if None.
+            Parsers are compiled in the calling process if it is 1.
+
+    Note:
+        Lark can only serialize LALR parsers, so parsers requested with Earley are compiled in the calling
+        process without using the pool. A worker whose LALR parser falls back to Earley only sends back the
+        fallback, so that the caller doesn't repeat the failing LALR analysis.
+    """
+
+    def __init__(self, processes: int | None = None) -> None:
+        self.__processes = processes if processes is not None else os.cpu_count() or 1
+
+    def build(
+        self,
+        grammar: str,
+        requests: Iterable[Tuple[str, ParserEngine]],
+        registry: ParserRegistry = PARSER_REGISTRY,
+        progress: Callable[[int, int, str], None] | None = None,
+    ) -> Dict[str, float]:
+        """
+        Compiles the parsers of a grammar and adds them to a registry.
+
+        Args:
+            grammar (str): The text of the grammar.
+            requests (:obj:`Iterable[Tuple[str, ParserEngine]]`): The start rules and engines to compile.
+            registry (:obj:`ParserRegistry`, optional): The registry to add the parsers to.
+            progress (:obj:`Callable[[int, int, str], None]`, optional): Called with the number of parsers
+                built so far, the number to build and the start rule of the parser just built.
+
+        Returns:
+            :obj:`Dict[str, float]`: The number of parsers ``built``, whether a ``pool`` was used and the
+            ``time`` taken in seconds.
+        """
+        start_time = time.perf_counter()
+        grammar_hash = registry.hash_grammar(grammar)
+        to_build = [
+            (start_from, engine)
+            for start_from, engine in dict.fromkeys(requests)
+            if not registry.has_parser(grammar, start_from, engine, grammar_hash)
+        ]
+        built: List[Tuple[str, ParserEngine]] = []
+
+        def report(start_from: str, engine: ParserEngine) -> None:
+            built.append((start_from, engine))
+            if progress is not None:
+                progress(len(built), len(to_build), start_from)
+
+        to_pool = [
+            (start_from, engine) for start_from, engine in to_build if engine.is_lalr()
+        ]
+        pooled = False
+        if self.__processes > 1 and len(to_pool) > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.__processes, len(to_pool))
+                ) as executor:
+                    futures = [
+                        executor.submit(_build_parser, grammar, start_from, engine)
+                        for start_from, engine in to_pool
+                    ]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        self._install(grammar, grammar_hash, registry, *result)
+                        report(result[0], result[1])
+                pooled = True
+            except (BrokenProcessPool, OSError):
+                pass
+        for start_from, engine in to_build:
+            if (start_from, engine) in built:
+                continue
+            registry.get_parser(grammar, start_from, grammar_hash, engine)
+            registry.get_regex(grammar, start_from, grammar_hash)
+            report(start_from, engine)
+        return {
+            "built": len(built),
+            "pool": pooled,
+            "time": time.perf_counter() - start_time,
+        }
+
+    @staticmethod
+    def _install(
+        grammar: str,
+        grammar_hash: str,
+        registry: ParserRegistry,
+        start_from: str,
+        engine: ParserEngine,
+        built_engine: ParserEngine,
+        serialized_parser: bytes | None,
+        regex: str | None,
+    ) -> None:
+        registry.add_regex(
+            grammar_hash, start_from, re.compile(regex) if regex else None
+        )
+        if serialized_parser is not None:
+            parser = Lark.load(io.BytesIO(serialized_parser))
+        else:
+            # The worker already found out which engine can be built, so a failing LALR analysis isn't repeated.
+            parser, built_engine = registry.get_parser(
+                grammar, start_from, grammar_hash, built_engine
+            )
+        registry.add_parser(
+            grammar_hash, start_from, engine, parser, built_engine, grammar
+        )
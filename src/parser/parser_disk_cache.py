@@ -0,0 +1,166 @@
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+import time
+from typing import Tuple
+
+import lark
+from lark import Lark
+
+from src.parser.parser_engine import ParserEngine
+
+
+class ParserDiskCache:
+    """
+    ParserDiskCache class stores compiled parsers in a directory so that they survive between launches.
+
+    Entries are keyed by the hash of the slice of the grammar reachable from the start rule, which is what the
+    parser is compiled from, the start rule, the requested engine and the installed Lark version. An entry is
+    never loaded for a slice or Lark version it wasn't built from, and is shared by grammars that only differ
+    elsewhere.
+
+    Args:
+        directory (str): The directory to store compiled parsers in, it is created if it doesn't exist.
+        max_age (float, optional): The number of seconds an entry can go unused before it is pruned.
+
+    Note:
+        Lark can only serialize LALR parsers. For LALR requests that fell back to Earley only the fallback
+        is recorded, so that the failing LALR analysis isn't repeated on the next launch.
+    """
+
+    FILE_EXT = "lark"
+
+    def __init__(self, directory: str, max_age: float = 30 * 24 * 60 * 60) -> None:
+        self.__directory = directory
+        self.__max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    def get_directory(self) -> str:
+        """
+        Returns the directory of the cache.
+
+        Returns:
+            str: The directory compiled parsers are stored in.
+        """
+        return self.__directory
+
+    def load(
+        self, slice_hash: str, start_from: str, engine: ParserEngine
+    ) -> Tuple[Lark | None, ParserEngine] | None:
+        """
+        Loads a compiled parser from the cache.
+
+        Args:
+            slice_hash (str): The hash of the grammar slice the parser is compiled from.
+            start_from (str): The start rule of the parser.
+            engine (:obj:`ParserEngine`): The engine that was requested for the parser.
+
+        Returns:
+            :obj:`Tuple[Lark | None, ParserEngine] | None`: The parser and the engine it was built with,
+            or None if there is no usable entry. The parser is None if the entry only records an Earley fallback.
+        """
+        path = self._get_path(slice_hash, start_from, engine)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+            if entry["lark_version"] != lark.__version__:
+                raise ValueError("Entry was built by a different Lark version.")
+            built_engine = ParserEngine(entry["engine"])
+            parser = None
+            if entry["parser"] is not None:
+                parser = Lark.load(io.BytesIO(entry["parser"]))
+        except Exception:
+            self._remove(path)
+            return None
+        os.utime(path)
+        return parser, built_engine
+
+    def save(
+        self,
+        slice_hash: str,
+        start_from: str,
+        engine: ParserEngine,
+        parser: Lark,
+        built_engine: ParserEngine,
+    ) -> None:
+        """
+        Saves a compiled parser to the cache.
+
+        Args:
+            slice_hash (str): The hash of the grammar slice the parser is compiled from.
+            start_from (str): The start rule of the parser.
+            engine (:obj:`ParserEngine`): The engine that was requested for the parser.
+            parser (:obj:`Lark`): The compiled parser.
+            built_engine (:obj:`ParserEngine`): The engine the parser was actually built with.
+        """
+        serialized_parser = None
+        if built_engine.is_lalr():
+            parser_file = io.BytesIO()
+            parser.save(parser_file)
+            serialized_parser = parser_file.getvalue()
+        elif engine == built_engine:
+            return
+        entry = {
+            "lark_version": lark.__version__,
+            "slice_hash": slice_hash,
+            "start_from": start_from,
+            "engine": built_engine.value,
+            "parser": serialized_parser,
+        }
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.__directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._get_path(slice_hash, start_from, engine))
+        except OSError:
+            self._remove(temp_path)
+
+    def prune(self) -> int:
+        """
+        Removes entries that can no longer be used or that haven't been used recently.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        removed = 0
+        now = time.time()
+        for file_name in os.listdir(self.__directory):
+            path = os.path.join(self.__directory, file_name)
+            if not os.path.isfile(path):
+                continue
+            if not file_name.endswith(f".{self.FILE_EXT}"):
+                # Left behind by an interrupted save.
+                if now - os.path.getmtime(path) > 60:
+                    removed += self._remove(path)
+                continue
+            if now - os.path.getmtime(path) > self.__max_age:
+                removed += self._remove(path)
+                continue
+            try:
+                with open(path, "rb") as file:
+                    lark_version = pickle.load(file)["lark_version"]
+            except Exception:
+                lark_version = None
+            if lark_version != lark.__version__:
+                removed += self._remove(path)
+        return removed
+
+    def _get_path(self, slice_hash: str, start_from: str, engine: ParserEngine):
+        key = hashlib.sha256(
+            f"{slice_hash}:{start_from}:{engine.value}:{lark.__version__}".encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        return os.path.join(self.__directory, f"{key}.{self.FILE_EXT}")
+
+    @staticmethod
+    def _remove(path: str) -> int:
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
@@ -0,0 +1,51 @@
+from enum import Enum
+from typing import Any, Dict
+
+
+class ParserEngine(Enum):
+    """
+    The Lark configurations a :obj:`BaseParser` can be built with.
+
+    :obj:`EARLEY` uses the dynamic lexer and :obj:`EARLEY_BASIC` the basic lexer, :obj:`EARLEY_EXPLICIT`
+    keeps every derivation of ambiguous text rather than resolving them. :obj:`LALR` uses the contextual
+    lexer and :obj:`LALR_BASIC` the basic lexer.
+
+    Note:
+        LALR parsers fall back to :obj:`EARLEY` when the grammar reachable from their start rule is not LALR(1).
+        The lexers other than the dynamic one split text into tokens greedily, so they may reject text that
+        :obj:`EARLEY` accepts.
+    """
+
+    EARLEY = "earley"
+    EARLEY_BASIC = "earley_basic"
+    EARLEY_EXPLICIT = "earley_explicit"
+    LALR = "lalr"
+    LALR_BASIC = "lalr_basic"
+
+    def is_lalr(self) -> bool:
+        """
+        Returns whether this engine builds LALR parsers, which can be serialized and parsed interactively.
+
+        Returns:
+            bool: True if this is an LALR engine, False otherwise.
+        """
+        return self in (ParserEngine.LALR, ParserEngine.LALR_BASIC)
+
+    def get_lark_options(self) -> Dict[str, Any]:
+        """
+        Returns the options to build a Lark parser with this engine.
+
+        Returns:
+            :obj:`Dict[str, Any]`: The keyword arguments to pass to :obj:`Lark`.
+        """
+        return {
+            ParserEngine.EARLEY: {"parser": "earley", "lexer": "dynamic"},
+            ParserEngine.EARLEY_BASIC: {"parser": "earley", "lexer": "basic"},
+            ParserEngine.EARLEY_EXPLICIT: {
+                "parser": "earley",
+                "lexer": "dynamic",
+                "ambiguity": "explicit",
+            },
+            ParserEngine.LALR: {"parser": "lalr", "lexer": "contextual"},
+            ParserEngine.LALR_BASIC: {"parser": "lalr", "lexer": "basic"},
+        }[self]
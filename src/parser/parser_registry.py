@@ -0,0 +1,487 @@
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from lark import Lark, exceptions
+
+from src.parser.grammar_slicer import GrammarSlicer
+from src.parser.parser_disk_cache import ParserDiskCache
+from src.parser.parser_engine import ParserEngine
+from src.parser.regex_compiler import RegexCompiler
+
+
+class ParserRegistry:
+    """
+    ParserRegistry class holds compiled Lark parsers so that they can be shared across the whole process.
+
+    Parsers are keyed by the hash of their grammar, their start rule and their requested engine,
+    meaning that every :obj:`BaseParser` built from the same grammar, start rule and engine shares a
+    single compiled parser. Each parser is compiled from only the part of the grammar reachable from its
+    start rule, and is also shared by every grammar with the same slice for that start rule, so grammars
+    that only differ elsewhere don't compile it again. If a :obj:`ParserDiskCache` is set, parsers are
+    loaded from it before being compiled and saved to it after being compiled.
+    """
+
+    def __init__(self) -> None:
+        self.__parsers: Dict[
+            Tuple[str, str, ParserEngine], Tuple[Lark, ParserEngine]
+        ] = dict()
+        self.__regexes: Dict[Tuple[str, str], re.Pattern | None] = dict()
+        self.__tree_parsers: Dict[Tuple[str, str], Lark] = dict()
+        self.__slicers: Dict[str, GrammarSlicer] = dict()
+        self.__slice_hashes: Dict[Tuple[str, str], str] = dict()
+        self.__slice_parsers: Dict[
+            Tuple[str, str, ParserEngine], Tuple[Lark, ParserEngine]
+        ] = dict()
+        self.__slice_regexes: Dict[Tuple[str, str], re.Pattern | None] = dict()
+        self.__slice_tree_parsers: Dict[Tuple[str, str], Lark] = dict()
+        self.__fallbacks: List[str] = []
+        self.__disk_cache: ParserDiskCache | None = None
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__disk_hits = 0
+        self.__shared = 0
+        self.__compile_time = 0.0
+
+    def set_disk_cache(self, disk_cache: ParserDiskCache | None) -> None:
+        """
+        Sets the on-disk cache that compiled parsers are loaded from and saved to.
+
+        Args:
+            disk_cache (:obj:`ParserDiskCache`, optional): The cache to use, or None to stop using one.
+        """
+        with self.__lock:
+            self.__disk_cache = disk_cache
+
+    @staticmethod
+    def hash_grammar(grammar: str) -> str:
+        """
+        Returns the hash used to identify a grammar in the registry.
+
+        Args:
+            grammar (str): The text of the grammar.
+
+        Returns:
+            str: The hex digest of the grammar.
+        """
+        return hashlib.sha256(grammar.encode("utf-8")).hexdigest()
+
+    def get_parser(
+        self,
+        grammar: str,
+        start_from: str,
+        grammar_hash: str = "",
+        engine: ParserEngine = ParserEngine.EARLEY,
+        record_fallback: bool = True,
+    ) -> Tuple[Lark, ParserEngine]:
+        """
+        Returns the compiled parser for a grammar and start rule, compiling it if it has not been seen before.
+
+        Args:
+            grammar (str): The text of the grammar.
+            start_from (str): The rule of the grammar to start parsing from.
+            grammar_hash (str, optional): The precomputed hash of the grammar.
+            engine (:obj:`ParserEngine`, optional): The engine to build the parser with.
+            record_fallback (bool, optional): Whether to report the start rule by :obj:`get_fallbacks` if an
+                LALR parser is requested but can't be built.
+
+        Returns:
+            :obj:`Tuple[Lark, ParserEngine]`: The compiled parser and the engine it was actually built with.
+        """
+        if not grammar_hash:
+            grammar_hash = self.hash_grammar(grammar)
+        key = (grammar_hash, start_from, engine)
+        with self.__lock:
+            entry = self.__parsers.get(key)
+            if entry is not None:
+                self.__hits += 1
+                return entry
+            grammar_slice = self._slice(grammar, grammar_hash, start_from)
+            slice_key = (
+                self._hash_slice(grammar_hash, start_from, grammar_slice),
+                start_from,
+                engine,
+            )
+            entry = self.__slice_parsers.get(slice_key)
+            if entry is not None:
+                self.__shared += 1
+            else:
+                self.__misses += 1
+                start_time = time.perf_counter()
+                entry = self._load_or_compile(
+                    grammar_slice, start_from, slice_key[0], engine, record_fallback
+                )
+                self.__compile_time += time.perf_counter() - start_time
+                self.__slice_parsers[slice_key] = entry
+            self.__parsers[key] = entry
+            return entry
+
+    def add_parser(
+        self,
+        grammar_hash: str,
+        start_from: str,
+        engine: ParserEngine,
+        parser: Lark,
+        built_engine: ParserEngine,
+        grammar: str = "",
+    ) -> None:
+        """
+        Adds a parser that was compiled elsewhere to the registry.
+
+        If the parser was built with another engine than the one requested, the start rule is reported by
+        :obj:`get_fallbacks`, as it would have been had the registry compiled it.
+
+        Args:
+            grammar_hash (str): The hash of the grammar the parser was compiled from.
+            start_from (str): The start rule of the parser.
+            engine (:obj:`ParserEngine`): The engine that was requested for the parser.
+            parser (:obj:`Lark`): The compiled parser.
+            built_engine (:obj:`ParserEngine`): The engine the parser was actually built with.
+            grammar (str, optional): The text of the grammar. If given, the parser is also shared with grammars
+                that have the same slice for the start rule, and saved to the disk cache if one is set.
+        """
+        with self.__lock:
+            self.__parsers[(grammar_hash, start_from, engine)] = (parser, built_engine)
+            if built_engine != engine:
+                self.__fallbacks.append(start_from)
+            if not grammar:
+                return
+            slice_hash = self._hash_slice(
+                grammar_hash, start_from, self._slice(grammar, grammar_hash, start_from)
+            )
+            self.__slice_parsers[(slice_hash, start_from, engine)] = (
+                parser,
+                built_engine,
+            )
+            if self.__disk_cache is not None:
+                self.__disk_cache.save(
+                    slice_hash, start_from, engine, parser, built_engine
+                )
+
+    def has_parser(
+        self,
+        grammar: str,
+        start_from: str,
+        engine: ParserEngine,
+        grammar_hash: str = "",
+    ) -> bool:
+        """
+        Returns whether the registry holds a parser, loading it from the disk cache if it can.
+
+        Args:
+            grammar (str): The text of the grammar of the parser.
+            start_from (str): The start rule of the parser.
+            engine (:obj:`ParserEngine`): The engine requested for the parser.
+            grammar_hash (str, optional): The precomputed hash of the grammar.
+
+        Returns:
+            bool: True if the parser can be fetched without compiling it, False otherwise.
+        """
+        if not grammar_hash:
+            grammar_hash = self.hash_grammar(grammar)
+        key = (grammar_hash, start_from, engine)
+        with self.__lock:
+            if key in self.__parsers:
+                return True
+            slice_key = (
+                self._hash_slice(
+                    grammar_hash,
+                    start_from,
+                    self._slice(grammar, grammar_hash, start_from),
+                ),
+                start_from,
+                engine,
+            )
+            entry = self.__slice_parsers.get(slice_key)
+            if entry is None and self.__disk_cache is not None:
+                entry = self.__disk_cache.load(slice_key[0], start_from, engine)
+                if entry is None or entry[0] is None:
+                    return False
+                self.__disk_hits += 1
+                self.__slice_parsers[slice_key] = entry
+            if entry is None:
+                return False
+            self.__parsers[key] = entry
+            return True
+
+    def _load_or_compile(
+        self,
+        grammar: str,
+        start_from: str,
+        slice_hash: str,
+        engine: ParserEngine,
+        record_fallback: bool = True,
+    ) -> Tuple[Lark, ParserEngine]:
+        if self.__disk_cache is None:
+            return self._compile(grammar, start_from, engine, record_fallback)
+        cached_entry = self.__disk_cache.load(slice_hash, start_from, engine)
+        if cached_entry is not None:
+            cached_parser, built_engine = cached_entry
+            if built_engine != engine and record_fallback:
+                self.__fallbacks.append(start_from)
+            if cached_parser is not None:
+                self.__disk_hits += 1
+                return cached_parser, built_engine
+            return self._compile(grammar, start_from, built_engine)
+        parser, built_engine = self._compile(
+            grammar, start_from, engine, record_fallback
+        )
+        self.__disk_cache.save(slice_hash, start_from, engine, parser, built_engine)
+        return parser, built_engine
+
+    def _compile(
+        self,
+        grammar: str,
+        start_from: str,
+        engine: ParserEngine,
+        record_fallback: bool = True,
+    ) -> Tuple[Lark, ParserEngine]:
+        try:
+            parser = Lark(grammar, start=start_from, **engine.get_lark_options())
+            return parser, engine
+        except exceptions.GrammarError:
+            if not engine.is_lalr():
+                raise
+            if record_fallback:
+                self.__fallbacks.append(start_from)
+        return (
+            Lark(grammar, start=start_from, **ParserEngine.EARLEY.get_lark_options()),
+            ParserEngine.EARLEY,
+        )
+
+    def get_tree_parser(
+        self, grammar: str, start_from: str, grammar_hash: str = ""
+    ) -> Lark:
+        """
+        Returns a parser whose parse trees keep every token, compiling it if it has not been seen before.
+
+        Args:
+            grammar (str): The text of the grammar.
+            start_from (str): The rule of the grammar to start parsing from.
+            grammar_hash (str, optional): The precomputed hash of the grammar.
+
+        Returns:
+            :obj:`Lark`: An LALR parser, or an Earley parser if the start rule can't be built with LALR.
+
+        Note:
+            These parsers are only used to build typed values, so they are not stored in the disk cache.
+        """
+        if not grammar_hash:
+            grammar_hash = self.hash_grammar(grammar)
+        key = (grammar_hash, start_from)
+        with self.__lock:
+            parser = self.__tree_parsers.get(key)
+            if parser is not None:
+                return parser
+            grammar_slice = self._slice(grammar, grammar_hash, start_from)
+            slice_key = (
+                self._hash_slice(grammar_hash, start_from, grammar_slice),
+                start_from,
+            )
+            parser = self.__slice_tree_parsers.get(slice_key)
+            if parser is not None:
+                self.__shared += 1
+                self.__tree_parsers[key] = parser
+                return parser
+            start_time = time.perf_counter()
+            try:
+                parser = Lark(
+                    grammar_slice,
+                    start=start_from,
+                    parser="lalr",
+                    lexer="contextual",
+                    keep_all_tokens=True,
+                )
+            except exceptions.GrammarError:
+                parser = Lark(grammar_slice, start=start_from, keep_all_tokens=True)
+            self.__compile_time += time.perf_counter() - start_time
+            self.__slice_tree_parsers[slice_key] = parser
+            self.__tree_parsers[key] = parser
+            return parser
+
+    def get_regex(
+        self, grammar: str, start_from: str, grammar_hash: str = ""
+    ) -> re.Pattern | None:
+        """
+        Returns the regular expression equivalent to a start rule, compiling it if it has not been seen before.
+
+        Args:
+            grammar (str): The text of the grammar.
+            start_from (str): The rule of the grammar to start from.
+            grammar_hash (str, optional): The precomputed hash of the grammar.
+
+        Returns:
+            :obj:`re.Pattern | None`: The compiled pattern, or None if the start rule isn't regular.
+        """
+        if not grammar_hash:
+            grammar_hash = self.hash_grammar(grammar)
+        key = (grammar_hash, start_from)
+        with self.__lock:
+            if key in self.__regexes:
+                return self.__regexes[key]
+            grammar_slice = self._slice(grammar, grammar_hash, start_from)
+            slice_key = (
+                self._hash_slice(grammar_hash, start_from, grammar_slice),
+                start_from,
+            )
+            if slice_key in self.__slice_regexes:
+                self.__shared += 1
+                pattern = self.__slice_regexes[slice_key]
+            else:
+                start_time = time.perf_counter()
+                pattern = RegexCompiler(grammar_slice).compile(start_from)
+                self.__compile_time += time.perf_counter() - start_time
+                self.__slice_regexes[slice_key] = pattern
+            self.__regexes[key] = pattern
+            return pattern
+
+    def add_regex(
+        self, grammar_hash: str, start_from: str, pattern: re.Pattern | None
+    ) -> None:
+        """
+        Adds a regular expression that was compiled elsewhere to the registry.
+
+        Args:
+            grammar_hash (str): The hash of the grammar the pattern was compiled from.
+            start_from (str): The start rule the pattern is equivalent to.
+            pattern (:obj:`re.Pattern`, optional): The pattern, or None if the start rule isn't regular.
+        """
+        with self.__lock:
+            self.__regexes[(grammar_hash, start_from)] = pattern
+
+    def reuse_parsers(
+        self, old_grammar: str, new_grammar: str, start_from: str
+    ) -> bool:
+        """
+        Makes the parsers and regular expression of a start rule compiled for a grammar available for an
+        edited version of the grammar, if the part of the grammar reachable from the start rule didn't change.
+
+        Args:
+            old_grammar (str): The text of the grammar the parsers were compiled from.
+            new_grammar (str): The text of the edited grammar.
+            start_from (str): The start rule of the parsers.
+
+        Returns:
+            bool: True if the start rule is unchanged by the edit, False if its parsers must be compiled again.
+        """
+        old_hash = self.hash_grammar(old_grammar)
+        new_hash = self.hash_grammar(new_grammar)
+        with self.__lock:
+            if self._slice(old_grammar, old_hash, start_from) != self._slice(
+                new_grammar, new_hash, start_from
+            ):
+                return False
+            for (grammar_hash, parser_start, engine), entry in list(
+                self.__parsers.items()
+            ):
+                if grammar_hash == old_hash and parser_start == start_from:
+                    self.__parsers.setdefault((new_hash, start_from, engine), entry)
+            if (old_hash, start_from) in self.__regexes:
+                self.__regexes.setdefault(
+                    (new_hash, start_from), self.__regexes[(old_hash, start_from)]
+                )
+            if (old_hash, start_from) in self.__tree_parsers:
+                self.__tree_parsers.setdefault(
+                    (new_hash, start_from), self.__tree_parsers[(old_hash, start_from)]
+                )
+            return True
+
+    def get_slice_hash(
+        self, grammar: str, start_from: str, grammar_hash: str = ""
+    ) -> str:
+        """
+        Returns the hash of the part of a grammar reachable from a start rule.
+
+        Args:
+            grammar (str): The text of the grammar.
+            start_from (str): The start rule of the slice.
+            grammar_hash (str, optional): The precomputed hash of the grammar.
+
+        Returns:
+            str: The hex digest of the slice, which is the same for every grammar that only differs elsewhere.
+        """
+        if not grammar_hash:
+            grammar_hash = self.hash_grammar(grammar)
+        with self.__lock:
+            return self._hash_slice(
+                grammar_hash,
+                start_from,
+                self._slice(grammar, grammar_hash, start_from),
+            )
+
+    def _hash_slice(
+        self, grammar_hash: str, start_from: str, grammar_slice: str
+    ) -> str:
+        key = (grammar_hash, start_from)
+        slice_hash = self.__slice_hashes.get(key)
+        if slice_hash is None:
+            slice_hash = self.hash_grammar(grammar_slice)
+            self.__slice_hashes[key] = slice_hash
+        return slice_hash
+
+    def _slice(self, grammar: str, grammar_hash: str, start_from: str) -> str:
+        slicer = self.__slicers.get(grammar_hash)
+        if slicer is None:
+            slicer = GrammarSlicer(grammar)
+            self.__slicers[grammar_hash] = slicer
+        return slicer.slice(start_from)
+
+    def get_fallbacks(self) -> List[str]:
+        """
+        Returns the start rules whose LALR parser could not be built and fell back to Earley.
+
+        Returns:
+            :obj:`List[str]`: The start rules that fell back to Earley.
+        """
+        with self.__lock:
+            return list(self.__fallbacks)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """
+        Returns statistics on how the registry has been used.
+
+        Returns:
+            :obj:`Dict[str, float]`: The number of cache ``hits`` and ``misses``, the number of misses
+            served by the disk cache as ``disk_hits``, the number of lookups served by a parser or regular
+            expression compiled for another grammar with the same slice as ``shared``, the number of distinct
+            ``parsers`` and regular expressions (``regexes``) currently held and the total ``compile_time``
+            spent compiling or loading parsers in seconds.
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "disk_hits": self.__disk_hits,
+                "shared": self.__shared,
+                "parsers": len({id(parser) for parser, _ in self.__parsers.values()}),
+                "regexes": len(
+                    {id(pattern) for pattern in self.__regexes.values() if pattern}
+                ),
+                "compile_time": self.__compile_time,
+            }
+
+    def clear(self) -> None:
+        """
+        Removes all compiled parsers from the registry and resets its statistics.
+        """
+        with self.__lock:
+            self.__parsers = dict()
+            self.__regexes = dict()
+            self.__tree_parsers = dict()
+            self.__slicers = dict()
+            self.__slice_hashes = dict()
+            self.__slice_parsers = dict()
+            self.__slice_regexes = dict()
+            self.__slice_tree_parsers = dict()
+            self.__fallbacks = []
+            self.__hits = 0
+            self.__misses = 0
+            self.__disk_hits = 0
+            self.__shared = 0
+            self.__compile_time = 0.0
+
+
+PARSER_REGISTRY = ParserRegistry()
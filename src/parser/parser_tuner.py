@@ -0,0 +1,207 @@
+"""
+Finds the fastest parser engine for every text and hybrid terminal of an ALOC spec and writes it to a tuning file.
+
+Run from the root of the repository:
+
+    $ python -m src.parser.parser_tuner ./src/aloc_spec.json ./src/aloc_spec_tuning.json
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+from src.parser.sentence_generator import SentenceGenerator
+from src.parser.validator_module import ValidatorModule
+
+
+class ParserTuner:
+    """
+    ParserTuner class benchmarks every parser engine on generated inputs and records the fastest.
+
+    For each parse root that isn't regular, valid sentences and near misses are generated from the grammar
+    and validated with every engine. Engines that can't be built for the parse root, or that don't accept and reject exactly
+    the same inputs as :obj:`ParserEngine.EARLEY`, are ruled out. The fastest remaining engine is chosen.
+
+    Regular parse roots are validated with their regular expression rather than a parser, so they are left
+    out of the tuning file and keep the engine requested for the spec.
+
+    A tuning file holds the fingerprint of the spec and grammar it was made for, so it is never applied
+    to a spec it doesn't match.
+    """
+
+    @staticmethod
+    def tune_parse_root(
+        grammar: str,
+        parse_root: str,
+        corpus: List[str],
+        repeats: int = 3,
+    ) -> Dict:
+        """
+        Benchmarks every engine on a parse root.
+
+        Args:
+            grammar (str): The text of the grammar.
+            parse_root (str): The rule of the grammar to benchmark.
+            corpus (:obj:`List[str]`): The inputs to validate.
+            repeats (int, optional): The number of times the corpus is validated, the best time is kept.
+
+        Returns:
+            :obj:`Dict`: The chosen ``engine``, the ``timings`` in seconds of the engines that agree with
+            :obj:`ParserEngine.EARLEY` and the engines that were ``ruled_out``.
+        """
+        registry = ParserRegistry()
+        reference_parser = BaseParser(
+            parse_root, grammar, registry, ParserEngine.EARLEY, regex_fast_path=False
+        )
+        expected = [reference_parser.parse(text) for text in corpus]
+        timings: Dict[str, float] = dict()
+        ruled_out: List[str] = []
+        for engine in ParserEngine:
+            parser = BaseParser(
+                parse_root, grammar, registry, engine, regex_fast_path=False
+            )
+            if parser.get_engine() != engine:
+                ruled_out.append(engine.value)
+                continue
+            if [parser.parse(text) for text in corpus] != expected:
+                ruled_out.append(engine.value)
+                continue
+            best_time = float("inf")
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                for text in corpus:
+                    parser.parse(text)
+                best_time = min(best_time, time.perf_counter() - start_time)
+            timings[engine.value] = best_time
+        return {
+            "engine": min(timings, key=timings.__getitem__),
+            "timings": timings,
+            "ruled_out": ruled_out,
+        }
+
+    @classmethod
+    def tune(
+        cls,
+        spec_path: str,
+        count: int = 200,
+        repeats: int = 3,
+        seed: int | None = 0,
+    ) -> Dict:
+        """
+        Tunes the parser engines of a spec.
+
+        Args:
+            spec_path (str): The path of the ALOC spec.
+            count (int, optional): The number of valid sentences, and of near misses, to generate for each
+                parse root.
+            repeats (int, optional): The number of times each corpus is validated, the best time is kept.
+            seed (int | None, optional): The seed the inputs are generated from.
+
+        Returns:
+            :obj:`Dict`: The contents of the tuning file.
+        """
+        with open(spec_path) as json_file:
+            spec_text = json_file.read()
+        data = json.loads(spec_text)
+        with open(data["contract"]["grammar_path"]) as grammar_file:
+            grammar = grammar_file.read()
+        generator = SentenceGenerator(grammar, seed)
+        registry = ParserRegistry()
+        parse_roots = dict()
+        for parse_root in ValidatorModule.get_parse_roots(data):
+            if registry.get_regex(grammar, parse_root) is not None:
+                continue
+            corpus = generator.generate_many(
+                parse_root, count
+            ) + generator.generate_near_misses(parse_root, count)
+            parse_roots[parse_root] = cls.tune_parse_root(
+                grammar, parse_root, corpus, repeats
+            )
+        return {
+            "fingerprint": ValidatorModule.fingerprint(spec_text, grammar),
+            "parse_roots": parse_roots,
+        }
+
+    @classmethod
+    def write(
+        cls,
+        spec_path: str,
+        output_path: str,
+        count: int = 200,
+        repeats: int = 3,
+        seed: int | None = 0,
+    ) -> None:
+        """
+        Tunes the parser engines of a spec and writes them to a tuning file.
+
+        Args:
+            spec_path (str): The path of the ALOC spec.
+            output_path (str): The path to write the tuning file to.
+            count (int, optional): The number of valid sentences, and of near misses, to generate for each
+                parse root.
+            repeats (int, optional): The number of times each corpus is validated, the best time is kept.
+            seed (int | None, optional): The seed the inputs are generated from.
+        """
+        tuning = cls.tune(spec_path, count, repeats, seed)
+        with open(output_path, "w") as file:
+            json.dump(tuning, file, indent=4)
+            file.write("\n")
+
+    @staticmethod
+    def load(path: str, fingerprint: str) -> Dict[str, ParserEngine]:
+        """
+        Reads the engines chosen for each parse root from a tuning file.
+
+        Args:
+            path (str): The path of the tuning file.
+            fingerprint (str): The fingerprint of the spec and grammar being loaded.
+
+        Returns:
+            :obj:`Dict[str, ParserEngine]`: The engine of each parse root, empty if the file doesn't exist,
+            can't be read or doesn't match the fingerprint.
+        """
+        if not os.path.exists(path):
+            return dict()
+        try:
+            with open(path) as file:
+                tuning = json.load(file)
+            if tuning["fingerprint"] != fingerprint:
+                return dict()
+            return {
+                parse_root: ParserEngine(entry["engine"])
+                for parse_root, entry in tuning["parse_roots"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return dict()
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(
+        description=__doc__.strip().split("\n")[0]
+    )
+    argument_parser.add_argument("spec_path")
+    argument_parser.add_argument("output_path")
+    argument_parser.add_argument(
+        "--count",
+        type=int,
+        default=200,
+        help="The number of valid sentences, and of near misses, to generate for each parse root.",
+    )
+    argument_parser.add_argument("--repeats", type=int, default=3)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    arguments = argument_parser.parse_args()
+    ParserTuner.write(
+        arguments.spec_path,
+        arguments.output_path,
+        arguments.count,
+        arguments.repeats,
+        arguments.seed,
+    )
+    with open(arguments.output_path) as tuning_file:
+        for parse_root, entry in json.load(tuning_file)["parse_roots"].items():
+            print(f"{parse_root:<24}{entry['engine']}")
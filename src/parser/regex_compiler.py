@@ -0,0 +1,128 @@
+import re
+from typing import Dict, List, Set
+
+from lark import exceptions
+from lark.grammar import NonTerminal, Rule, Symbol
+from lark.load_grammar import load_grammar
+
+
+class NotRegularError(Exception):
+    """Raised when the grammar reachable from a start rule can't be written as a regular expression."""
+
+
+class RegexCompiler:
+    """
+    RegexCompiler class compiles the regular parts of a grammar into native regular expressions.
+
+    A start rule can be compiled if none of the rules reachable from it are recursive, other than
+    rules that only refer to themselves as the last symbol of an alternative (right-linear rules,
+    such as :obj:`string: char | char string`).
+
+    Args:
+        grammar (str): The text of the grammar.
+    """
+
+    def __init__(self, grammar: str) -> None:
+        self.__grammar = grammar
+
+    def compile(self, start_from: str) -> re.Pattern | None:
+        """
+        Compiles the language of a start rule into a regular expression.
+
+        Args:
+            start_from (str): The rule of the grammar to compile.
+
+        Returns:
+            :obj:`re.Pattern | None`: A pattern that fully matches exactly the strings the start rule
+            accepts, or None if the start rule doesn't describe a regular language this compiler handles.
+        """
+        try:
+            loaded_grammar, _ = load_grammar(self.__grammar, "<grammar>", [], False)
+            terminals, rules, ignore = loaded_grammar.compile([start_from], set())
+        except exceptions.LarkError:
+            return None
+        if ignore:
+            return None
+        terminal_patterns = {
+            terminal.name: terminal.pattern.to_regexp() for terminal in terminals
+        }
+        expansions: Dict[str, List[Rule]] = dict()
+        for rule in rules:
+            expansions.setdefault(rule.origin.name, []).append(rule)
+        if start_from not in expansions:
+            return None
+        try:
+            pattern = self._compile_rule(
+                start_from, expansions, terminal_patterns, dict(), set()
+            )
+        except NotRegularError:
+            return None
+        try:
+            return re.compile(pattern)
+        except (re.error, RecursionError, OverflowError):
+            return None
+
+    def _compile_rule(
+        self,
+        rule_name: str,
+        expansions: Dict[str, List[Rule]],
+        terminal_patterns: Dict[str, str],
+        compiled: Dict[str, str],
+        in_progress: Set[str],
+    ) -> str:
+        if rule_name in compiled:
+            return compiled[rule_name]
+        if rule_name in in_progress:
+            raise NotRegularError(f"{rule_name} is not right-linear.")
+        in_progress.add(rule_name)
+        base_alternatives = []
+        recursive_alternatives = []
+        for rule in expansions[rule_name]:
+            symbols = rule.expansion
+            if symbols and symbols[-1] == NonTerminal(rule_name):
+                recursive_alternatives.append(symbols[:-1])
+            else:
+                base_alternatives.append(symbols)
+        if not base_alternatives:
+            raise NotRegularError(f"{rule_name} never terminates.")
+
+        def compile_alternative(symbols: List[Symbol]) -> str:
+            return "".join(
+                self._compile_symbol(
+                    symbol, expansions, terminal_patterns, compiled, in_progress
+                )
+                for symbol in symbols
+            )
+
+        pattern = self._alternation(
+            [compile_alternative(symbols) for symbols in base_alternatives]
+        )
+        if recursive_alternatives:
+            prefix = self._alternation(
+                [compile_alternative(symbols) for symbols in recursive_alternatives]
+            )
+            pattern = f"(?:{prefix}*{pattern})"
+        in_progress.remove(rule_name)
+        compiled[rule_name] = pattern
+        return pattern
+
+    def _compile_symbol(
+        self,
+        symbol: Symbol,
+        expansions: Dict[str, List[Rule]],
+        terminal_patterns: Dict[str, str],
+        compiled: Dict[str, str],
+        in_progress: Set[str],
+    ) -> str:
+        if symbol.is_term:
+            return f"(?:{terminal_patterns[symbol.name]})"
+        return self._compile_rule(
+            symbol.name, expansions, terminal_patterns, compiled, in_progress
+        )
+
+    @staticmethod
+    def _alternation(patterns: List[str]) -> str:
+        unique_patterns = list(dict.fromkeys(patterns))
+        if len(unique_patterns) == 1:
+            return f"(?:{unique_patterns[0]})"
+        return f"(?:{'|'.join(unique_patterns)})"
@@ -0,0 +1,308 @@
+import random
+import re
+import sys
+from typing import Dict, List, Set, Tuple
+
+from lark import exceptions
+from lark.grammar import NonTerminal, Rule, Symbol
+from lark.lexer import PatternStr
+from lark.load_grammar import load_grammar
+
+# The parser of regular expressions was made private in Python 3.11, its old name is deprecated since.
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+else:
+    import sre_parse
+
+# The character classes of regular expressions, restricted to printable ASCII.
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: "0123456789",
+    sre_parse.CATEGORY_SPACE: " ",
+    sre_parse.CATEGORY_WORD: "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_",
+}
+_PRINTABLE = [chr(code) for code in range(32, 127)]
+
+
+class SentenceGenerator:
+    """
+    SentenceGenerator class generates random sentences of a grammar, and near misses of them.
+
+    Sentences are built by expanding the rules of the grammar from a start rule, choosing between the
+    alternatives of a rule at random. Alternatives that lead to longer sentences are only chosen with
+    :obj:`expansion_probability`, so the lengths of generated sentences follow a geometric distribution.
+    Once :obj:`max_depth` rules have been expanded, only the alternatives that finish soonest are chosen.
+
+    Args:
+        grammar (str): The text of the grammar.
+        seed (int | None, optional): The seed of the random choices, generation is reproducible if it is set.
+        max_depth (int, optional): The depth of rule expansions beyond which sentences are finished off.
+        expansion_probability (float, optional): The probability of choosing any alternative over one that
+            finishes soonest.
+        max_repeat (int, optional): The most times an unbounded repeat of a regular expression is repeated.
+    """
+
+    def __init__(
+        self,
+        grammar: str,
+        seed: int | None = None,
+        max_depth: int = 16,
+        expansion_probability: float = 0.5,
+        max_repeat: int = 8,
+    ) -> None:
+        self.__grammar = grammar
+        self.__random = random.Random(seed)
+        self.__max_depth = max_depth
+        self.__expansion_probability = expansion_probability
+        self.__max_repeat = max_repeat
+        self.__compiled: Dict[str, Tuple[Dict[str, List[Rule]], Dict]] = dict()
+        self.__alphabet: List[str] | None = None
+
+    def generate(self, start_from: str) -> str:
+        """
+        Generates a random sentence of a start rule.
+
+        Args:
+            start_from (str): The rule of the grammar to generate a sentence of.
+
+        Returns:
+            str: A sentence accepted by :obj:`start_from`.
+
+        Raises:
+            ValueError: If the grammar can't be compiled from :obj:`start_from`.
+        """
+        expansions, terminals = self._compile(start_from)
+        heights = self._get_heights(expansions)
+        # Symbols are expanded depth-first from an explicit stack, so deep sentences don't hit the recursion limit.
+        parts: List[str] = []
+        to_expand: List[Tuple[Symbol, int]] = [(NonTerminal(start_from), 0)]
+        while to_expand:
+            symbol, depth = to_expand.pop()
+            if symbol.name in terminals:
+                parts.append(self._generate_terminal(terminals[symbol.name]))
+                continue
+            rule = self._choose_rule(expansions[symbol.name], heights, depth)
+            to_expand += [(child, depth + 1) for child in reversed(rule.expansion)]
+        return "".join(parts)
+
+    def generate_many(self, start_from: str, count: int) -> List[str]:
+        """
+        Generates random sentences of a start rule.
+
+        Args:
+            start_from (str): The rule of the grammar to generate sentences of.
+            count (int): The number of sentences to generate.
+
+        Returns:
+            :obj:`List[str]`: The sentences, which may repeat.
+        """
+        return [self.generate(start_from) for _ in range(count)]
+
+    def mutate(self, sentence: str) -> str:
+        """
+        Makes a single random edit to a sentence.
+
+        The edit deletes, inserts, replaces or swaps characters, or truncates the sentence. Inserted
+        characters are taken from the literals of the grammar, so the result is a near miss.
+
+        Args:
+            sentence (str): The sentence to edit.
+
+        Returns:
+            str: The edited sentence, which differs from :obj:`sentence`. It is usually, but not always, invalid.
+        """
+        alphabet = self._get_alphabet()
+        while True:
+            position = self.__random.randrange(len(sentence) + 1)
+            edit = self.__random.choice(
+                ["delete", "insert", "replace", "swap", "truncate"]
+            )
+            if edit == "insert" or not sentence:
+                mutation = (
+                    sentence[:position]
+                    + self.__random.choice(alphabet)
+                    + sentence[position:]
+                )
+            elif edit == "truncate":
+                mutation = sentence[: min(position, len(sentence) - 1)]
+            else:
+                position = min(position, len(sentence) - 1)
+                if edit == "delete":
+                    mutation = sentence[:position] + sentence[position + 1 :]
+                elif edit == "replace":
+                    mutation = (
+                        sentence[:position]
+                        + self.__random.choice(alphabet)
+                        + sentence[position + 1 :]
+                    )
+                else:
+                    position = max(min(position, len(sentence) - 2), 0)
+                    mutation = (
+                        sentence[:position]
+                        + sentence[position + 1 : position + 2]
+                        + sentence[position : position + 1]
+                        + sentence[position + 2 :]
+                    )
+            if mutation != sentence:
+                return mutation
+
+    def generate_near_misses(
+        self, start_from: str, count: int, parser=None, max_attempts: int = 10
+    ) -> List[str]:
+        """
+        Generates near misses of a start rule, sentences that are a single edit away from valid ones.
+
+        Args:
+            start_from (str): The rule of the grammar to generate near misses of.
+            count (int): The number of near misses to generate.
+            parser (:obj:`BaseParser`, optional): A parser of :obj:`start_from`, if given only mutations it
+                rejects are kept.
+            max_attempts (int, optional): The number of mutations tried for each near miss before giving up
+                on it.
+
+        Returns:
+            :obj:`List[str]`: The near misses, fewer than :obj:`count` if a parser is given and too many
+            mutations turned out to be valid.
+        """
+        near_misses = []
+        for _ in range(count):
+            sentence = self.generate(start_from)
+            for _ in range(max_attempts):
+                mutation = self.mutate(sentence)
+                if parser is None or not parser.parse(mutation):
+                    near_misses.append(mutation)
+                    break
+        return near_misses
+
+    def _compile(self, start_from: str) -> Tuple[Dict[str, List[Rule]], Dict]:
+        if start_from not in self.__compiled:
+            try:
+                loaded_grammar, _ = load_grammar(self.__grammar, "<grammar>", [], False)
+                terminals, rules, _ = loaded_grammar.compile([start_from], set())
+            except exceptions.LarkError as error:
+                raise ValueError(
+                    f"Can't generate sentences of {start_from}: {error}"
+                ) from error
+            expansions: Dict[str, List[Rule]] = dict()
+            for rule in rules:
+                expansions.setdefault(rule.origin.name, []).append(rule)
+            if start_from not in expansions:
+                raise ValueError(f"Can't generate sentences of {start_from}.")
+            self.__compiled[start_from] = (
+                expansions,
+                {terminal.name: terminal.pattern for terminal in terminals},
+            )
+        return self.__compiled[start_from]
+
+    @staticmethod
+    def _get_heights(expansions: Dict[str, List[Rule]]) -> Dict[str, int]:
+        # The height of a rule is the least depth of expansions it needs to finish a sentence.
+        heights: Dict[str, int] = dict()
+        changed = True
+        while changed:
+            changed = False
+            for name, rules in expansions.items():
+                for rule in rules:
+                    height = SentenceGenerator._get_rule_height(rule, heights)
+                    if height is not None and height < heights.get(name, height + 1):
+                        heights[name] = height
+                        changed = True
+        return heights
+
+    @staticmethod
+    def _get_rule_height(rule: Rule, heights: Dict[str, int]) -> int | None:
+        child_heights = [
+            0 if symbol.is_term else heights.get(symbol.name)
+            for symbol in rule.expansion
+        ]
+        if None in child_heights:
+            return None
+        return 1 + max(child_heights, default=0)
+
+    def _choose_rule(
+        self, rules: List[Rule], heights: Dict[str, int], depth: int
+    ) -> Rule:
+        rule_heights = [self._get_rule_height(rule, heights) for rule in rules]
+        least_height = min(height for height in rule_heights if height is not None)
+        shortest = [
+            rule for rule, height in zip(rules, rule_heights) if height == least_height
+        ]
+        if (
+            depth >= self.__max_depth
+            or self.__random.random() >= self.__expansion_probability
+        ):
+            return self.__random.choice(shortest)
+        fitting = [
+            rule
+            for rule, height in zip(rules, rule_heights)
+            if height is not None and depth + height <= self.__max_depth
+        ]
+        return self.__random.choice(fitting or shortest)
+
+    def _generate_terminal(self, pattern) -> str:
+        if isinstance(pattern, PatternStr):
+            text = pattern.value
+        else:
+            text = self._generate_regex(sre_parse.parse(pattern.value))
+        if "i" in pattern.flags:
+            return "".join(
+                self.__random.choice([char.lower(), char.upper()]) for char in text
+            )
+        return text
+
+    def _generate_regex(self, parsed_pattern) -> str:
+        parts = []
+        for operator, argument in parsed_pattern:
+            if operator == sre_parse.LITERAL:
+                parts.append(chr(argument))
+            elif operator == sre_parse.ANY:
+                parts.append(self.__random.choice(_PRINTABLE))
+            elif operator == sre_parse.IN:
+                parts.append(self._generate_set(argument))
+            elif operator == sre_parse.BRANCH:
+                parts.append(self._generate_regex(self.__random.choice(argument[1])))
+            elif operator == sre_parse.SUBPATTERN:
+                parts.append(self._generate_regex(argument[-1]))
+            elif operator in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+                low, high, repeated_pattern = argument
+                if high == sre_parse.MAXREPEAT:
+                    high = low + self.__max_repeat
+                parts += [
+                    self._generate_regex(repeated_pattern)
+                    for _ in range(self.__random.randint(low, high))
+                ]
+            elif operator == sre_parse.AT:
+                continue
+            else:
+                raise ValueError(
+                    f"Can't generate text for regular expression {operator}."
+                )
+        return "".join(parts)
+
+    def _generate_set(self, items) -> str:
+        choices: Set[str] = set()
+        negated = False
+        for operator, argument in items:
+            if operator == sre_parse.NEGATE:
+                negated = True
+            elif operator == sre_parse.LITERAL:
+                choices.add(chr(argument))
+            elif operator == sre_parse.RANGE:
+                choices.update(
+                    chr(code) for code in range(argument[0], argument[1] + 1)
+                )
+            elif operator == sre_parse.CATEGORY and argument in _CATEGORIES:
+                choices.update(_CATEGORIES[argument])
+            else:
+                raise ValueError(f"Can't generate text for character set {operator}.")
+        if negated:
+            choices = set(_PRINTABLE) - choices
+        return self.__random.choice(sorted(choices))
+
+    def _get_alphabet(self) -> List[str]:
+        if self.__alphabet is None:
+            literal_characters = set(re.findall(r'"((?:\\.|[^"\\])*)"', self.__grammar))
+            self.__alphabet = sorted(
+                {char for literal in literal_characters for char in literal}
+                | set(_PRINTABLE[:1])
+            )
+        return self.__alphabet
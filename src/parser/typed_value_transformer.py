@@ -0,0 +1,160 @@
+import datetime
+from decimal import Decimal
+from typing import Any, List
+
+from lark import Token, Tree
+from lark.exceptions import VisitError
+from lark.visitors import Transformer_NonRecursive
+
+from src.parser.typed_values import Amount, NamedObject, Operation
+
+MONTHS = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+OPERATORS = {
+    "+": "PLUS",
+    "-": "MINUS",
+    "*": "TIMES",
+    "/": "DIVIDE",
+}
+# Operators that bind tighter come first, operators of the same precedence are left associative.
+OPERATOR_PRECEDENCE = [["TIMES", "DIVIDE"], ["PLUS", "MINUS"]]
+
+
+class _Terms(list):
+    """The operands and operators of a numerical expression, in the order they were written."""
+
+
+class TypedValueTransformer(Transformer_NonRecursive):
+    """
+    TypedValueTransformer class turns parse trees of the ALOC grammar into typed values.
+
+    The trees must keep all of their tokens. The values produced for each start rule are:
+        :obj:`date`: The proleptic Gregorian ordinal of the date (see :obj:`datetime.date.toordinal`),
+        or the name of the date, such as :obj:`ANYDATE`.
+        :obj:`object`: An :obj:`Amount` or a :obj:`NamedObject`.
+        :obj:`numerical_expression`: A :obj:`Decimal`, an :obj:`Amount` or an :obj:`Operation` tree, built
+        with the usual operator precedence whatever the parser's tree looks like.
+        :obj:`subject`: The text of the subject.
+
+    Note:
+        The rules are looked up by the names they have in the ALOC grammar (``src/grammar.txt``), as a spec
+        doesn't say how the text of its terminals maps onto values. Grammars that name their rules
+        differently get no typed values, :obj:`to_typed_value` returns None for them, and rules given these
+        names must have the same shape as in the ALOC grammar.
+    """
+
+    @classmethod
+    def to_typed_value(cls, tree: Tree) -> Any | None:
+        """
+        Converts a parse tree into a typed value.
+
+        Args:
+            tree (:obj:`Tree`): The parse tree, with all of its tokens kept.
+
+        Returns:
+            :obj:`Any | None`: The typed value, or None if the tree's rule has no typed value or the tree
+            describes an impossible value, such as the 31st of February.
+        """
+        try:
+            value = cls().transform(tree)
+        except VisitError:
+            return None
+        if isinstance(value, _Terms):
+            return cls._build_operation(value)
+        if isinstance(value, Tree):
+            return None
+        return value
+
+    def digit(self, children: List[Token]) -> str:
+        return str(children[0])
+
+    def num(self, children: List[str]) -> str:
+        return "".join(children)
+
+    def month(self, children: List[Token]) -> int:
+        return MONTHS.index(str(children[0])) + 1
+
+    def date(self, children: List) -> int | str:
+        if len(children) == 1:
+            return str(children[0]).removeprefix("on ")
+        _, day, _, month, _, year = children
+        return datetime.date(int(year), month, int(day)).toordinal()
+
+    def pounds(self, _) -> str:
+        return "GBP"
+
+    def dollars(self, _) -> str:
+        return "USD"
+
+    def euros(self, _) -> str:
+        return "EUR"
+
+    def numerical_object(self, children: List) -> Amount:
+        currency, _, amount = children
+        return Amount(Decimal(amount), currency)
+
+    def quoted_string(self, children: List[Token]) -> str:
+        return str(children[0])[1:-1]
+
+    def nonnumerical_object(self, children: List) -> NamedObject:
+        kind, name = children
+        return NamedObject(str(kind).strip(), name)
+
+    def object(self, children: List) -> Amount | NamedObject:
+        return children[0]
+
+    def operator(self, children: List) -> str:
+        return children[0]
+
+    def plus(self, children: List[Token]) -> str:
+        return OPERATORS.get(str(children[0]), str(children[0]))
+
+    minus = times = divide = plus
+
+    def numerical_expression(self, children: List) -> _Terms:
+        if len(children) == 1:
+            operand = children[0]
+            if isinstance(operand, str):
+                operand = Decimal(operand)
+            return _Terms([operand])
+        left, _, operator, _, right = children
+        return _Terms(left + [operator] + right)
+
+    def char(self, children: List[Token]) -> str:
+        return str(children[0])
+
+    def string(self, children: List[str]) -> str:
+        return "".join(children)
+
+    def subject(self, children: List[str]) -> str:
+        return children[0]
+
+    @staticmethod
+    def _build_operation(terms: List) -> "Decimal | Amount | Operation":
+        operands = terms[0::2]
+        operators = terms[1::2]
+        for precedence_level in OPERATOR_PRECEDENCE:
+            reduced_operands = [operands[0]]
+            reduced_operators = []
+            for operator, operand in zip(operators, operands[1:]):
+                if operator in precedence_level:
+                    reduced_operands[-1] = Operation(
+                        operator, reduced_operands[-1], operand
+                    )
+                else:
+                    reduced_operators.append(operator)
+                    reduced_operands.append(operand)
+            operands, operators = reduced_operands, reduced_operators
+        return operands[0]
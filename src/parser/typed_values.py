@@ -0,0 +1,153 @@
+from decimal import Decimal
+
+
+class Amount:
+    """
+    Amount class represents an amount of money, such as :obj:`GBP 100`.
+
+    Args:
+        amount (:obj:`Decimal`): The amount of money.
+        currency (str): The ISO 4217 code of the currency of the amount.
+    """
+
+    def __init__(self, amount: Decimal, currency: str) -> None:
+        self.__amount = amount
+        self.__currency = currency
+
+    def get_amount(self) -> Decimal:
+        """
+        Returns the amount of money.
+
+        Returns:
+            :obj:`Decimal`: The amount of money.
+        """
+        return self.__amount
+
+    def get_currency(self) -> str:
+        """
+        Returns the currency of the amount.
+
+        Returns:
+            str: The ISO 4217 code of the currency.
+        """
+        return self.__currency
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Amount)
+            and self.__amount == other.get_amount()
+            and self.__currency == other.get_currency()
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__amount, self.__currency))
+
+    def __repr__(self) -> str:
+        return f"Amount({self.__currency} {self.__amount})"
+
+
+class NamedObject:
+    """
+    NamedObject class represents an object that isn't an amount of money, such as :obj:`REPORT "receipt"`.
+
+    Args:
+        kind (str): The kind of the object, such as :obj:`REPORT`.
+        name (str): The name of the object, without its quotes.
+    """
+
+    def __init__(self, kind: str, name: str) -> None:
+        self.__kind = kind
+        self.__name = name
+
+    def get_kind(self) -> str:
+        """
+        Returns the kind of the object.
+
+        Returns:
+            str: The kind of the object.
+        """
+        return self.__kind
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the object.
+
+        Returns:
+            str: The name of the object.
+        """
+        return self.__name
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, NamedObject)
+            and self.__kind == other.get_kind()
+            and self.__name == other.get_name()
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__kind, self.__name))
+
+    def __repr__(self) -> str:
+        return f"NamedObject({self.__kind} {self.__name!r})"
+
+
+class Operation:
+    """
+    Operation class represents an operator applied to two operands of a numerical expression.
+
+    Args:
+        operator (str): The operator, one of :obj:`PLUS`, :obj:`MINUS`, :obj:`TIMES` or :obj:`DIVIDE`.
+        left (:obj:`Decimal | Amount | Operation`): The left operand.
+        right (:obj:`Decimal | Amount | Operation`): The right operand.
+    """
+
+    def __init__(
+        self,
+        operator: str,
+        left: "Decimal | Amount | Operation",
+        right: "Decimal | Amount | Operation",
+    ) -> None:
+        self.__operator = operator
+        self.__left = left
+        self.__right = right
+
+    def get_operator(self) -> str:
+        """
+        Returns the operator of the operation.
+
+        Returns:
+            str: The name of the operator.
+        """
+        return self.__operator
+
+    def get_left(self) -> "Decimal | Amount | Operation":
+        """
+        Returns the left operand of the operation.
+
+        Returns:
+            :obj:`Decimal | Amount | Operation`: The left operand.
+        """
+        return self.__left
+
+    def get_right(self) -> "Decimal | Amount | Operation":
+        """
+        Returns the right operand of the operation.
+
+        Returns:
+            :obj:`Decimal | Amount | Operation`: The right operand.
+        """
+        return self.__right
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Operation)
+            and self.__operator == other.get_operator()
+            and self.__left == other.get_left()
+            and self.__right == other.get_right()
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__operator, self.__left, self.__right))
+
+    def __repr__(self) -> str:
+        return f"Operation({self.__left!r} {self.__operator} {self.__right!r})"
@@ -0,0 +1,127 @@
+from typing import List
+
+from lark import exceptions
+
+
+class ValidationResult:
+    """
+    ValidationResult class represents the outcome of validating a piece of text.
+
+    Args:
+        valid (bool): Whether the text was valid.
+        position (int | None, optional): The index of the text where validation failed, None if it was valid.
+        expected (:obj:`List[str]`, optional): The names of the terminals the parser expected at :obj:`position`.
+        completable (bool, optional): False if it is known that no text added to the end can make the text valid.
+    """
+
+    def __init__(
+        self,
+        valid: bool,
+        position: int | None = None,
+        expected: List[str] | None = None,
+        completable: bool = True,
+    ) -> None:
+        self.__valid = valid
+        self.__position = position
+        self.__expected = list(expected) if expected is not None else []
+        self.__completable = completable
+
+    @classmethod
+    def from_exception(
+        cls, exception: exceptions.UnexpectedInput, text: str
+    ) -> "ValidationResult":
+        """
+        Constructs a failed ValidationResult from the exception a Lark parser raised.
+
+        Args:
+            exception (:obj:`UnexpectedInput`): The exception raised while parsing :obj:`text`.
+            text (str): The text that was parsed.
+
+        Returns:
+            :obj:`ValidationResult`: The failed result, positioned at the end of :obj:`text` if the parser
+            ran out of input.
+        """
+        position = exception.pos_in_stream
+        expected = set()
+        if isinstance(exception, exceptions.UnexpectedToken):
+            expected = exception.expected
+            if exception.token.type == "$END":
+                position = len(text)
+        elif isinstance(exception, exceptions.UnexpectedCharacters):
+            expected = exception.allowed or set()
+        elif isinstance(exception, exceptions.UnexpectedEOF):
+            expected = set(exception.expected)
+            position = len(text)
+        if position is None or position < 0:
+            position = len(text)
+        return cls(False, position, sorted(expected))
+
+    def is_valid(self) -> bool:
+        """
+        Returns whether the text was valid.
+
+        Returns:
+            bool: True if the text was valid, False otherwise.
+        """
+        return self.__valid
+
+    def get_position(self) -> int | None:
+        """
+        Returns where validation of the text failed.
+
+        Returns:
+            int | None: The index of the first character that couldn't be parsed, None if the text was valid.
+        """
+        return self.__position
+
+    def get_expected(self) -> List[str]:
+        """
+        Returns what the parser expected where validation failed.
+
+        Returns:
+            :obj:`List[str]`: The names of the expected terminals, empty if the text was valid or they are unknown.
+        """
+        return self.__expected
+
+    def can_become_valid(self) -> bool:
+        """
+        Returns whether adding text to the end could make the text valid.
+
+        Returns:
+            bool: False if the text can no longer become valid, True if it is valid or might still become valid.
+        """
+        return self.__completable
+
+    def shift(self, offset: int) -> "ValidationResult":
+        """
+        Returns a copy of this result with its position moved, used when the validated text had a prefix added.
+
+        Args:
+            offset (int): The number of characters to move the position by.
+
+        Returns:
+            :obj:`ValidationResult`: The moved result, its position is never moved before the start of the text.
+        """
+        if self.__position is None:
+            return self
+        return ValidationResult(
+            self.__valid,
+            max(self.__position + offset, 0),
+            self.__expected,
+            self.__completable,
+        )
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, ValidationResult)
+            and self.__valid == other.is_valid()
+            and self.__position == other.get_position()
+            and self.__expected == other.get_expected()
+            and self.__completable == other.can_become_valid()
+        )
+
+    def __repr__(self) -> str:
+        if self.__valid:
+            return "ValidationResult(valid)"
+        state = "incomplete" if self.__completable else "invalid"
+        return f"ValidationResult({state} at {self.__position}, expected {self.__expected})"
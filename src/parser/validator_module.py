@@ -0,0 +1,227 @@
+import base64
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import re
+import textwrap
+from typing import Callable, Dict, List, Tuple
+
+import lark
+from lark import Lark
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY, ParserRegistry
+
+
+class ValidatorModule:
+    """
+    ValidatorModule class generates and installs modules of precompiled validators.
+
+    A generated module holds, for every parse root of a spec's text and hybrid terminals, the regular
+    expression fast path and the serialized parser, keyed by the parse root and the engine requested for it.
+    It also holds a fingerprint of the spec, grammar and Lark version it was generated from, so it is never
+    installed for a spec it doesn't match.
+
+    Note:
+        Lark can only serialize LALR parsers, so parse roots built with Earley are still compiled at runtime.
+
+        The validators of the app are generated with :obj:`ALOCSpec.write_validators`, from the root of the
+        repository:
+
+            $ python main.py --write-validators
+    """
+
+    @staticmethod
+    def fingerprint(spec_text: str, grammar_text: str) -> str:
+        """
+        Returns the fingerprint of a spec and its grammar.
+
+        Args:
+            spec_text (str): The text of the ALOC spec.
+            grammar_text (str): The text of the grammar used by the spec.
+
+        Returns:
+            str: The hex digest identifying the spec, grammar and installed Lark version.
+        """
+        return hashlib.sha256(
+            "\0".join([spec_text, grammar_text, lark.__version__]).encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def generate(
+        cls,
+        spec_path: str,
+        engine: ParserEngine = ParserEngine.EARLEY,
+        tuning_path: str | None = None,
+        check_defaults: Callable[[], None] | None = None,
+    ) -> str:
+        """
+        Generates the source of a validator module for a spec.
+
+        Args:
+            spec_path (str): The path of the ALOC spec.
+            engine (:obj:`ParserEngine`, optional): The engine to build the parsers with.
+            tuning_path (str, optional): The path of a tuning file written by :obj:`ParserTuner` for the spec.
+                If it matches the spec and grammar, its engines replace :obj:`engine` for the parse roots it
+                covers, as they do when the spec is read.
+            check_defaults (:obj:`Callable[[], None]`, optional): Called before the module is generated to check
+                the defaults of the spec's terminals, so that launching with the module doesn't have to.
+
+        Returns:
+            str: The Python source of the module.
+
+        Raises:
+            AssertionError: If :obj:`check_defaults` finds a default that isn't valid.
+        """
+        if check_defaults is not None:
+            check_defaults()
+        with open(spec_path) as json_file:
+            spec_text = json_file.read()
+        data = json.loads(spec_text)
+        with open(data["contract"]["grammar_path"]) as grammar_file:
+            grammar = grammar_file.read()
+        fingerprint = cls.fingerprint(spec_text, grammar)
+        tuned_engines: Dict[str, ParserEngine] = dict()
+        if tuning_path is not None:
+            # Imported here as the tuner uses this class to read specs.
+            from src.parser.parser_tuner import ParserTuner
+
+            tuned_engines = ParserTuner.load(tuning_path, fingerprint)
+        engines = {
+            parse_root: tuned_engines.get(parse_root, engine)
+            for parse_root in cls.get_parse_roots(data)
+        }
+        registry = ParserRegistry()
+        lines = [
+            '"""',
+            f"Validators generated from {spec_path} by src.parser.validator_module, do not edit.",
+            '"""',
+            f"FINGERPRINT = {fingerprint!r}",
+            "VALIDATORS = {",
+        ]
+        for parse_root, parse_root_engine in engines.items():
+            parser = BaseParser(parse_root, grammar, registry, parse_root_engine)
+            regex = parser.get_regex()
+            serialized_parser = None
+            if parser.get_engine().is_lalr():
+                parser_file = io.BytesIO()
+                parser.get_lark_parser().save(parser_file)
+                serialized_parser = base64.b64encode(parser_file.getvalue()).decode()
+            lines += [
+                f"    ({parse_root!r}, {parse_root_engine.value!r}): {{",
+                f'        "engine": {parser.get_engine().value!r},',
+                f'        "regex": {regex.pattern if regex else None!r},',
+            ]
+            if serialized_parser is None:
+                lines.append('        "parser": None,')
+            else:
+                lines.append('        "parser": (')
+                lines += [
+                    f'            "{chunk}"'
+                    for chunk in textwrap.wrap(serialized_parser, 76)
+                ]
+                lines.append("        ),")
+            lines.append("    },")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def write(
+        cls,
+        spec_path: str,
+        output_path: str,
+        engine: ParserEngine = ParserEngine.EARLEY,
+        tuning_path: str | None = None,
+        check_defaults: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Generates a validator module for a spec and writes it to a file.
+
+        Args:
+            spec_path (str): The path of the ALOC spec.
+            output_path (str): The path to write the module to.
+            engine (:obj:`ParserEngine`, optional): The engine to build the parsers with.
+            tuning_path (str, optional): The path of a tuning file written by :obj:`ParserTuner` for the spec.
+            check_defaults (:obj:`Callable[[], None]`, optional): Called before the module is generated to check
+                the defaults of the spec's terminals.
+
+        Raises:
+            AssertionError: If :obj:`check_defaults` finds a default that isn't valid.
+        """
+        source = cls.generate(spec_path, engine, tuning_path, check_defaults)
+        with open(output_path, "w") as file:
+            file.write(source)
+
+    @staticmethod
+    def install(
+        path: str,
+        fingerprint: str,
+        grammar_hash: str,
+        engines: Dict[str, ParserEngine],
+        registry: ParserRegistry = PARSER_REGISTRY,
+    ) -> bool:
+        """
+        Adds the validators of a generated module to a parser registry.
+
+        Args:
+            path (str): The path of the generated module.
+            fingerprint (str): The fingerprint of the spec and grammar being loaded.
+            grammar_hash (str): The hash of the grammar being loaded.
+            engines (:obj:`Dict[str, ParserEngine]`): The engine the parsers of each parse root of the spec
+                are requested with.
+            registry (:obj:`ParserRegistry`, optional): The registry to add the validators to.
+
+        Returns:
+            bool: True if the validators were installed, False if the module doesn't exist or doesn't
+            match the fingerprint or the engines.
+        """
+        if not os.path.exists(path):
+            return False
+        module_spec = importlib.util.spec_from_file_location(
+            f"aloc_validators_{fingerprint}", path
+        )
+        if module_spec is None or module_spec.loader is None:
+            return False
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        # Modules that aren't generated by this class, or by an older version of it, are treated as mismatches.
+        validators: Dict[Tuple[str, str], Dict] = getattr(module, "VALIDATORS", dict())
+        if getattr(module, "FINGERPRINT", None) != fingerprint or set(validators) != {
+            (parse_root, engine.value) for parse_root, engine in engines.items()
+        }:
+            return False
+        for (parse_root, engine), validator in validators.items():
+            regex = validator["regex"]
+            registry.add_regex(
+                grammar_hash, parse_root, re.compile(regex) if regex else None
+            )
+            if validator["parser"] is not None:
+                parser = Lark.load(io.BytesIO(base64.b64decode(validator["parser"])))
+                registry.add_parser(
+                    grammar_hash,
+                    parse_root,
+                    ParserEngine(engine),
+                    parser,
+                    ParserEngine(validator["engine"]),
+                )
+        return True
+
+    @staticmethod
+    def get_parse_roots(data: Dict) -> List[str]:
+        """
+        Returns the parse roots of the text and hybrid terminals of a spec.
+
+        Args:
+            data (:obj:`Dict`): The loaded JSON of the ALOC spec.
+
+        Returns:
+            :obj:`List[str]`: The distinct parse roots, in the order they first appear.
+        """
+        terminals = data["terminal_types"].get("text", []) + data["terminal_types"].get(
+            "hybrid", []
+        )
+        return list(dict.fromkeys(terminal["parse_root"] for terminal in terminals))
+
@@ -12,3 +12,4 @@ class Constants:
     PDF_CONTRACT_SIZE = 15
     PDF_LINE_SPACING = 15
     PDF_FONT = "Times"
+    SPEC_POLL_INTERVAL_MS = 1000
@@ -95,6 +95,5 @@ class ChainFrame(SimpleFrame):
         """
         component = self.get_component()
         assert isinstance(component, ChainComponent)
-        component.delete()
-        self.get_controller().reset_ids()
+        self.get_controller().delete_chain_component(component.get_internal_id())
         self.trigger_re_render()
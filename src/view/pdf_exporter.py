@@ -0,0 +1,33 @@
+from src.view.constants import Constants
+
+
+class PdfExporter:
+    """
+    PdfExporter class writes the CoLa of a contract to a PDF file.
+
+    The PDF backend, fpdf, is only imported the first time a PDF is exported, so that importing this
+    module doesn't require it.
+    """
+
+    @staticmethod
+    def export(path: str, title: str, cola: str) -> None:
+        """
+        Writes a contract to a PDF file.
+
+        Args:
+            path (str): The path of the PDF file to write.
+            title (str): The title of the contract.
+            cola (str): The CoLa of the contract.
+
+        Raises:
+            ImportError: If fpdf isn't installed.
+        """
+        from fpdf import FPDF
+
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font(Constants.PDF_FONT, size=Constants.PDF_TITLE_SIZE)
+        pdf.cell(200, 10, text=f"{title}\n", ln=1, align="C", markdown=True)
+        pdf.set_font(Constants.PDF_FONT, size=Constants.PDF_CONTRACT_SIZE)
+        pdf.write(h=Constants.PDF_LINE_SPACING, text=cola)
+        pdf.output(path)
@@ -7,6 +7,9 @@ from src.model.components.simple_component import SimpleComponent
 from src.model.terminal_types.hybrid_terminal import HybridTerminal
 from src.model.terminal_types.multi_choice_terminal import MultiChoiceTerminal
 from src.model.terminal_types.terminal import TerminalTypeNames
+from src.parser.completions import Completions
+from src.parser.incremental_parser import IncrementalParser
+from src.parser.validation_result import ValidationResult
 
 
 class UpdateFormEntry:
@@ -20,6 +23,8 @@ class UpdateFormEntry:
         get_value(): Returns the value of the entry.
         get_type(): Returns the type of the entry.
         get_name(): Returns the name of the entry.
+        diagnose(): Validates the value of the entry.
+        complete(): Lists what can be typed after the value of the entry.
     """
 
     def __init__(self, entry_name: str, terminal):
@@ -33,6 +38,7 @@ class UpdateFormEntry:
         self.__name = entry_name
         self.__terminal = terminal
         self.__var = tk.StringVar()
+        self.__incremental_parser: IncrementalParser | None = None
 
     def set_value(self, entry_value: str) -> None:
         """
@@ -59,6 +65,38 @@ class UpdateFormEntry:
         """Returns the name of the entry."""
         return self.__name
 
+    def diagnose(self) -> ValidationResult:
+        """
+        Validates the value of the entry with its terminal, locating the error in an invalid value by resuming
+        from the parser state of its previous value.
+
+        Returns:
+            ValidationResult: The result of validating the value of the entry.
+        """
+        value = self.get_value()
+        if self.__terminal.validate(value):
+            return ValidationResult(True)
+        result = self._get_incremental_parser().diagnose(value)
+        if result.is_valid():
+            # The terminal decides whether the value is valid, even if the LALR parser accepts it.
+            return ValidationResult(False, 0)
+        return result
+
+    def complete(self) -> Completions:
+        """
+        Lists what can be typed after the value of the entry.
+
+        Returns:
+            Completions: The literals and terminals that can follow the value of the entry.
+        """
+        return self._get_incremental_parser().complete(self.get_value())
+
+    def _get_incremental_parser(self) -> IncrementalParser:
+        # Shared by validation and completion so both resume from the same parser states.
+        if self.__incremental_parser is None:
+            self.__incremental_parser = self.__terminal.create_incremental_parser()
+        return self.__incremental_parser
+
 
 class UpdateFormHandler:
     """
@@ -71,7 +109,7 @@ class UpdateFormHandler:
         create_error_text(parent, row): Creates an error label widget.
         _create_entry_method(parent, entry, row, entries): Creates entry widgets based on attribute types.
         _create_entry_label(parent, text, row): Creates entry label widgets.
-        _create_entry_widget(parent, entry, row): Creates a basic text entry widget.
+        _create_entry_widget(parent, entry, row): Creates a basic text entry widget with completions.
         _create_option_widget(parent, entry, row): Creates a dropdown menu widget.
         _create_date_widgets(parent, entry, row, custom_var): Creates date selection widgets.
         update_button_state(button, entries, error_variable): Updates the state of the submit button.
@@ -79,6 +117,8 @@ class UpdateFormHandler:
         _handle_hybrid(entry_name, entry_var, date_dict): Handles date entry values.
     """
 
+    MAX_COMPLETIONS = 6
+
     def create_update_form(
         self,
         component: SimpleComponent,
@@ -130,13 +170,34 @@ class UpdateFormHandler:
             terminal = entry.get_terminal()
             if terminal.get_type() == TerminalTypeNames.MULTI_CHOICE:
                 continue
-            if not terminal.validate(entry.get_value()):
+            result = entry.diagnose()
+            if not result.is_valid():
                 button["state"] = "disabled"
-                error_variable.set(terminal.get_explanation())
+                error_variable.set(UpdateFormHandler._describe_error(entry, result))
                 return
         error_variable.set("")
         button["state"] = "normal"
 
+    @staticmethod
+    def _describe_error(entry: UpdateFormEntry, result: ValidationResult) -> str:
+        """
+        Describes why the value of an entry is invalid.
+
+        Args:
+            entry (UpdateFormEntry): The entry with an invalid value.
+            result (ValidationResult): The result of validating the entry.
+
+        Returns:
+            str: The explanation of the entry's terminal followed by where the value went wrong.
+        """
+        name = entry.get_name().replace("_", " ")
+        character = (result.get_position() or 0) + 1
+        if result.can_become_valid():
+            location = f"The {name} is incomplete from character {character}."
+        else:
+            location = f"The {name} can no longer become valid, the error is at character {character}."
+        return f"{entry.get_terminal().get_explanation()}\n{location}"
+
     def _create_submit_button(
         self,
         parent: tk.Toplevel,
@@ -291,6 +352,34 @@ class UpdateFormHandler:
         """
         entry_widget = tk.Entry(parent, textvariable=entry.get_var())
         entry_widget.grid(row=row, column=1)
+
+        completion_var = tk.StringVar()
+        completion_label = tk.Label(
+            parent, textvariable=completion_var, fg="grey", justify=tk.LEFT
+        )
+        completion_label.grid(row=row, column=2, sticky="w")
+
+        def show_completions(*_):
+            literals = entry.complete().get_literals()
+            shown_literals = ", ".join(
+                repr(literal)
+                for literal in literals[: UpdateFormHandler.MAX_COMPLETIONS]
+            )
+            if len(literals) > UpdateFormHandler.MAX_COMPLETIONS:
+                shown_literals += ", ..."
+            completion_var.set(f"next: {shown_literals}" if literals else "")
+
+        def insert_completion(_):
+            continuation = entry.complete().get_common_continuation()
+            if not continuation:
+                return None
+            entry_widget.insert(tk.END, continuation)
+            entry_widget.icursor(tk.END)
+            return "break"
+
+        entry.get_var().trace_add("write", show_completions)
+        entry_widget.bind("<Tab>", insert_completion)
+        show_completions()
         return entry_widget
 
     @staticmethod
@@ -1,10 +1,10 @@
 import tkinter as tk
-from tkinter import filedialog, simpledialog
-
-from fpdf import FPDF
+from tkinter import filedialog, messagebox, simpledialog
+from typing import Dict, List
 
 from src.model.components.contract import Contract
 from src.view.constants import Constants
+from src.view.pdf_exporter import PdfExporter
 from src.view.renderer import Renderer
 from src.view.scroll_canvas import ScrollCanvas
 
@@ -67,6 +67,7 @@ class View(tk.Tk):
         self.__renderer = Renderer(self.__tree_frame, controller, self.update_display)
 
         self.update_display()
+        self.after(Constants.SPEC_POLL_INTERVAL_MS, self._poll_spec)
 
     def update_display(self) -> None:
         """Re-draws the display with the contract that is currently stored."""
@@ -116,6 +117,37 @@ class View(tk.Tk):
         self.__controller.create_new_contract()
         self.update_display()
 
+    def _poll_spec(self) -> None:
+        """Reloads the ALOC spec if it was edited, and redraws the contract against it."""
+        try:
+            problems = self.__controller.reload_spec()
+        except ValueError as e:
+            messagebox.showerror("ALOC spec not reloaded", str(e), parent=self)
+            problems = None
+        if problems is not None:
+            self.update_display()
+            if problems:
+                self._show_spec_problems(problems)
+        self.after(Constants.SPEC_POLL_INTERVAL_MS, self._poll_spec)
+
+    def _show_spec_problems(self, problems: Dict[int, List[str]]) -> None:
+        """
+        Shows the components that no longer conform to the reloaded ALOC spec.
+
+        Args:
+        - problems (Dict[int, List[str]]): The problems of each component, keyed by its internal id.
+        """
+        contract = self.__controller.get_contract()
+        lines = [
+            "The ALOC spec was reloaded, but some components no longer conform to it:"
+        ]
+        for internal_id, component_problems in problems.items():
+            component_id = contract.get_component(internal_id).get_id()
+            lines += [
+                f"Component {component_id}: {problem}" for problem in component_problems
+            ]
+        messagebox.showwarning("ALOC spec reloaded", "\n".join(lines), parent=self)
+
     def _show_export_menu(self, event) -> None:
         self.__export_menu.tk_popup(event.x_root, event.y_root)
 
@@ -142,14 +174,11 @@ class View(tk.Tk):
                 (f"{Constants.PDF_EXPORT_NAME} files", f"*.{Constants.PDF_EXT}")
             ],
         )
-        pdf = FPDF()
-
-        pdf.add_page()
-        pdf.set_font(Constants.PDF_FONT, size=Constants.PDF_TITLE_SIZE)
-        pdf.cell(200, 10, text=f"{contract_title}\n", ln=1, align="C", markdown=True)
-        pdf.set_font(Constants.PDF_FONT, size=Constants.PDF_CONTRACT_SIZE)
-        pdf.write(
-            h=Constants.PDF_LINE_SPACING, text=self.__controller.get_contract_as_cola()
-        )
-        pdf.output(file_path)
+        try:
+            PdfExporter.export(
+                file_path, contract_title, self.__controller.get_contract_as_cola()
+            )
+        except ImportError as e:
+            print(f"Error exporting to PDF: {e}")
+            return
         print(f"Contract exported to: {file_path}")
@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 from src.model.component_collection import ComponentCollection
 
@@ -9,7 +8,10 @@ from test.model.fixtures import *
 
 from src.controller.controller import Controller
 from src.model.aloc_spec import ALOCSpec
+from src.model.components.conditional_component import ConditionalComponent
+from src.model.components.contract import Contract
 from src.model.model import Model
+from src.parser.batch_validator import BatchValidator
 
 
 class TestContract:
@@ -24,15 +26,8 @@ class TestContract:
 
     @staticmethod
     def get_component_by_id(contract, id: int):
-        componenet_collections: List[
-            ComponentCollection
-        ] = contract.get_component_collections()
-        for component_collection in componenet_collections:
-            try:
-                return component_collection.get_component(id)
-            except:
-                continue
-        raise ValueError(f"Component component id {id} not found in contract.")
+        # Collections only hold the first component of each chain, the contract's index has them all.
+        return contract.get_component(id)
 
     def test_simple(self):
         controller, contract = self.create_controller(
@@ -73,8 +68,9 @@ class TestContract:
             == "[0] ROSE IS RED\nC-AND\n[1] VIOLET IS BLUE\nC-AND\n[2] FLAG IS WIN\nC-AND\n[3] BABA IS YOU"
         )
 
-        for _ in range(4):
-            controller.delete_component(0)
+        # Internal ids are permanent, so deleting a component doesn't renumber the others.
+        for component_id in range(4):
+            controller.delete_component(component_id)
 
         assert contract.to_cola() == ""
 
@@ -93,7 +89,7 @@ class TestContract:
         assert isinstance(component, ChainComponent)
         component.delete()
         assert contract.to_cola() == "[0] SUBJECT IS ALSO SUBJECT"
-        component = self.get_component_by_id(contract, 0)
+        component = self.get_component_by_id(contract, 1)
         assert isinstance(component, ChainComponent)
         component.delete()
         assert contract.to_cola() == ""
@@ -117,7 +113,7 @@ class TestContract:
             == "[0] SUBJECT IS SUBJECT\nIF\n[1] it is the case that SUBJECT paid GBP 0 on ADATE"
         )
         controller.update_component(
-            2, {"date": (HybridTerminal.CUSTOM_OPTION, "27 January 2002")}
+            1, {"date": (HybridTerminal.CUSTOM_OPTION, "27 January 2002")}
         )
         assert (
             contract.to_cola()
@@ -130,8 +126,8 @@ class TestContract:
         )
         controller.add_new_component("conditional_statement")
         controller.add_new_component("statement")
-        controller.extend_chain_component(2)
-        controller.extend_chain_component(4)
+        controller.extend_chain_component(1)
+        controller.extend_chain_component(3)
         controller.change_component_form(0, "if then")
         controller.update_component(
             1,
@@ -144,7 +140,7 @@ class TestContract:
             },
         )
         controller.update_component(
-            2,
+            4,
             {
                 "subject": "Alice",
                 "verb_status": "paid",
@@ -153,7 +149,7 @@ class TestContract:
             },
         )
         controller.update_component(
-            3,
+            2,
             {
                 "subject": "Bob",
                 "modal_verb": "must",
@@ -163,7 +159,7 @@ class TestContract:
             },
         )
         controller.update_component(
-            4,
+            3,
             {
                 "subject": "Bob",
                 "modal_verb": "may",
@@ -186,3 +182,152 @@ class TestContract:
             contract.to_cola()
             == """IF\n[0] it is the case that Alice paid POUNDS 100 on the 1 April 2001 OR\n[1] it is the case that Alice paid DOLLARS 120 on the 1 April 2001\nTHEN\n[2] it is the case that Bob must deliver OTHEROBJECT "bicycle" on the 5 April 2001\nC-AND\n[3] it is the case that Bob may deliver REPORT "receipt" ANYDATE AND\n[4] it is the case that Bob is forbiddent to charge AMOUNT "delivery fee" ANYDATE"""
         )
+
+    def test_validate_all(self):
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("statement")
+        controller.add_new_component("conditional_definition")
+        controller.update_component(0, {"subject": "Bob2", "object": "GBP 100"})
+        controller.update_component(
+            2, {"date": (HybridTerminal.CUSTOM_OPTION, "27 Jantuary 2002")}
+        )
+        results = contract.validate_all()
+        assert not results[(0, "subject")].is_valid()
+        assert results[(0, "subject")].get_position() == 3
+        assert results[(0, "object")].is_valid()
+        assert not results[(2, "date")].is_valid()
+        assert all(
+            result.is_valid()
+            for key, result in results.items()
+            if key not in [(0, "subject"), (2, "date")]
+        )
+
+    def test_verify_cola(self):
+        spec_reader = ALOCSpec("./test/end_to_end/relative_time_aloc_spec.json")
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("definition")
+        controller.add_new_component("definition")
+        verifier = spec_reader.create_cola_verifier(BatchValidator(processes=1))
+        assert contract.verify_cola(verifier) == dict()
+        controller.update_component(1, {"Definition": "Bob2"})
+        failures = contract.verify_cola(verifier)
+        assert list(failures) == [contract.get_component(1).get_internal_id()]
+        assert verifier.get_statistics() == {"parsed": 3, "reused": 1}
+
+    def test_component_index(self, monkeypatch):
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("definition")
+        controller.add_new_component("conditional_statement")
+        controller.extend_chain_component(0)
+        # Collections only hold the first component of each chain.
+        assert not any(
+            component_collection.contains_component(4)
+            for component_collection in contract.get_component_collections()
+        )
+        # Lookups go through the index rather than searching the collections.
+        monkeypatch.delattr(ComponentCollection, "get_component")
+        monkeypatch.delattr(ComponentCollection, "contains_component")
+        assert contract.get_component(4) is contract.get_component(0).get_next()
+        conditional = contract.get_component(1)
+        assert isinstance(conditional, ConditionalComponent)
+        assert contract.get_component(3) is conditional.get_result()
+        controller.update_component(2, {"subject": "Alice"})
+        assert (
+            conditional.get_condition().get_attribute("subject").get_value() == "Alice"
+        )
+        with pytest.raises(ValueError):
+            contract.get_component(5)
+
+    def test_component_index_after_delete(self):
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("definition")
+        controller.add_new_component("conditional_statement")
+        controller.delete_component(0)
+        assert contract.get_children() == []
+        assert isinstance(contract.get_component(1), ConditionalComponent)
+        controller.extend_chain_component(3)
+        contract.delete_chain_component(4)
+        controller.add_new_component("definition")
+        contract.get_component(5).delete()
+        assert contract.to_cola() == (
+            "[0] it is the case that SUBJECT shall pay GBP 0 on ADATE\n"
+            "IF\n[1] it is the case that SUBJECT paid GBP 0 on ADATE"
+        )
+        with pytest.raises(ValueError):
+            contract.get_component(4)
+
+    def test_internal_ids_are_permanent(self):
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("definition")
+        controller.add_new_component("conditional_statement")
+        result = contract.get_component(3)
+        assert result.get_textual_id() == "[1]"
+        controller.delete_component(0)
+        controller.change_component_form(1, "if then")
+        controller.extend_chain_component(2)
+        # Only the display numbers follow the edits.
+        assert contract.get_component(3) is result
+        assert result.get_textual_id() == "[2]"
+        assert contract.get_component(4).get_textual_id() == "[1]"
+
+    def test_saved_contract_keeps_internal_ids(self, tmp_path):
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("definition")
+        controller.add_new_component("definition")
+        controller.delete_component(0)
+        # Contracts saved before internal ids were permanent don't store the next one.
+        del contract.__dict__["_Contract__next_internal_id"]
+        del contract.__dict__["_Contract__index"]
+        # Nor do they link chains both ways.
+        for component in contract.get_component_collections()[0].get_components():
+            del component.__dict__["_ChainComponent__previous"]
+            del component.__dict__["_ChainComponent__end"]
+        controller.save_contract(str(tmp_path / "contract.pkl"))
+        controller.load_contract(str(tmp_path / "contract.pkl"))
+        contract = controller.get_contract()
+        controller.update_component(1, {"Name": "BABA", "Definition": "YOU"})
+        controller.add_new_component("definition")
+        assert contract.get_component(2).get_textual_id() == "[1]"
+        assert contract.to_cola() == "[0] BABA IS YOU\nC-AND\n[1] SUBJECT IS SUBJECT"
+        controller.extend_chain_component(1)
+        controller.delete_chain_component(1)
+        assert contract.get_component(3).get_previous() is None
+        assert contract.get_component(3).get_last() is contract.get_component(3)
+
+    def test_display_numbers_follow_edits(self, monkeypatch):
+        controller, contract = self.create_controller(
+            "./test/end_to_end/relative_time_aloc_spec.json"
+        )
+        controller.add_new_component("statement")
+        controller.add_new_component("conditional_statement")
+        # Display numbers are kept up to date without renumbering the whole contract.
+        monkeypatch.setattr(Contract, "reset_ids", None)
+        controller.add_new_component("definition")
+        statement = contract.get_component(0)
+        assert statement.get_id() == 1
+        assert contract.get_numbered_component(0) is contract.get_component(4)
+        result = contract.get_component(3)
+        assert result.get_id() == 2
+        controller.change_component_form(1, "if then")
+        assert result.get_id() == 3
+        assert contract.get_numbered_component(2) is contract.get_component(2)
+        controller.extend_chain_component(4)
+        controller.delete_component(0)
+        assert [
+            contract.get_numbered_component(number).get_internal_id()
+            for number in range(4)
+        ] == [4, 5, 2, 3]
+        with pytest.raises(ValueError):
+            contract.get_numbered_component(4)
@@ -0,0 +1,52 @@
+import importlib.util
+import subprocess
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from src.view.pdf_exporter import PdfExporter
+
+HEADLESS_MODULES = [
+    "main",
+    "src.model.aloc_spec",
+    "src.model.model",
+    "src.model.components.contract",
+    "src.controller.controller",
+    "src.parser.cola_verifier",
+    "src.parser.validator_module",
+    "src.view.pdf_exporter",
+]
+GUI_MODULES = ["tkinter", "_tkinter", "fpdf", "src.view.view"]
+
+
+class TestHeadlessImports:
+    def test_headless_import_graph(self):
+        # A fresh interpreter is needed, as other tests may already have imported the GUI.
+        script = "\n".join(
+            [f"import {module}" for module in HEADLESS_MODULES]
+            + [
+                "import sys",
+                f"print(sorted(set({GUI_MODULES!r}) & set(sys.modules)))",
+            ]
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("fpdf") is not None, reason="fpdf is installed"
+    )
+    def test_pdf_export_without_backend(self, tmp_path):
+        with pytest.raises(ImportError):
+            PdfExporter.export(str(tmp_path / "contract.pdf"), "Contract", "[0] A IS B")
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("fpdf") is None, reason="fpdf is not installed"
+    )
+    def test_pdf_export(self, tmp_path):
+        path = tmp_path / "contract.pdf"
+        PdfExporter.export(str(path), "Contract", "[0] A IS B")
+        assert path.read_bytes().startswith(b"%PDF")
@@ -25,16 +25,18 @@ def terminals():
 
 
 @pytest.fixture
-def date_parser():
+def grammar():
     with open("./test/grammar.txt", "r") as file:
-        grammar = file.read()
+        return file.read()
+
+
+@pytest.fixture
+def date_parser(grammar):
     return BaseParser("date", grammar)
 
 
 @pytest.fixture
-def subject_parser():
-    with open("./test/grammar.txt", "r") as file:
-        grammar = file.read()
+def subject_parser(grammar):
     return BaseParser("subject", grammar)
 
 
@@ -0,0 +1,147 @@
+import json
+import shutil
+import sys
+from typing import Dict, List
+
+import pytest
+
+sys.path.append("../..")
+
+from src.controller.controller import Controller
+from src.model.aloc_spec import ALOCSpec
+from src.model.model import Model
+from src.parser.parser_registry import PARSER_REGISTRY
+
+
+class TestALOCSpecReload:
+    @pytest.fixture
+    def spec_path(self, tmp_path):
+        grammar_path = str(tmp_path / "grammar.txt")
+        shutil.copy("./src/grammar.txt", grammar_path)
+        with open("./test/end_to_end/relative_time_aloc_spec.json") as file:
+            data = json.load(file)
+        data["contract"]["grammar_path"] = grammar_path
+        path = str(tmp_path / "spec.json")
+        with open(path, "w") as file:
+            json.dump(data, file)
+        return path
+
+    @pytest.fixture
+    def grammar_path(self, spec_path):
+        return self.read_spec(spec_path)["contract"]["grammar_path"]
+
+    @staticmethod
+    def edit(path: str, old: str, new: str) -> None:
+        with open(path) as file:
+            text = file.read()
+        assert old in text
+        with open(path, "w") as file:
+            file.write(text.replace(old, new, 1))
+
+    @staticmethod
+    def read_spec(path: str) -> Dict:
+        with open(path) as file:
+            return json.load(file)
+
+    @staticmethod
+    def write_spec(path: str, data: Dict) -> None:
+        with open(path, "w") as file:
+            json.dump(data, file)
+
+    @staticmethod
+    def find(definitions: List[Dict], key: str, name: str) -> Dict:
+        return next(definition for definition in definitions if definition[key] == name)
+
+    @staticmethod
+    def create_controller(spec: ALOCSpec) -> Controller:
+        model = Model(spec.get_contract_collections(), spec.get_component_types())
+        return Controller(model, spec.get_component_specs(), spec)
+
+    def test_unchanged_spec_is_kept(self, spec_path):
+        spec = ALOCSpec(spec_path)
+        component_specs = dict(spec.get_component_specs())
+        assert not spec.has_changed()
+        assert spec.reload() == {
+            "terminals": [],
+            "component_specs": [],
+            "parse_roots": [],
+        }
+        for name, component_spec in spec.get_component_specs().items():
+            assert component_spec is component_specs[name]
+
+    def test_only_changed_definitions_are_rebuilt(self, spec_path):
+        spec = ALOCSpec(spec_path)
+        component_specs = dict(spec.get_component_specs())
+        data = self.read_spec(spec_path)
+        self.find(data["terminal_types"]["multi-choice"], "name", "verb")[
+            "choices"
+        ].append("refund")
+        self.write_spec(spec_path, data)
+        assert spec.has_changed()
+        changes = spec.reload()
+        assert not spec.has_changed()
+        assert changes["terminals"] == ["verb"]
+        assert changes["parse_roots"] == []
+        # Specs using the verb terminal are rebuilt, along with the conditionals built from them.
+        assert changes["component_specs"] == ["statement", "conditional_statement"]
+        assert spec.get_component_specs()["definition"] is component_specs["definition"]
+        assert (
+            spec.get_component_specs()["statement"] is not component_specs["statement"]
+        )
+
+    def test_parsers_of_unchanged_parse_roots_are_reused(self, spec_path, grammar_path):
+        PARSER_REGISTRY.clear()
+        spec = ALOCSpec(spec_path)
+        spec.check_defaults()
+        misses = PARSER_REGISTRY.get_statistics()["misses"]
+        self.edit(grammar_path, '| "September"', '| "September"\n        | "Sept"')
+        changes = spec.reload()
+        assert changes["parse_roots"] == ["date"]
+        assert changes["terminals"] == ["date"]
+        spec.check_defaults()
+        assert PARSER_REGISTRY.get_statistics()["misses"] == misses
+        date = spec.get_component_specs()["statement"].get_attribute("date")
+        assert "Sept" in date.get_terminal().get_parser().get_regex().pattern
+
+    def test_contract_is_rebound(self, spec_path):
+        spec = ALOCSpec(spec_path)
+        controller = self.create_controller(spec)
+        controller.add_new_component("definition")
+        controller.add_new_component("statement")
+        controller.update_component(0, {"Name": "Buyer"})
+        controller.update_component(1, {"verb": "charge"})
+        data = self.read_spec(spec_path)
+        self.find(data["terminal_types"]["multi-choice"], "name", "verb")[
+            "choices"
+        ].remove("charge")
+        definition = self.find(data["chain_components"], "component_name", "definition")
+        definition["form_specs"][0]["form_name"] = "named pair"
+        self.write_spec(spec_path, data)
+        problems = controller.reload_spec()
+        assert problems is not None
+        assert list(problems) == [0, 1]
+        assert "Form subject pair no longer exists" in problems[0][0]
+        assert "'charge'" in problems[1][0]
+        contract = controller.get_contract()
+        assert contract.get_component(0).get_attribute("Name").get_value() == "Buyer"
+        assert contract.get_component(0).get_form().get_name() == "named pair"
+        assert (
+            contract.get_component(1).get_attribute("verb").get_terminal()
+            is spec.get_component_specs()["statement"]
+            .get_attribute("verb")
+            .get_terminal()
+        )
+        assert controller.reload_spec() is None
+
+    def test_invalid_spec_is_not_loaded(self, spec_path):
+        spec = ALOCSpec(spec_path)
+        controller = self.create_controller(spec)
+        component_specs = dict(spec.get_component_specs())
+        self.edit(spec_path, '"type": "subject"', '"type": "missing"')
+        with pytest.raises(ValueError):
+            spec.reload()
+        assert spec.get_component_specs() == component_specs
+        self.edit(spec_path, '"type": "subject"', '"type": "absent"')
+        with pytest.raises(ValueError):
+            controller.reload_spec()
+        assert controller.reload_spec() is None
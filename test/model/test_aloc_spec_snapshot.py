@@ -0,0 +1,135 @@
+import glob
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from lark import Lark
+
+from src.controller.controller import Controller
+from src.model.aloc_spec import ALOCSpec
+from src.model.model import Model
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY
+
+
+class TestALOCSpecSnapshot:
+    @pytest.fixture
+    def spec_path(self, tmp_path):
+        path = str(tmp_path / "spec.json")
+        shutil.copy("./test/end_to_end/relative_time_aloc_spec.json", path)
+        return path
+
+    @pytest.fixture
+    def snapshot_directory(self, tmp_path):
+        return str(tmp_path / "cache")
+
+    @staticmethod
+    def get_snapshots(snapshot_directory):
+        return glob.glob(os.path.join(snapshot_directory, "spec.json.*"))
+
+    @staticmethod
+    def export(spec: ALOCSpec) -> str:
+        model = Model(spec.get_contract_collections(), spec.get_component_types())
+        controller = Controller(model, spec.get_component_specs())
+        controller.add_new_component("definition")
+        controller.add_new_component("statement")
+        controller.update_component(0, {"Name": "Buyer"})
+        return controller.get_contract().to_cola()
+
+    def test_snapshot_is_reused(self, spec_path, snapshot_directory, capsys):
+        spec = ALOCSpec(
+            spec_path,
+            ParserEngine.LALR,
+            snapshot_directory=snapshot_directory,
+            verbose=True,
+        )
+        assert "from JSON" in capsys.readouterr().out
+        assert len(self.get_snapshots(snapshot_directory)) == 1
+        PARSER_REGISTRY.clear()
+        snapshot_spec = ALOCSpec(
+            spec_path,
+            ParserEngine.LALR,
+            snapshot_directory=snapshot_directory,
+            verbose=True,
+        )
+        assert "from snapshot" in capsys.readouterr().out
+        assert PARSER_REGISTRY.get_statistics()["parsers"] > 0
+        assert list(snapshot_spec.get_component_specs()) == list(
+            spec.get_component_specs()
+        )
+        assert self.export(snapshot_spec) == self.export(spec)
+        snapshot_spec.check_defaults()
+        assert PARSER_REGISTRY.get_statistics()["misses"] == 0
+
+    def test_changed_spec_replaces_snapshot(
+        self, spec_path, snapshot_directory, capsys
+    ):
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory)
+        with open(spec_path) as file:
+            spec_text = file.read()
+        with open(spec_path, "w") as file:
+            file.write(spec_text.replace('"SUBJECT"', '"BUYER"', 1))
+        spec = ALOCSpec(spec_path, snapshot_directory=snapshot_directory, verbose=True)
+        assert "from JSON" in capsys.readouterr().out
+        assert len(self.get_snapshots(snapshot_directory)) == 1
+        ALOCSpec(spec_path, ParserEngine.LALR, snapshot_directory=snapshot_directory)
+        assert len(self.get_snapshots(snapshot_directory)) == 1
+        assert "BUYER" in self.export(spec)
+
+    def test_earley_parsers_are_not_compiled(
+        self, spec_path, snapshot_directory, capsys
+    ):
+        PARSER_REGISTRY.clear()
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory)
+        assert PARSER_REGISTRY.get_statistics()["misses"] == 0
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory, verbose=True)
+        assert "from snapshot" in capsys.readouterr().out
+
+    def test_changed_source_replaces_snapshot(
+        self, spec_path, snapshot_directory, capsys, monkeypatch
+    ):
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory)
+        monkeypatch.setattr(ALOCSpec, "_ALOCSpec__source_hash", "edited")
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory, verbose=True)
+        assert "from JSON" in capsys.readouterr().out
+        assert len(self.get_snapshots(snapshot_directory)) == 1
+
+    def test_corrupt_snapshot_is_rebuilt(self, spec_path, snapshot_directory, capsys):
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory)
+        (snapshot_path,) = self.get_snapshots(snapshot_directory)
+        with open(snapshot_path, "wb") as file:
+            file.write(b"not a snapshot")
+        spec = ALOCSpec(spec_path, snapshot_directory=snapshot_directory, verbose=True)
+        assert "from JSON" in capsys.readouterr().out
+        assert self.export(spec)
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory, verbose=True)
+        assert "from snapshot" in capsys.readouterr().out
+
+    def test_snapshot_is_kept_out_of_the_spec_directory(
+        self, spec_path, snapshot_directory
+    ):
+        ALOCSpec(spec_path, snapshot_directory=snapshot_directory)
+        assert set(os.listdir(os.path.dirname(spec_path))) == {"spec.json", "cache"}
+        # Specs with the same file name in other directories get their own snapshots.
+        other_spec_path = os.path.join(snapshot_directory, "spec.json")
+        shutil.copy(spec_path, other_spec_path)
+        ALOCSpec(other_spec_path, snapshot_directory=snapshot_directory)
+        assert len(self.get_snapshots(snapshot_directory)) == 2
+
+    def test_rebuild_errors_are_raised(
+        self, spec_path, snapshot_directory, monkeypatch
+    ):
+        ALOCSpec(spec_path, ParserEngine.LALR, snapshot_directory=snapshot_directory)
+
+        def load(*args, **kwargs):
+            raise ValueError("Broken rebuild")
+
+        monkeypatch.setattr(Lark, "load", load)
+        with pytest.raises(ValueError):
+            ALOCSpec(
+                spec_path, ParserEngine.LALR, snapshot_directory=snapshot_directory
+            )
@@ -1,3 +1,4 @@
+import pickle
 import sys
 
 import pytest
@@ -100,8 +101,119 @@ class TestChainComponent:
             date=(HybridTerminal.CUSTOM_OPTION, "27 January 2002"),
             multi_choice="choice 2",
         )
-        chain_component.reset_id(0, 0)
+        chain_component.reset_id(0)
         assert (
             chain_component.to_cola()
             == "[0] DIFFERENT TEXT on the 27 January 2002 choice 2 and\n[1] TEXT ADATE choice 1"
         )
+
+    def test_links(self, chain_component: ChainComponent):
+        chain_component.add_next()
+        last = chain_component.get_next()
+        chain_component.add_next()
+        middle = chain_component.get_next()
+        assert middle.get_previous() is chain_component
+        assert last.get_previous() is middle
+        assert chain_component.get_previous() is None
+        assert chain_component.get_last() is last
+        assert middle.get_last() is last
+        last.add_next()
+        assert chain_component.get_last() is last.get_next()
+
+    def test_unlink(self, chain_component_spec, chain_component: ChainComponent):
+        parent = ChainParent(True)
+        first = ChainComponent(chain_component_spec, parent)
+        parent.add_child(first)
+        for _ in range(3):
+            first.add_next()
+        second = first.get_next()
+        third = second.get_next()
+        last = first.get_last()
+        assert parent.unlink_chain_component(third)
+        assert second.get_next() is last
+        assert last.get_previous() is second
+        assert parent.unlink_chain_component(last)
+        assert first.get_last() is second
+        assert second.get_next() is None
+        assert parent.unlink_chain_component(first)
+        assert parent.get_children() == [second]
+        assert second.get_previous() is None
+        assert second.get_last() is second
+        # Parents that don't allow chain deletion keep the last component of a chain.
+        assert not chain_component.get_next()
+        assert not ChainParent(False).unlink_chain_component(chain_component)
+
+    def test_remove_child(self, chain_component_spec):
+        parent = ChainParent(True)
+        children = [ChainComponent(chain_component_spec, parent) for _ in range(4)]
+        for child in children:
+            parent.add_child(child)
+        parent.remove_child(children[1])
+        assert parent.get_children() == [children[0], children[2], children[3]]
+        # The slots of the children are found again after pickling.
+        parent = pickle.loads(pickle.dumps(parent))
+        children = parent.get_children()
+        parent.remove_child(children[2])
+        parent.add_child(children[2])
+        parent.remove_child(children[0])
+        assert parent.get_children() == [children[1], children[2]]
+
+    def test_set_next_joins_chains(
+        self, chain_component_spec, chain_component: ChainComponent
+    ):
+        other = ChainComponent(chain_component_spec, ChainParent(False))
+        other.add_next()
+        chain_component.set_next(other)
+        assert other.get_previous() is chain_component
+        assert chain_component.get_last() is other.get_next()
+        assert other.get_next().get_last() is other.get_next()
+        chain_component.set_next(None)
+        assert other.get_previous() is None
+        assert chain_component.get_last() is chain_component
+
+    def test_rebind_long_chain(
+        self, chain_component_spec, chain_type_spec_1, attributes
+    ):
+        first = ChainComponent(chain_component_spec, ChainParent(False))
+        last = first
+        length = sys.getrecursionlimit() + 10
+        for _ in range(length - 1):
+            last.add_next()
+            last = last.get_next()
+        # The first form of the chain is dropped, so every component in the chain reports its form changed.
+        component_spec = ChainComponentSpec(
+            "chain_component",
+            [chain_type_spec_1],
+            attributes,
+            "components",
+            "logical_operator",
+            "chain_component",
+        )
+        problems = first.rebind(component_spec)
+        assert len(problems) == length
+        assert problems[-1][0] is last
+
+    def test_set_next_detaches_tail(self, chain_component: ChainComponent):
+        for _ in range(2):
+            chain_component.add_next()
+        second = chain_component.get_next()
+        third = second.get_next()
+        chain_component.set_next(None)
+        assert chain_component.get_last() is chain_component
+        assert second.get_last() is third
+        assert third.get_last() is third
+        third.add_next()
+        assert second.get_last() is third.get_next()
+        assert chain_component.get_last() is chain_component
+
+    def test_replace_first_component(self, chain_component_spec):
+        parent = ChainParent(True)
+        children = [ChainComponent(chain_component_spec, parent) for _ in range(3)]
+        for child in children:
+            parent.add_child(child)
+        children[1].add_next()
+        second = children[1].get_next()
+        assert parent.unlink_chain_component(children[1])
+        assert parent.get_children() == [children[0], second, children[2]]
+        assert parent.unlink_chain_component(second)
+        assert parent.get_children() == [children[0], children[2]]
@@ -0,0 +1,52 @@
+import datetime
+import pickle
+import sys
+from decimal import Decimal
+
+sys.path.append("../..")
+
+from test.model.fixtures import *
+
+from src.parser.typed_values import Amount
+
+
+class TestComponentAttribute:
+    @pytest.fixture
+    def object_attribute(self, grammar):
+        terminal = TextTerminal("object", "GBP 0", BaseParser("object", grammar), "")
+        return ComponentAttribute("object", terminal)
+
+    def test_typed_value(self, object_attribute):
+        assert object_attribute.get_typed_value() == Amount(Decimal(0), "GBP")
+
+    def test_typed_value_is_invalidated(self, object_attribute):
+        object_attribute.get_typed_value()
+        object_attribute.set_value("USD 12")
+        assert object_attribute.get_typed_value() == Amount(Decimal(12), "USD")
+        object_attribute.set_value("USD")
+        assert object_attribute.get_typed_value() is None
+
+    def test_hybrid_typed_value(self, date_attribute):
+        assert date_attribute.get_typed_value() == "ADATE"
+        date_attribute.set_value((HybridTerminal.CUSTOM_OPTION, "27 January 2002"))
+        assert (
+            date_attribute.get_typed_value() == datetime.date(2002, 1, 27).toordinal()
+        )
+
+    def test_hybrid_options_are_normalised(self, date_parser):
+        terminal = HybridTerminal(
+            "date", "on ADATE", "27 January 2002", date_parser, "", ["on ADATE"]
+        )
+        attribute = ComponentAttribute("date", terminal, "on the ")
+        assert attribute.get_typed_value() == "ADATE"
+        attribute.set_value((HybridTerminal.CUSTOM_OPTION, "27 January 2002"))
+        assert attribute.get_typed_value() == datetime.date(2002, 1, 27).toordinal()
+
+    def test_multi_choice_typed_value(self, multi_choice_attribute):
+        assert multi_choice_attribute.get_typed_value() == "choice 1"
+
+    def test_typed_value_survives_pickling(self, object_attribute):
+        object_attribute.set_value("EUR 7")
+        object_attribute.get_typed_value()
+        loaded_attribute = pickle.loads(pickle.dumps(object_attribute))
+        assert loaded_attribute.get_typed_value() == Amount(Decimal(7), "EUR")
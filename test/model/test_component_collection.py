@@ -0,0 +1,67 @@
+import pickle
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from src.model.aloc_spec import ALOCSpec
+from src.model.component_collection import ComponentCollection
+from src.model.components.simple_component import SimpleComponent
+
+
+class TestComponentCollection:
+    @pytest.fixture
+    def components(self):
+        spec = ALOCSpec("./test/end_to_end/relative_time_aloc_spec.json")
+        component_spec = spec.get_component_specs()["boring definition"]
+        components = []
+        for internal_id in range(5):
+            component = SimpleComponent(component_spec)
+            component.set_internal_id(internal_id)
+            components.append(component)
+        return components
+
+    @pytest.fixture
+    def collection(self, components):
+        collection = ComponentCollection("definitions")
+        for component in components[:4]:
+            collection.add_component(component)
+        return collection
+
+    def test_order_is_kept(self, collection, components):
+        collection.delete_component(1)
+        collection.insert_component(0, components[4])
+        collection.replace_component(components[1], 2)
+        assert collection.get_components() == [
+            components[4],
+            components[0],
+            components[1],
+            components[3],
+        ]
+        assert collection.get_position(3) == 3
+        assert collection.get_component_at(2) is components[1]
+        assert collection.get_component_count() == 4
+
+    def test_lookup(self, collection, components):
+        assert collection.contains_component(3)
+        assert collection.get_component(3) is components[3]
+        collection.delete_component(3)
+        collection.delete_component(3)
+        assert not collection.contains_component(3)
+        with pytest.raises(ValueError):
+            collection.get_component(3)
+        with pytest.raises(ValueError):
+            collection.replace_component(components[4], 3)
+
+    def test_get_components_is_a_copy(self, collection):
+        collection.get_components().clear()
+        assert collection.get_component_count() == 4
+
+    def test_load_list_collection(self, collection, components):
+        # Collections saved before they were indexed store their components in a list.
+        collection.__dict__["_ComponentCollection__components"] = components[:4]
+        del collection.__dict__["_ComponentCollection__components_by_id"]
+        loaded_collection = pickle.loads(pickle.dumps(collection))
+        assert loaded_collection.get_position(2) == 2
+        assert loaded_collection.get_component(1).get_internal_id() == 1
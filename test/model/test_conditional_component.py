@@ -80,7 +80,7 @@ class TestConditionalComponent:
 
     def test_conditional_component(self, conditional_component_spec):
         conditional = ConditionalComponent(conditional_component_spec)
-        conditional.reset_id(0, 0)
+        conditional.reset_id(0)
         assert (
             conditional.to_cola()
             == "[0] TEXT ADATE choice 1\nIF\n[1] TEXT ADATE choice 1"
@@ -89,8 +89,35 @@ class TestConditionalComponent:
     def test_change_conditional_type(self, conditional_component_spec):
         conditional = ConditionalComponent(conditional_component_spec)
         conditional.set_form("if then")
-        conditional.reset_id(0, 0)
+        conditional.reset_id(0)
         assert (
             conditional.to_cola()
             == "IF\n[0] TEXT ADATE choice 1\nTHEN\n[1] TEXT ADATE choice 1"
         )
+
+    def test_delete_first_condition(self, conditional_component_spec):
+        conditional = ConditionalComponent(conditional_component_spec)
+        condition = conditional.get_condition()
+        condition.add_next()
+        new_condition = condition.get_next()
+        assert not conditional.unlink_chain_component(conditional.get_result())
+        assert conditional.unlink_chain_component(condition)
+        assert conditional.get_condition() is new_condition
+        assert conditional.get_children() == [new_condition, conditional.get_result()]
+        assert conditional.get_last_numbered_component() is new_condition
+
+    def test_delete_from_long_condition(self, conditional_component_spec):
+        conditional = ConditionalComponent(conditional_component_spec)
+        condition = conditional.get_condition()
+        length = sys.getrecursionlimit() + 10
+        for _ in range(length - 1):
+            condition.get_last().add_next()
+        last = condition.get_last()
+        previous = last.get_previous()
+        last.delete()
+        assert condition.get_last() is previous
+        assert previous.get_next() is None
+        assert conditional.reset_id(0) == length
+        second = condition.get_next()
+        condition.delete()
+        assert conditional.get_condition() is second
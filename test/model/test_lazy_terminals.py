@@ -0,0 +1,53 @@
+import sys
+
+sys.path.append("../..")
+
+from test.model.fixtures import *
+
+from src.model.aloc_spec import ALOCSpec
+from src.parser.parser_registry import ParserRegistry
+
+SPEC_PATHS = [
+    "./src/aloc_spec.json",
+    "./src/relative_time_aloc_spec.json",
+    "./test/end_to_end/relative_time_aloc_spec.json",
+]
+
+
+class TestLazyTerminals:
+    def test_invalid_default_is_reported_on_first_validation(self, subject_parser):
+        with pytest.raises(AssertionError):
+            TextTerminal("subject", "bad1", subject_parser, "")
+        terminal = TextTerminal("subject", "bad1", subject_parser, "", lazy=True)
+        with pytest.raises(AssertionError):
+            terminal.validate("Buyer")
+
+    def test_lazy_terminal_compiles_nothing(self, grammar):
+        registry = ParserRegistry()
+        parser = BaseParser("numerical_expression", grammar, registry)
+        terminal = TextTerminal("expression", "1", parser, "", lazy=True)
+        assert registry.get_statistics()["misses"] == 0
+        assert terminal.validate("1 PLUS 2")
+        assert registry.get_statistics()["misses"] == 1
+
+    def test_hybrid_default_is_checked(self, date_parser):
+        HybridTerminal(
+            "date", "ADATE", "27 January 2002", date_parser, "", ["ADATE"]
+        ).check_default()
+        with pytest.raises(AssertionError):
+            HybridTerminal(
+                "date", "ADATE", "27 Jan 2002", date_parser, "", ["ADATE"]
+            ).check_default()
+
+    @pytest.mark.parametrize("spec_path", SPEC_PATHS)
+    def test_spec_defaults_are_valid(self, spec_path):
+        ALOCSpec(spec_path, eager_validation=True)
+
+    def test_validator_module_checks_defaults(self, tmp_path):
+        spec_text = open("./test/end_to_end/relative_time_aloc_spec.json").read()
+        spec_path = tmp_path / "spec.json"
+        spec_path.write_text(spec_text.replace('"SUBJECT"', '"SUBJECT1"', 1))
+        spec = ALOCSpec(str(spec_path))
+        with pytest.raises(AssertionError):
+            spec.write_validators(str(tmp_path / "validators.py"))
+        assert not (tmp_path / "validators.py").exists()
@@ -0,0 +1,65 @@
+import pickle
+import random
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from src.model.order_statistic_list import OrderStatisticList
+
+
+class Item:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class TestOrderStatisticList:
+    def test_matches_list(self):
+        rng = random.Random(0)
+        items = [Item(str(i)) for i in range(50)]
+        expected = items[:20]
+        numbering = OrderStatisticList(expected, seed=1)
+        for i in range(400):
+            if expected and rng.random() < 0.4:
+                item = rng.choice(expected)
+                expected.remove(item)
+                numbering.remove(item)
+            else:
+                item = Item(f"new {i}")
+                index = rng.randint(0, len(expected))
+                expected.insert(index, item)
+                numbering.insert(index, [item])
+            assert len(numbering) == len(expected)
+        assert list(numbering) == expected
+        for index, item in enumerate(expected):
+            assert numbering.index(item) == index
+            assert numbering[index] is item
+
+    def test_insert_many(self):
+        first, second, third, fourth = [Item(name) for name in "abcd"]
+        numbering = OrderStatisticList([first, fourth])
+        numbering.insert(1, [second, third])
+        assert list(numbering) == [first, second, third, fourth]
+        assert numbering.index(third) == 2
+
+    def test_errors(self):
+        item = Item("a")
+        numbering = OrderStatisticList([item])
+        with pytest.raises(ValueError):
+            numbering.insert(0, [item])
+        with pytest.raises(ValueError):
+            numbering.index(Item("b"))
+        with pytest.raises(IndexError):
+            numbering[1]
+        numbering.remove(item)
+        assert item not in numbering
+        assert list(numbering) == []
+
+    def test_pickle(self):
+        items = [Item(str(i)) for i in range(10)]
+        loaded_items, numbering = pickle.loads(
+            pickle.dumps((items, OrderStatisticList(items)))
+        )
+        assert list(numbering) == loaded_items
+        assert numbering.index(loaded_items[7]) == 7
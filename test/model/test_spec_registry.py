@@ -0,0 +1,87 @@
+import json
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from src.controller.controller import Controller
+from src.model.spec_registry import SpecRegistry
+from src.parser.base_parser import BaseParser
+from src.parser.parser_registry import PARSER_REGISTRY
+
+
+class TestSpecRegistry:
+    @pytest.fixture
+    def edited_grammar(self):
+        with open("./src/grammar.txt") as file:
+            grammar = file.read()
+        return grammar.replace('| "September"', '| "September"\n        | "Sept"')
+
+    @pytest.fixture
+    def spec_registry(self, tmp_path, edited_grammar):
+        # The second spec uses a grammar that only differs from the first in the month rule.
+        grammar_path = str(tmp_path / "grammar.txt")
+        with open(grammar_path, "w") as file:
+            file.write(edited_grammar)
+        with open("./test/end_to_end/relative_time_aloc_spec.json") as file:
+            data = json.load(file)
+        data["contract"]["grammar_path"] = grammar_path
+        spec_path = str(tmp_path / "spec.json")
+        with open(spec_path, "w") as file:
+            json.dump(data, file)
+        PARSER_REGISTRY.clear()
+        spec_registry = SpecRegistry()
+        spec_registry.load("./src/aloc_spec.json", "aloc")
+        spec_registry.load(spec_path, "relative_time")
+        return spec_registry
+
+    def test_terminals_are_shared(self, spec_registry):
+        terminals = spec_registry.get_spec("aloc").get_terminals()
+        other_terminals = spec_registry.get_spec("relative_time").get_terminals()
+        assert terminals["object"] is other_terminals["object"]
+        assert terminals["verb"] is other_terminals["verb"]
+        assert terminals["date"] is not other_terminals["date"]
+        statistics = spec_registry.get_statistics()
+        assert statistics["specs"] == 2
+        assert statistics["distinct_terminals"] < statistics["terminals"]
+
+    def test_parsers_are_shared(self, spec_registry, edited_grammar):
+        with open("./src/grammar.txt") as file:
+            grammar = file.read()
+        parser = BaseParser("object", grammar, regex_fast_path=False)
+        other_parser = BaseParser("object", edited_grammar, regex_fast_path=False)
+        assert parser.get_lark_parser() is other_parser.get_lark_parser()
+        assert PARSER_REGISTRY.get_statistics()["shared"] == 1
+
+    def test_create_model(self, spec_registry):
+        for name in spec_registry.get_spec_names():
+            spec = spec_registry.get_spec(name)
+            controller = Controller(
+                spec_registry.create_model(name), spec.get_component_specs()
+            )
+            controller.add_new_component("statement")
+            assert "[0]" in controller.get_contract_as_cola()
+
+    def test_names_are_unique(self, spec_registry):
+        with pytest.raises(ValueError):
+            spec_registry.load("./src/aloc_spec.json", "aloc")
+        with pytest.raises(ValueError):
+            spec_registry.get_spec("missing")
+
+    def test_reload_keeps_shared_terminals(
+        self, spec_registry, edited_grammar, tmp_path
+    ):
+        with open("./src/grammar.txt") as file:
+            grammar = file.read()
+        with open(tmp_path / "grammar.txt", "w") as file:
+            file.write(edited_grammar.replace('| "Sept"', '| "Sept"\n        | "Sep"'))
+        spec = spec_registry.get_spec("relative_time")
+        changes = spec.reload()
+        assert "object" not in changes["terminals"]
+        terminals = spec_registry.get_spec("aloc").get_terminals()
+        other_terminals = spec.get_terminals()
+        assert terminals["object"] is other_terminals["object"]
+        assert terminals["object"].get_parser().get_grammar() == grammar
+        assert other_terminals["date"].validate("5 Sep 2024")
+        assert not terminals["date"].validate("5 Sep 2024")
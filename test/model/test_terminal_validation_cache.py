@@ -0,0 +1,53 @@
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import *
+
+from src.model.terminal_types.validation_cache import ValidationCache
+
+
+class TestTerminalValidationCache:
+    def test_repeated_values_hit_cache(self, text_terminal):
+        assert text_terminal.validate("Buyer")
+        assert text_terminal.validate("Buyer")
+        assert not text_terminal.validate("Buyer 1")
+        assert not text_terminal.validate("Buyer 1")
+        statistics = text_terminal.get_validation_cache_statistics()
+        assert statistics["hits"] == 2
+        assert statistics["misses"] == 2
+        assert statistics["hit_rate"] == 0.5
+
+    def test_hybrid_choices_bypass_cache(self, date_terminal):
+        assert date_terminal.validate("ADATE")
+        assert date_terminal.validate("27 January 2002")
+        assert date_terminal.validate("27 January 2002")
+        statistics = date_terminal.get_validation_cache_statistics()
+        assert statistics["size"] == 1
+        assert statistics["hits"] == 1
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ValidationCache(2)
+        cache.put("Buyer", True)
+        cache.put("Seller", True)
+        cache.get("Buyer")
+        cache.put("Agent", True)
+        assert cache.get("Seller") is None
+        assert cache.get("Buyer")
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_resize(self):
+        cache = ValidationCache(3)
+        for value in ["Buyer", "Seller", "Agent"]:
+            cache.put(value, True)
+        cache.set_max_size(1)
+        assert cache.get_statistics()["size"] == 1
+        assert cache.get("Agent")
+
+    def test_new_parser_clears_cache(self, text_terminal, date_parser):
+        assert text_terminal.validate("Buyer")
+        text_terminal.set_parser(date_parser)
+        assert not text_terminal.validate("Buyer")
+        assert text_terminal.get_validation_cache_statistics()["size"] == 1
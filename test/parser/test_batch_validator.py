@@ -0,0 +1,53 @@
+import sys
+
+sys.path.append("../..")
+
+from test.model.fixtures import *
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.batch_validator import BatchValidator
+from src.parser.validation_result import ValidationResult
+
+
+class TestBatchValidator:
+    def test_diagnose_reports_error_position(self, grammar):
+        parser = BaseParser("numerical_expression", grammar)
+        assert parser.diagnose("1 PLUS 2") == ValidationResult(True)
+        result = parser.diagnose("1 PLUS PLUS")
+        assert not result.is_valid()
+        assert result.get_position() == 7
+        result = parser.diagnose("1 PLUS")
+        assert not result.is_valid()
+        assert result.get_position() == 6
+
+    def test_pool_matches_serial(self, grammar):
+        parser = BaseParser("numerical_expression", grammar)
+        texts = [f"{i} PLUS {i}" for i in range(40)] + [f"{i} PLUS" for i in range(40)]
+        serial_results = BatchValidator(processes=1).diagnose(parser, texts)
+        with BatchValidator(processes=2, chunk_size=8, min_pool_size=0) as validator:
+            pool_results = validator.diagnose(parser, texts)
+        assert list(pool_results) == texts
+        assert pool_results == serial_results
+
+    def test_duplicates_are_validated_once(self, grammar):
+        parser = BaseParser("numerical_expression", grammar)
+        results = BatchValidator(processes=1).diagnose(parser, ["1", "x", "1", "x"])
+        assert list(results) == ["1", "x"]
+        assert results["1"].is_valid()
+        assert not results["x"].is_valid()
+
+    def test_text_terminal_validate_many(self, text_terminal):
+        results = text_terminal.validate_many(["TEXT", "bad1", "TEXT"])
+        assert list(results) == ["TEXT", "bad1"]
+        assert results["TEXT"].is_valid()
+        assert results["bad1"].get_position() == 3
+        assert text_terminal.validate("TEXT")
+        assert not text_terminal.validate("bad1")
+
+    def test_hybrid_terminal_validate_many(self, date_terminal):
+        results = date_terminal.validate_many(["ADATE", "27 January 2002", "27 Jan"])
+        assert results["ADATE"].is_valid()
+        assert results["27 January 2002"].is_valid()
+        assert not results["27 Jan"].is_valid()
+        assert results["27 Jan"].get_position() <= len("27 Jan")
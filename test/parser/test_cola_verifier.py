@@ -0,0 +1,49 @@
+import sys
+
+sys.path.append("../..")
+
+from test.model.fixtures import *
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.batch_validator import BatchValidator
+from src.parser.cola_verifier import ColaVerifier
+
+
+class TestColaVerifier:
+    @pytest.fixture
+    def verifier(self, grammar):
+        parser = BaseParser(ColaVerifier.DEFAULT_START, grammar)
+        return ColaVerifier(parser, BatchValidator(processes=1))
+
+    def test_valid_cola_has_no_failures(self, verifier):
+        cola = "[0] SUBJECT IS SUBJECT\nC-AND\n[1] SUBJECT IS SUBJECT"
+        assert verifier.verify(cola) == dict()
+        assert verifier.verify("") == dict()
+
+    def test_failure_is_mapped_to_component(self, verifier):
+        cola = "[0] SUBJECT IS SUBJECT\nC-AND\n[1] SUBJECT IS\nC-AND\n[2] SUBJECT IS SUBJECT"
+        failures = verifier.verify(cola)
+        assert list(failures) == [1]
+        assert failures[1].get_position() == cola.index("[1]") + len("[1] SUBJECT IS")
+
+    def test_failure_without_id(self, verifier):
+        failures = verifier.verify("[0] SUBJECT IS SUBJECT\nC-AND\nSUBJECT")
+        assert list(failures) == [None]
+
+    def test_unchanged_chunks_are_reused(self, verifier):
+        verifier.verify("[0] SUBJECT IS SUBJECT\nC-AND\n[1] SUBJECT IS SUBJECT")
+        assert verifier.get_statistics() == {"parsed": 2, "reused": 0}
+        failures = verifier.verify("[0] SUBJECT IS SUBJECT\nC-AND\n[1] SUBJECT IS")
+        assert list(failures) == [1]
+        assert verifier.get_statistics() == {"parsed": 3, "reused": 1}
+
+    def test_pool_matches_serial(self, grammar, verifier):
+        cola = "\nC-AND\n".join(
+            f"[{i}] SUBJECT IS{' SUBJECT' if i % 3 else ''}" for i in range(30)
+        )
+        parser = BaseParser(ColaVerifier.DEFAULT_START, grammar)
+        with BatchValidator(processes=2, chunk_size=4, min_pool_size=0) as validator:
+            pool_failures = ColaVerifier(parser, validator).verify(cola)
+        assert pool_failures == verifier.verify(cola)
+        assert list(pool_failures) == list(range(0, 30, 3))
@@ -0,0 +1,86 @@
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.incremental_parser import IncrementalParser
+from src.parser.parser_engine import ParserEngine
+
+
+class TestCompletions:
+    @pytest.fixture
+    def complete(self, grammar):
+        # Keeps one incremental parser per parse root, as every entry of the update form does.
+        incremental_parsers = dict()
+
+        def complete(parse_root, text, prefix=""):
+            if (parse_root, prefix) not in incremental_parsers:
+                incremental_parsers[(parse_root, prefix)] = IncrementalParser(
+                    BaseParser(parse_root, grammar), prefix
+                )
+            return incremental_parsers[(parse_root, prefix)].complete(text)
+
+        return complete
+
+    def test_literals_after_complete_token(self, complete):
+        completions = complete("numerical_expression", "1 ")
+        assert completions.get_fragment() == ""
+        assert set(completions.get_literals()) == {
+            "+",
+            "-",
+            "*",
+            "/",
+            "PLUS",
+            "MINUS",
+            "TIMES",
+            "DIVIDE",
+        }
+        assert not completions.can_end()
+
+    def test_literals_matching_fragment(self, complete):
+        completions = complete("object", "GB")
+        assert completions.get_fragment() == "GB"
+        assert completions.get_literals() == ["GBP"]
+        assert completions.get_continuations() == ["P"]
+        assert completions.get_common_continuation() == "P"
+
+    def test_prefix(self, complete):
+        completions = complete("date", "27 Ju", "on the ")
+        assert completions.get_fragment() == "Ju"
+        assert sorted(completions.get_literals()) == ["July", "June"]
+        assert completions.get_common_continuation() == ""
+
+    def test_non_literal_terminals(self, complete):
+        completions = complete("object", "GBP 1")
+        assert completions.get_literals() == []
+        assert len(completions.get_terminals()) == 1
+        assert completions.can_end()
+        assert completions.get_common_continuation() == ""
+
+    def test_rejected_last_token(self, complete):
+        completions = complete("numerical_expression", "1 PLUS")
+        assert completions.get_literals() == [" "]
+
+    def test_dead_input_has_no_completions(self, complete):
+        completions = complete("subject", "Bob1")
+        assert completions.get_literals() == []
+        assert completions.get_terminals() == []
+        assert not completions.can_end()
+
+    def test_typing_completes_every_prefix(self, complete, grammar):
+        parser = BaseParser("numerical_expression", grammar, engine=ParserEngine.LALR)
+        text = " PLUS ".join(str(number) for number in range(50))
+        for length in range(len(text)):
+            typed_text = text[:length]
+            completions = complete("numerical_expression", typed_text)
+            assert completions.can_end() == parser.parse(typed_text)
+            # The next character typed must be offered, numbers are matched by a pattern rather than a literal.
+            next_text = completions.get_fragment() + text[length]
+            assert text[length].isdigit() or any(
+                literal.startswith(next_text) for literal in completions.get_literals()
+            )
+        assert complete("numerical_expression", text).can_end()
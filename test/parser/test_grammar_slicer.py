@@ -0,0 +1,49 @@
+import sys
+
+from lark import Lark
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.grammar_slicer import GrammarSlicer
+
+
+class TestGrammarSlicer:
+    def test_reachable_rules(self, grammar):
+        assert GrammarSlicer(grammar).get_reachable("date") == {
+            "date",
+            "month",
+            "num",
+            "digit",
+        }
+
+    def test_slice_parses_like_grammar(self, grammar):
+        grammar_slice = GrammarSlicer(grammar).slice("object")
+        assert len(grammar_slice) < len(grammar)
+        parser = Lark(grammar_slice, start="object")
+        parser.parse("GBP 100")
+        parser.parse('REPORT "monthly report"')
+
+    def test_names_in_strings_and_comments_are_ignored(self):
+        grammar = 'start: "other" value // other\n' "value: /other/\n" 'other: "x"\n'
+        assert GrammarSlicer(grammar).get_reachable("start") == {"start", "value"}
+
+    def test_directives_are_kept(self):
+        grammar = (
+            'start: "a" WORD\n'
+            "unused: WORD\n"
+            "%import common.WORD\n"
+            "%import common.WS\n"
+            "%ignore WS\n"
+        )
+        grammar_slice = GrammarSlicer(grammar).slice("start")
+        assert "unused" not in grammar_slice
+        Lark(grammar_slice, start="start").parse("a  word")
+
+    def test_unknown_start_returns_grammar(self, grammar):
+        assert GrammarSlicer(grammar).slice("nope") == grammar
+
+    def test_override_is_not_sliced(self):
+        grammar = 'start: a\na: "a"\nb: "b"\n%override a: "c"\n'
+        assert GrammarSlicer(grammar).slice("start") == grammar
@@ -0,0 +1,90 @@
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.incremental_parser import IncrementalParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+from src.parser.validation_result import ValidationResult
+
+
+class TestIncrementalParser:
+    @pytest.mark.parametrize(
+        "parse_root, prefix, text",
+        [
+            ("subject", "", "Alice and Bob"),
+            ("numerical_expression", "", "12 PLUS 3 TIMES 45 MINUS 6"),
+            ("object", "", 'REPORT "a receipt"'),
+            ("date", "on the ", "27 January 2002"),
+        ],
+    )
+    def test_typing_matches_full_parse(self, grammar, parse_root, prefix, text):
+        parser = BaseParser(parse_root, grammar)
+        incremental_parser = IncrementalParser(parser, prefix)
+        for length in range(len(text) + 1):
+            typed_text = text[:length]
+            result = incremental_parser.diagnose(typed_text)
+            assert result.is_valid() == parser.parse(f"{prefix}{typed_text}")
+            assert result.can_become_valid()
+
+    def test_typing_resumes_from_previous_state(self, grammar):
+        text = " PLUS ".join(str(number) for number in range(100))
+        incremental_parser = IncrementalParser(
+            BaseParser("numerical_expression", grammar)
+        )
+        for length in range(1, len(text) + 1):
+            incremental_parser.diagnose(text[:length])
+        assert incremental_parser.diagnose(text).is_valid()
+        # Parsing from scratch would feed every token of every prefix.
+        assert incremental_parser.get_fed_token_count() < 4 * len(text)
+
+    def test_edits_are_revalidated(self, grammar):
+        parser = BaseParser("numerical_expression", grammar)
+        incremental_parser = IncrementalParser(parser)
+        for text in ["1 PLUS 2", "1 PLUS", "1 PLUS 23", "1 MINUS 23", "", "4"]:
+            assert incremental_parser.diagnose(text).is_valid() == parser.parse(text)
+
+    def test_dead_prefix_is_flagged(self, grammar):
+        incremental_parser = IncrementalParser(BaseParser("subject", grammar))
+        result = incremental_parser.diagnose("Bob1")
+        assert not result.is_valid()
+        assert not result.can_become_valid()
+        assert result.get_position() == 3
+
+    def test_incomplete_prefix_is_not_flagged(self, grammar):
+        incremental_parser = IncrementalParser(BaseParser("object", grammar))
+        result = incremental_parser.diagnose("GB")
+        assert not result.is_valid()
+        assert result.can_become_valid()
+        result = incremental_parser.diagnose("GX")
+        assert not result.can_become_valid()
+        assert result.get_position() == 0
+
+    def test_prefix_is_excluded_from_positions(self, grammar):
+        incremental_parser = IncrementalParser(BaseParser("date", grammar), "on the ")
+        assert incremental_parser.diagnose("27 January 2002") == ValidationResult(True)
+        assert incremental_parser.diagnose("27 Janu").can_become_valid()
+        result = incremental_parser.diagnose("27 Janx")
+        assert not result.can_become_valid()
+        assert result.get_position() == 3
+
+    def test_non_lalr_parser_falls_back(self):
+        grammar = 'start: a | b\na: "x"\nb: "x"\n'
+        registry = ParserRegistry()
+        incremental_parser = IncrementalParser(BaseParser("start", grammar, registry))
+        assert incremental_parser.diagnose("x").is_valid()
+        assert not incremental_parser.diagnose("y").is_valid()
+        assert incremental_parser.get_fed_token_count() == 0
+        # The Earley parser never asked for LALR, so it didn't fall back.
+        assert registry.get_fallbacks() == []
+
+    def test_lalr_parser_is_resumed(self, grammar):
+        registry = ParserRegistry()
+        parser = BaseParser("subject", grammar, registry, ParserEngine.LALR)
+        assert parser.get_lalr_parser() is parser.get_lark_parser()
+        assert registry.get_statistics()["misses"] == 1
@@ -0,0 +1,135 @@
+import sys
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+import src.parser.parallel_parser_builder as parallel_parser_builder
+from src.model.aloc_spec import ALOCSpec
+from src.parser.base_parser import BaseParser
+from src.parser.parallel_parser_builder import ParallelParserBuilder
+from src.parser.parser_disk_cache import ParserDiskCache
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import PARSER_REGISTRY, ParserRegistry
+
+PARSE_ROOTS = ["subject", "numerical_expression", "object", "date"]
+
+
+class TestParallelParserBuilder:
+    def test_pool_build(self, grammar):
+        registry = ParserRegistry()
+        progress = []
+        statistics = ParallelParserBuilder(2).build(
+            grammar,
+            [(parse_root, ParserEngine.LALR) for parse_root in PARSE_ROOTS],
+            registry,
+            lambda built, total, parse_root: progress.append((built, total)),
+        )
+        assert statistics["pool"] and statistics["built"] == 4
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        parser = BaseParser(
+            "numerical_expression", grammar, registry, ParserEngine.LALR
+        )
+        assert parser.parse("1 PLUS 2") and not parser.parse("1 PLUS")
+        assert parser.get_engine() == ParserEngine.LALR
+        assert registry.get_statistics()["misses"] == 0
+        assert registry.get_statistics()["regexes"] == 3
+        again = ParallelParserBuilder(2).build(
+            grammar, [("subject", ParserEngine.LALR)], registry
+        )
+        assert again["built"] == 0
+
+    def test_fallback_is_kept(self):
+        ambiguous_grammar = 'start: a | b\na: "x"\nb: "x"\nother: "y"\n'
+        registry = ParserRegistry()
+        ParallelParserBuilder(2).build(
+            ambiguous_grammar,
+            [("start", ParserEngine.LALR), ("other", ParserEngine.LALR)],
+            registry,
+        )
+        parser = BaseParser("start", ambiguous_grammar, registry, ParserEngine.LALR)
+        assert parser.parse("x")
+        assert parser.get_engine() == ParserEngine.EARLEY
+
+    def test_serial_and_parallel_builds_agree(self):
+        ambiguous_grammar = 'start: a | b\na: "x"\nb: "x"\nother: "y"\n'
+        requests = [("start", ParserEngine.LALR), ("other", ParserEngine.LALR)]
+        serial_registry = ParserRegistry()
+        ParallelParserBuilder(1).build(ambiguous_grammar, requests, serial_registry)
+        parallel_registry = ParserRegistry()
+        statistics = ParallelParserBuilder(2).build(
+            ambiguous_grammar, requests, parallel_registry
+        )
+        assert statistics["pool"]
+        assert parallel_registry.get_fallbacks() == serial_registry.get_fallbacks()
+        assert parallel_registry.get_fallbacks() == ["start"]
+        for name in ["parsers", "regexes"]:
+            assert (
+                parallel_registry.get_statistics()[name]
+                == serial_registry.get_statistics()[name]
+            )
+        for start_from, engine in requests:
+            assert (
+                parallel_registry.get_parser(
+                    ambiguous_grammar, start_from, engine=engine
+                )[1]
+                == serial_registry.get_parser(
+                    ambiguous_grammar, start_from, engine=engine
+                )[1]
+            )
+
+    def test_earley_is_built_without_pool(self, grammar):
+        # Earley parsers can't be sent back from a worker, so a pool would compile them twice.
+        registry = ParserRegistry()
+        statistics = ParallelParserBuilder(2).build(
+            grammar,
+            [(parse_root, ParserEngine.EARLEY) for parse_root in PARSE_ROOTS],
+            registry,
+        )
+        assert not statistics["pool"] and statistics["built"] == 4
+        assert registry.get_statistics()["misses"] == 4
+
+    def test_serial_without_pool(self, grammar, monkeypatch):
+        def unavailable_pool(*args, **kwargs):
+            raise OSError("No processes available.")
+
+        monkeypatch.setattr(
+            parallel_parser_builder, "ProcessPoolExecutor", unavailable_pool
+        )
+        registry = ParserRegistry()
+        statistics = ParallelParserBuilder(4).build(
+            grammar,
+            [(parse_root, ParserEngine.EARLEY) for parse_root in PARSE_ROOTS],
+            registry,
+        )
+        assert not statistics["pool"] and statistics["built"] == 4
+        assert registry.get_statistics()["parsers"] == 4
+
+    def test_disk_cache_is_used(self, grammar, tmp_path):
+        registry = ParserRegistry()
+        registry.set_disk_cache(ParserDiskCache(str(tmp_path)))
+        ParallelParserBuilder(2).build(
+            grammar,
+            [("subject", ParserEngine.LALR), ("date", ParserEngine.LALR)],
+            registry,
+        )
+        next_registry = ParserRegistry()
+        next_registry.set_disk_cache(ParserDiskCache(str(tmp_path)))
+        statistics = ParallelParserBuilder(2).build(
+            grammar,
+            [("subject", ParserEngine.LALR), ("date", ParserEngine.LALR)],
+            next_registry,
+        )
+        assert statistics["built"] == 0
+        assert next_registry.get_statistics()["disk_hits"] == 2
+
+    def test_aloc_spec_parallel_build(self, capsys):
+        PARSER_REGISTRY.clear()
+        spec = ALOCSpec(
+            "./test/end_to_end/relative_time_aloc_spec.json",
+            ParserEngine.LALR,
+            parallel_build=True,
+        )
+        spec.check_defaults()
+        assert "Built parser" in capsys.readouterr().out
+        assert spec.get_fallback_parse_roots() == []
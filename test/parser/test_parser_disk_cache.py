@@ -0,0 +1,118 @@
+import json
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_disk_cache import ParserDiskCache
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+from src.parser.validator_module import ValidatorModule
+
+
+class TestParserDiskCache:
+    @pytest.fixture
+    def disk_cache(self, tmp_path):
+        return ParserDiskCache(str(tmp_path))
+
+    @staticmethod
+    def create_registry(disk_cache):
+        registry = ParserRegistry()
+        registry.set_disk_cache(disk_cache)
+        return registry
+
+    @staticmethod
+    def create_lalr_parser(start_from, grammar, registry):
+        return BaseParser(
+            start_from, grammar, registry, ParserEngine.LALR, regex_fast_path=False
+        )
+
+    def test_lalr_parser_loaded_from_disk(self, grammar, disk_cache):
+        first_registry = self.create_registry(disk_cache)
+        assert self.create_lalr_parser("date", grammar, first_registry).parse(
+            "on ADATE"
+        )
+        assert first_registry.get_statistics()["disk_hits"] == 0
+        second_registry = self.create_registry(disk_cache)
+        parser = self.create_lalr_parser("date", grammar, second_registry)
+        assert parser.parse("on the 27 January 2002")
+        assert not parser.parse("on the 27 Jan 2002")
+        assert parser.get_engine() == ParserEngine.LALR
+        assert second_registry.get_statistics()["disk_hits"] == 1
+
+    def test_changed_slice_is_not_loaded(self, grammar, disk_cache):
+        self.create_lalr_parser(
+            "date", grammar, self.create_registry(disk_cache)
+        ).get_lark_parser()
+        registry = self.create_registry(disk_cache)
+        edited_grammar = grammar.replace(
+            '| "September"', '| "September"\n        | "Sept"'
+        )
+        self.create_lalr_parser("date", edited_grammar, registry).get_lark_parser()
+        assert registry.get_statistics()["disk_hits"] == 0
+
+    def test_unchanged_slice_is_loaded(self, grammar, disk_cache):
+        self.create_lalr_parser(
+            "date", grammar, self.create_registry(disk_cache)
+        ).get_lark_parser()
+        registry = self.create_registry(disk_cache)
+        # Rules the start rule can't reach aren't part of the slice the parser is compiled from.
+        edited_grammar = grammar + '\nunused: "unused"\n'
+        self.create_lalr_parser("date", edited_grammar, registry).get_lark_parser()
+        assert registry.get_statistics()["disk_hits"] == 1
+
+    def test_fallback_is_recorded(self, disk_cache):
+        ambiguous_grammar = 'start: a | b\na: "x"\nb: "x"\n'
+        self.create_lalr_parser(
+            "start", ambiguous_grammar, self.create_registry(disk_cache)
+        ).get_lark_parser()
+        registry = self.create_registry(disk_cache)
+        parser = self.create_lalr_parser("start", ambiguous_grammar, registry)
+        assert parser.get_engine() == ParserEngine.EARLEY
+        assert registry.get_fallbacks() == ["start"]
+
+    def test_prune(self, grammar, disk_cache):
+        self.create_lalr_parser(
+            "date", grammar, self.create_registry(disk_cache)
+        ).get_lark_parser()
+        (entry_name,) = os.listdir(disk_cache.get_directory())
+        entry_path = os.path.join(disk_cache.get_directory(), entry_name)
+        assert disk_cache.prune() == 0
+        with open(entry_path, "rb") as file:
+            entry = pickle.load(file)
+        entry["lark_version"] = "0.0.0"
+        with open(entry_path, "wb") as file:
+            pickle.dump(entry, file)
+        assert disk_cache.prune() == 1
+        assert os.listdir(disk_cache.get_directory()) == []
+
+    def test_prune_unused(self, grammar, tmp_path):
+        disk_cache = ParserDiskCache(str(tmp_path), max_age=-1)
+        self.create_lalr_parser(
+            "date", grammar, self.create_registry(disk_cache)
+        ).get_lark_parser()
+        assert disk_cache.prune() == 1
+
+    def test_spec_parsers_are_cached(self, disk_cache):
+        # Every parse root of the app's spec builds with LALR, so all of its parsers reach the cache.
+        with open("./src/aloc_spec.json") as file:
+            data = json.load(file)
+        with open(data["contract"]["grammar_path"]) as file:
+            grammar = file.read()
+        parse_roots = ValidatorModule.get_parse_roots(data)
+        for parse_root in parse_roots:
+            BaseParser(
+                parse_root, grammar, self.create_registry(disk_cache), ParserEngine.LALR
+            ).get_lark_parser()
+        registry = self.create_registry(disk_cache)
+        for parse_root in parse_roots:
+            BaseParser(
+                parse_root, grammar, registry, ParserEngine.LALR
+            ).get_lark_parser()
+        assert registry.get_statistics()["disk_hits"] == len(parse_roots)
@@ -0,0 +1,50 @@
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.model.aloc_spec import ALOCSpec
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+
+
+class TestParserEngine:
+    @pytest.fixture
+    def registry(self):
+        return ParserRegistry()
+
+    @pytest.mark.parametrize(
+        "parse_root, valid, invalid",
+        [
+            ("subject", "Buyer and Seller", "Buyer 1"),
+            ("date", "on the 27 January 2002", "on the 27 Jan 2002"),
+            ("object", 'REPORT "monthly"', "GBP"),
+            ("numerical_expression", "1 PLUS 2", "1 PLUS"),
+        ],
+    )
+    def test_lalr_matches_earley(self, grammar, registry, parse_root, valid, invalid):
+        lalr_parser = BaseParser(
+            parse_root, grammar, registry, ParserEngine.LALR, regex_fast_path=False
+        )
+        earley_parser = BaseParser(
+            parse_root, grammar, registry, ParserEngine.EARLEY, regex_fast_path=False
+        )
+        assert lalr_parser.get_engine() == ParserEngine.LALR
+        assert lalr_parser.parse(valid) and earley_parser.parse(valid)
+        assert not lalr_parser.parse(invalid) and not earley_parser.parse(invalid)
+
+    def test_fallback_to_earley(self, registry):
+        ambiguous_grammar = 'start: a | b\na: "x"\nb: "x"\n'
+        parser = BaseParser("start", ambiguous_grammar, registry, ParserEngine.LALR)
+        assert parser.parse("x")
+        assert parser.get_engine() == ParserEngine.EARLEY
+        assert parser.get_requested_engine() == ParserEngine.LALR
+        assert registry.get_fallbacks() == ["start"]
+
+    def test_aloc_spec_engine(self):
+        spec = ALOCSpec("./src/aloc_spec.json", ParserEngine.LALR)
+        assert spec.get_fallback_parse_roots() == []
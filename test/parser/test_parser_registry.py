@@ -0,0 +1,86 @@
+import pickle
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_registry import ParserRegistry
+
+
+class TestParserRegistry:
+    @pytest.fixture
+    def registry(self):
+        return ParserRegistry()
+
+    def test_compiles_once_per_start_rule(self, grammar, registry):
+        date_parser = BaseParser("date", grammar, registry, regex_fast_path=False)
+        other_date_parser = BaseParser("date", grammar, registry, regex_fast_path=False)
+        subject_parser = BaseParser("subject", grammar, registry, regex_fast_path=False)
+        assert date_parser.parse("on the 27 January 2002")
+        assert other_date_parser.parse("on ADATE")
+        assert subject_parser.parse("Buyer")
+        assert date_parser.get_lark_parser() is other_date_parser.get_lark_parser()
+        statistics = registry.get_statistics()
+        assert statistics["misses"] == 2
+        assert statistics["hits"] == 1
+        assert statistics["parsers"] == 2
+        assert statistics["compile_time"] > 0
+
+    def test_different_grammars_are_not_shared(self, grammar, registry):
+        parser = BaseParser("subject", grammar, registry, regex_fast_path=False)
+        other_parser = BaseParser(
+            "subject",
+            grammar.replace("subject: string", 'subject: string\n| "NOBODY"'),
+            registry,
+            regex_fast_path=False,
+        )
+        assert parser.get_lark_parser() is not other_parser.get_lark_parser()
+
+    def test_grammars_with_the_same_slice_are_shared(self, grammar, registry):
+        parser = BaseParser("subject", grammar, registry)
+        other_grammar = grammar.replace('month: "January"', 'month: "Jan"\n| "January"')
+        other_parser = BaseParser("subject", other_grammar, registry)
+        assert parser.get_lark_parser() is other_parser.get_lark_parser()
+        assert parser.get_regex() is other_parser.get_regex()
+        assert registry.get_slice_hash(grammar, "subject") == registry.get_slice_hash(
+            other_grammar, "subject"
+        )
+        statistics = registry.get_statistics()
+        assert statistics["misses"] == 1
+        assert statistics["shared"] == 2
+        assert statistics["parsers"] == 1
+
+    def test_reuse_parsers_of_unchanged_start_rules(self, grammar, registry):
+        parser = BaseParser("subject", grammar, registry, regex_fast_path=False)
+        date_parser = BaseParser("date", grammar, registry, regex_fast_path=False)
+        parser.parse("Buyer")
+        date_parser.parse("on ADATE")
+        edited_grammar = grammar.replace(
+            'month: "January"', 'month: "Jan"\n| "January"'
+        )
+        assert registry.reuse_parsers(grammar, edited_grammar, "subject")
+        assert not registry.reuse_parsers(grammar, edited_grammar, "date")
+        edited_parser = BaseParser(
+            "subject", edited_grammar, registry, regex_fast_path=False
+        )
+        assert edited_parser.get_lark_parser() is parser.get_lark_parser()
+        edited_date_parser = BaseParser(
+            "date", edited_grammar, registry, regex_fast_path=False
+        )
+        assert edited_date_parser.parse("on the 1 Jan 2002")
+
+    def test_clear(self, grammar, registry):
+        BaseParser("subject", grammar, registry, regex_fast_path=False).parse("Buyer")
+        registry.clear()
+        assert registry.get_statistics()["parsers"] == 0
+
+    def test_pickle_parser(self, grammar, registry):
+        parser = BaseParser("subject", grammar, registry, regex_fast_path=False)
+        assert parser.parse("Buyer")
+        loaded_parser = pickle.loads(pickle.dumps(parser))
+        assert loaded_parser.parse("Seller")
+        assert not loaded_parser.parse("Seller 1")
@@ -0,0 +1,65 @@
+import json
+import sys
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.model.aloc_spec import ALOCSpec
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_tuner import ParserTuner
+
+SPEC_PATH = "./test/end_to_end/relative_time_aloc_spec.json"
+
+
+class TestParserTuner:
+    def test_disagreeing_engines_are_ruled_out(self, grammar):
+        # Greedy lexers take "paid" as a keyword here, so only the dynamic lexer accepts the first condition.
+        corpus = [
+            '[24]it is the case thatpaidgreater thanQOR[2]it is not the case thaton ADATETpaidAMOUNT ""',
+            "[1]it is the case thatBpaidGBP 1on ADATE",
+        ]
+        result = ParserTuner.tune_parse_root(grammar, "condition", corpus, 1)
+        assert set(result["ruled_out"]) == {
+            ParserEngine.EARLEY_BASIC.value,
+            ParserEngine.LALR.value,
+            ParserEngine.LALR_BASIC.value,
+        }
+        assert set(result["timings"]) == {
+            ParserEngine.EARLEY.value,
+            ParserEngine.EARLEY_EXPLICIT.value,
+        }
+        assert result["engine"] in result["timings"]
+
+    def test_engines_that_fall_back_are_ruled_out(self):
+        grammar = 'start: a | b\na: "x"\nb: "x"\n'
+        result = ParserTuner.tune_parse_root(grammar, "start", ["x", "y"], 1)
+        assert ParserEngine.LALR.value in result["ruled_out"]
+        assert ParserEngine.LALR_BASIC.value in result["ruled_out"]
+
+    def test_aloc_spec_reads_tuning_file(self, tmp_path):
+        tuning_path = str(tmp_path / "tuning.json")
+        ParserTuner.write(SPEC_PATH, tuning_path, count=20, repeats=1)
+        with open(tuning_path) as file:
+            tuning = json.load(file)
+        # Regular parse roots are validated with their regular expression, whatever their engine.
+        assert set(tuning["parse_roots"]) == {"numerical_expression"}
+        spec = ALOCSpec(SPEC_PATH, tuning_path=tuning_path)
+        for parse_root, entry in tuning["parse_roots"].items():
+            assert spec.get_parser_engine(parse_root) == ParserEngine(entry["engine"])
+        assert spec.get_fallback_parse_roots() == []
+
+    def test_mismatched_tuning_file_is_ignored(self, tmp_path):
+        tuning_path = str(tmp_path / "tuning.json")
+        with open(tuning_path, "w") as file:
+            json.dump(
+                {
+                    "fingerprint": "other",
+                    "parse_roots": {"subject": {"engine": "lalr"}},
+                },
+                file,
+            )
+        spec = ALOCSpec(SPEC_PATH, tuning_path=tuning_path)
+        assert spec.get_parser_engine("subject") == ParserEngine.EARLEY
+        missing_spec = ALOCSpec(SPEC_PATH, tuning_path=str(tmp_path / "missing.json"))
+        assert missing_spec.get_parser_engine("subject") == ParserEngine.EARLEY
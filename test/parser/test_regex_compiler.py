@@ -0,0 +1,46 @@
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_registry import ParserRegistry
+from src.parser.regex_compiler import RegexCompiler
+
+
+class TestRegexCompiler:
+    @pytest.mark.parametrize(
+        "parse_root", ["subject", "date", "month", "num", "quoted_string", "object"]
+    )
+    def test_regular_rules_compile(self, grammar, parse_root):
+        assert RegexCompiler(grammar).compile(parse_root) is not None
+
+    @pytest.mark.parametrize("parse_root", ["numerical_expression", "contract", "nope"])
+    def test_non_regular_rules_do_not_compile(self, grammar, parse_root):
+        assert RegexCompiler(grammar).compile(parse_root) is None
+
+    def test_mutual_recursion_does_not_compile(self):
+        grammar = 'start: "a" other | "b"\nother: "c" start\n'
+        assert RegexCompiler(grammar).compile("start") is None
+
+    @pytest.mark.parametrize(
+        "parse_root, values",
+        [
+            ("subject", ["Buyer", "Buyer and Seller", "Buyer 1", "", "Büyer"]),
+            ("date", ["on ADATE", "on the 27 January 2002", "on the 27 Jan 2002"]),
+            ("object", ["GBP 100", 'REPORT "x y"', "GBP", 'REPORT "1"', "EUR 1 "]),
+        ],
+    )
+    def test_matches_parser(self, grammar, parse_root, values):
+        parser = BaseParser(parse_root, grammar, ParserRegistry(), debug=True)
+        assert parser.get_regex() is not None
+        for value in values:
+            parser.parse(value)
+
+    def test_long_input(self, grammar):
+        parser = BaseParser("subject", grammar, ParserRegistry())
+        assert parser.parse("Buyer and Seller " * 1000)
+        assert not parser.parse("Buyer and Seller " * 1000 + "1")
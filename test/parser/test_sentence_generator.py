@@ -0,0 +1,87 @@
+import sys
+
+sys.path.append("../..")
+
+from test.model.fixtures import *
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+from src.parser.sentence_generator import SentenceGenerator
+
+TERMINAL_PARSE_ROOTS = ["subject", "numerical_expression", "object", "date"]
+
+
+class TestSentenceGenerator:
+    @pytest.mark.parametrize("parse_root", TERMINAL_PARSE_ROOTS + ["component"])
+    def test_sentences_are_valid(self, grammar, parse_root):
+        generator = SentenceGenerator(grammar, seed=0)
+        parser = BaseParser(parse_root, grammar, ParserRegistry())
+        for sentence in generator.generate_many(parse_root, 50):
+            assert parser.parse(sentence), sentence
+
+    def test_generation_is_reproducible(self, grammar):
+        sentences = SentenceGenerator(grammar, seed=3).generate_many("contract", 20)
+        assert (
+            SentenceGenerator(grammar, seed=3).generate_many("contract", 20)
+            == sentences
+        )
+
+    def test_depth_and_expansion_control_length(self, grammar):
+        short_generator = SentenceGenerator(grammar, seed=0, expansion_probability=0)
+        assert {len(text) for text in short_generator.generate_many("subject", 20)} == {
+            1
+        }
+        long_generator = SentenceGenerator(grammar, seed=0, expansion_probability=1)
+        lengths = [len(text) for text in long_generator.generate_many("subject", 20)]
+        assert max(lengths) > 1
+        shallow_generator = SentenceGenerator(
+            grammar, seed=0, max_depth=4, expansion_probability=1
+        )
+        assert all(
+            len(text) <= 3 for text in shallow_generator.generate_many("subject", 20)
+        )
+
+    def test_near_misses_are_rejected(self, grammar):
+        generator = SentenceGenerator(grammar, seed=0)
+        parser = BaseParser("date", grammar, ParserRegistry())
+        near_misses = generator.generate_near_misses("date", 50, parser)
+        assert len(near_misses) > 40
+        assert not any(parser.parse(text) for text in near_misses)
+
+    def test_unknown_start_rule(self, grammar):
+        with pytest.raises(ValueError):
+            SentenceGenerator(grammar).generate("unknown")
+
+    @pytest.mark.parametrize("parse_root", TERMINAL_PARSE_ROOTS)
+    def test_engines_and_caches_agree(self, grammar, parse_root):
+        generator = SentenceGenerator(grammar, seed=1)
+        corpus = generator.generate_many(
+            parse_root, 100
+        ) + generator.generate_near_misses(parse_root, 100)
+        registry = ParserRegistry()
+        parsers = [
+            BaseParser(parse_root, grammar, registry, engine, regex_fast_path=False)
+            for engine in ParserEngine
+        ] + [BaseParser(parse_root, grammar, registry, debug=True)]
+        terminal = TextTerminal("terminal", corpus[0], parsers[-1], "")
+        for text in corpus:
+            expected = parsers[0].parse(text)
+            assert all(parser.parse(text) == expected for parser in parsers), text
+            assert terminal.validate(text) == expected, text
+            assert terminal.validate(text) == expected, text
+
+    def test_lalr_accepts_no_more_than_earley(self, grammar):
+        # The contextual lexer of LALR splits keywords greedily, so it may reject sentences Earley accepts.
+        generator = SentenceGenerator(grammar, seed=2)
+        corpus = generator.generate_many(
+            "condition", 50
+        ) + generator.generate_near_misses("condition", 50)
+        registry = ParserRegistry()
+        earley_parser, lalr_parser = [
+            BaseParser("condition", grammar, registry, engine, regex_fast_path=False)
+            for engine in [ParserEngine.EARLEY, ParserEngine.LALR]
+        ]
+        for text in corpus:
+            assert not lalr_parser.parse(text) or earley_parser.parse(text), text
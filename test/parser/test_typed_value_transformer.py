@@ -0,0 +1,76 @@
+import datetime
+import sys
+from decimal import Decimal
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.parser.base_parser import BaseParser
+from src.parser.typed_value_transformer import TypedValueTransformer
+from src.parser.typed_values import Amount, NamedObject, Operation
+
+
+class TestTypedValueTransformer:
+    def to_typed_value(self, grammar, parse_root, text):
+        tree = BaseParser(parse_root, grammar).parse_tree(text)
+        assert tree is not None
+        return TypedValueTransformer.to_typed_value(tree)
+
+    def test_date(self, grammar):
+        assert (
+            self.to_typed_value(grammar, "date", "on the 27 January 2002")
+            == datetime.date(2002, 1, 27).toordinal()
+        )
+        assert self.to_typed_value(grammar, "date", "on ANYDATE") == "ANYDATE"
+
+    def test_impossible_date(self, grammar):
+        assert self.to_typed_value(grammar, "date", "on the 31 February 2002") is None
+
+    def test_object(self, grammar):
+        assert self.to_typed_value(grammar, "object", "GBP 100") == Amount(
+            Decimal(100), "GBP"
+        )
+        assert self.to_typed_value(grammar, "object", "bucks 5") == Amount(
+            Decimal(5), "USD"
+        )
+        assert self.to_typed_value(
+            grammar, "object", 'REPORT "receipt"'
+        ) == NamedObject("REPORT", "receipt")
+
+    def test_numerical_expression_precedence(self, grammar):
+        assert self.to_typed_value(
+            grammar, "numerical_expression", "1 PLUS 2 * EUR 3 MINUS 4"
+        ) == Operation(
+            "MINUS",
+            Operation(
+                "PLUS",
+                Decimal(1),
+                Operation("TIMES", Decimal(2), Amount(Decimal(3), "EUR")),
+            ),
+            Decimal(4),
+        )
+
+    def test_long_subject(self, grammar):
+        subject = "Alice and Bob " * 200
+        assert self.to_typed_value(grammar, "subject", subject) == subject
+
+    def test_invalid_text_has_no_tree(self, grammar):
+        assert BaseParser("object", grammar).parse_tree("GBP") is None
+
+    def test_typed_values_are_hashable(self, grammar):
+        expression = self.to_typed_value(
+            grammar, "numerical_expression", "1 PLUS GBP 2"
+        )
+        values = {
+            expression,
+            self.to_typed_value(grammar, "numerical_expression", "1 + GBP 2"),
+            self.to_typed_value(grammar, "object", 'REPORT "receipt"'),
+            NamedObject("REPORT", "receipt"),
+        }
+        assert values == {expression, NamedObject("REPORT", "receipt")}
+
+    def test_unknown_rules_have_no_typed_value(self):
+        tree = BaseParser("amount", 'amount: "GBP" " " /[0-9]+/\n').parse_tree("GBP 10")
+        assert tree is not None
+        assert TypedValueTransformer.to_typed_value(tree) is None
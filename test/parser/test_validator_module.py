@@ -0,0 +1,134 @@
+import json
+import sys
+
+import pytest
+
+sys.path.append("../..")
+
+from test.model.fixtures import grammar
+
+from src.model.aloc_spec import ALOCSpec
+from src.parser.base_parser import BaseParser
+from src.parser.parser_engine import ParserEngine
+from src.parser.parser_registry import ParserRegistry
+from src.parser.validator_module import ValidatorModule
+
+
+class TestValidatorModule:
+    SPEC_PATH = "./src/aloc_spec.json"
+
+    def test_generated_module_is_installed(self, tmp_path):
+        validators_path = str(tmp_path / "validators.py")
+        ValidatorModule.write(self.SPEC_PATH, validators_path, ParserEngine.LALR)
+        spec = ALOCSpec(
+            self.SPEC_PATH, ParserEngine.LALR, validators_path=validators_path
+        )
+        assert spec.has_precompiled_validators()
+
+    def test_installed_validators_are_used(self, tmp_path, grammar):
+        validators_path = str(tmp_path / "validators.py")
+        ValidatorModule.write(self.SPEC_PATH, validators_path, ParserEngine.LALR)
+        with open(self.SPEC_PATH) as spec_file:
+            spec_text = spec_file.read()
+        registry = ParserRegistry()
+        assert ValidatorModule.install(
+            validators_path,
+            ValidatorModule.fingerprint(spec_text, grammar),
+            ParserRegistry.hash_grammar(grammar),
+            {
+                parse_root: ParserEngine.LALR
+                for parse_root in ValidatorModule.get_parse_roots(json.loads(spec_text))
+            },
+            registry,
+        )
+        parser = BaseParser(
+            "numerical_expression", grammar, registry, ParserEngine.LALR
+        )
+        assert parser.parse("1 PLUS 2")
+        assert BaseParser("date", grammar, registry).parse("on ADATE")
+        statistics = registry.get_statistics()
+        assert statistics["misses"] == 0
+        assert statistics["compile_time"] == 0
+
+    def test_mismatched_module_is_not_installed(self, tmp_path):
+        validators_path = str(tmp_path / "validators.py")
+        ValidatorModule.write(self.SPEC_PATH, validators_path, ParserEngine.LALR)
+        with pytest.warns(UserWarning):
+            spec = ALOCSpec(
+                "./test/end_to_end/relative_time_aloc_spec.json",
+                ParserEngine.LALR,
+                validators_path=validators_path,
+            )
+        assert not spec.has_precompiled_validators()
+
+    def test_mismatched_engine_is_not_installed(self, tmp_path):
+        validators_path = str(tmp_path / "validators.py")
+        ValidatorModule.write(self.SPEC_PATH, validators_path, ParserEngine.LALR)
+        with pytest.warns(UserWarning):
+            spec = ALOCSpec(self.SPEC_PATH, validators_path=validators_path)
+        assert not spec.has_precompiled_validators()
+
+    def test_tuned_engines_are_installed(self, tmp_path, grammar):
+        with open(self.SPEC_PATH) as spec_file:
+            spec_text = spec_file.read()
+        tuning_path = str(tmp_path / "tuning.json")
+        with open(tuning_path, "w") as file:
+            json.dump(
+                {
+                    "fingerprint": ValidatorModule.fingerprint(spec_text, grammar),
+                    "parse_roots": {"numerical_expression": {"engine": "lalr_basic"}},
+                },
+                file,
+            )
+        untuned_validators_path = str(tmp_path / "untuned_validators.py")
+        ValidatorModule.write(
+            self.SPEC_PATH, untuned_validators_path, ParserEngine.LALR
+        )
+        with pytest.warns(UserWarning):
+            spec = ALOCSpec(
+                self.SPEC_PATH,
+                ParserEngine.LALR,
+                validators_path=untuned_validators_path,
+                tuning_path=tuning_path,
+            )
+        assert not spec.has_precompiled_validators()
+        validators_path = str(tmp_path / "validators.py")
+        ValidatorModule.write(
+            self.SPEC_PATH, validators_path, ParserEngine.LALR, tuning_path
+        )
+        spec = ALOCSpec(
+            self.SPEC_PATH,
+            ParserEngine.LALR,
+            validators_path=validators_path,
+            tuning_path=tuning_path,
+        )
+        assert spec.has_precompiled_validators()
+        registry = ParserRegistry()
+        ValidatorModule.install(
+            validators_path,
+            ValidatorModule.fingerprint(spec_text, grammar),
+            ParserRegistry.hash_grammar(grammar),
+            {
+                parse_root: spec.get_parser_engine(parse_root)
+                for parse_root in ValidatorModule.get_parse_roots(json.loads(spec_text))
+            },
+            registry,
+        )
+        parser = BaseParser(
+            "numerical_expression", grammar, registry, ParserEngine.LALR_BASIC
+        )
+        assert parser.parse("1 PLUS 2")
+        assert parser.get_engine() == ParserEngine.LALR_BASIC
+        assert registry.get_statistics()["misses"] == 0
+
+    def test_module_without_fingerprint_is_not_installed(self, tmp_path):
+        validators_path = str(tmp_path / "validators.py")
+        with open(validators_path, "w") as file:
+            file.write("VALIDATORS = {}\n")
+        with pytest.warns(UserWarning):
+            spec = ALOCSpec(self.SPEC_PATH, validators_path=validators_path)
+        assert not spec.has_precompiled_validators()
+
+    def test_missing_module(self, tmp_path):
+        spec = ALOCSpec(self.SPEC_PATH, validators_path=str(tmp_path / "missing.py"))
+        assert not spec.has_precompiled_validators()